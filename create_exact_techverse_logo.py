@@ -4,73 +4,76 @@ Exact TECHVERSE Logo Recreation
 Recreates the exact logo from the provided image with all details
 """
 
-from PIL import Image, ImageDraw, ImageFont
-import os
-import math
+from PIL import Image
+import argparse
 
-def create_hexagonal_grid(size, grid_size=20):
+from techverse_icons.adaptive import add_adaptive_arguments, build_launcher_icons
+from techverse_icons.fonts import glyph_advance, glyph_offsets, load_font, text_bbox
+from techverse_icons.glow import create_radial_glow, glow_bounds, radial_glow_array
+from techverse_icons.grid import create_hex_grid
+from techverse_icons.layers import bbox_of, compose, layer, split_layers
+from techverse_icons.pipeline import add_pipeline_arguments, save_icon
+from techverse_icons.shapes import (
+    baseline_ratio, coverage, fill_circles, fill_polygon, gradient_fill, outline_geometry, paste_over,
+    path_ratio, sample_grid, shade, shape_image, shift_coverage, signed_distance, stack_coverage,
+    stroke_ring, text_coverage
+)
+from techverse_icons.stars import DEFAULT_STAR_SEED, create_star_field
+
+GRID_COLOR = (20, 30, 50, 30)
+
+# Layers drawn on the adaptive icon's background; the rest form the foreground
+BACKGROUND_LAYERS = ('grid', 'stars')
+
+# Logo palette; themes override any of these
+DEFAULT_THEME = {
+    'background_color': (10, 15, 25),  # Dark blue-black
+    'grid_color': GRID_COLOR,
+    'ramp': [(0, 162, 255), (138, 43, 226)],  # Blue to purple
+    'fill_color': (0, 162, 255, 200),
+    'glow_colors': [(138, 43, 226), (255, 0, 255)],
+    'badge_color': (150, 150, 150, 200),
+}
+
+def create_hexagonal_grid(size, grid_size=20, layout='square', background=None, color=GRID_COLOR, box=None):
     """Create hexagonal grid background"""
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-    
-    # Draw hexagonal grid
-    for i in range(0, size + grid_size, grid_size):
-        for j in range(0, size + grid_size, grid_size):
-            # Hexagon points
-            center_x = i
-            center_y = j
-            radius = grid_size // 3
-            
-            points = []
-            for angle in range(0, 360, 60):
-                rad = math.radians(angle)
-                x = center_x + radius * math.cos(rad)
-                y = center_y + radius * math.sin(rad)
-                points.append((x, y))
-            
-            if len(points) >= 3:
-                draw.polygon(points, outline=(20, 30, 50, 30), width=1)
-    
-    return img
+    # One hexagon tile is rasterized per grid size and repeated across the canvas
+    return create_hex_grid(size, grid_size, color, layout, background, box)
 
 def create_gradient_circle(size, center, radius, colors):
     """Create a gradient circle"""
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-    
-    for r in range(radius, 0, -1):
-        ratio = r / radius
-        r_val = int(colors[0][0] * (1 - ratio) + colors[1][0] * ratio)
-        g_val = int(colors[0][1] * (1 - ratio) + colors[1][1] * ratio)
-        b_val = int(colors[0][2] * (1 - ratio) + colors[1][2] * ratio)
-        alpha = int(255 * (1 - ratio) * 0.3)
-        
-        draw.ellipse([center[0] - r, center[1] - r, center[0] + r, center[1] + r], 
-                    fill=(r_val, g_val, b_val, alpha))
-    
-    return img
+    # Evaluated from a distance field instead of painting one ellipse per radius
+    return create_radial_glow(size, center, radius, colors)
 
-def create_exact_techverse_icon(size, output_path):
-    """Create the exact TECHVERSE logo from the image"""
-    # Create base image
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
+def render_exact_techverse_icon(size, seed=DEFAULT_STAR_SEED, theme=None):
+    """Render the exact TECHVERSE logo as an RGBA image"""
+    return compose(size, exact_techverse_layers(size, seed, theme))
+
+def render_exact_techverse_background(size, seed=DEFAULT_STAR_SEED, theme=None):
+    """Render only the background layers (hex grid and star field) for adaptive icons"""
+    return compose(size, split_layers(exact_techverse_layers(size, seed, theme), BACKGROUND_LAYERS)[0])
+
+def render_exact_techverse_foreground(size, seed=DEFAULT_STAR_SEED, theme=None):
+    """Render the foreground layers on a transparent canvas for adaptive icons"""
+    return compose(size, split_layers(exact_techverse_layers(size, seed, theme), BACKGROUND_LAYERS)[1])
+
+def exact_techverse_layers(size, seed=DEFAULT_STAR_SEED, theme=None):
+    """Declare the exact TECHVERSE logo as bounding-boxed layers, bottom to top"""
+    full = (0, 0, size, size)
+    theme = {**DEFAULT_THEME, **(theme or {})}
     
     # Dark blue-black background
-    background_color = (10, 15, 25)
-    draw.rectangle([0, 0, size, size], fill=background_color)
+    background_color = tuple(theme['background_color'][:3])
+    grid_color = tuple(theme['grid_color'])
     
-    # Add hexagonal grid background
-    grid_img = create_hexagonal_grid(size, size // 15)
-    img = Image.alpha_composite(img, grid_img)
+    def paint_grid(canvas):
+        # Hexagonal grid stamped straight over the background, no separate grid canvas
+        return create_hexagonal_grid(size, size // 15, background=background_color, color=grid_color,
+                                     box=canvas.box)
     
-    # Add scattered dots (stars/data points)
-    for _ in range(size // 3):
-        x = (hash(str(_)) % size)
-        y = (hash(str(_ * 2)) % size)
-        dot_size = (hash(str(_ * 3)) % 3) + 1
-        dot_color = (100, 150, 255, 150) if hash(str(_)) % 2 == 0 else (255, 255, 255, 100)
-        draw.ellipse([x - dot_size, y - dot_size, x + dot_size, y + dot_size], fill=dot_color)
+    def paint_stars(canvas):
+        # Add scattered dots (stars/data points), reproducible for a given seed
+        return create_star_field(size, size // 3, seed, box=canvas.box)
     
     # Create the geometric T+V symbol
     center_x, center_y = size // 2, size // 2 - size // 8
@@ -94,106 +97,84 @@ def create_exact_techverse_icon(size, output_path):
         (center_x - symbol_size, center_y - symbol_size // 2)
     ]
     
-    # Create gradient for the symbol
-    symbol_img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    symbol_draw = ImageDraw.Draw(symbol_img)
-    
-    # Draw the main symbol with gradient
-    for i, point in enumerate(symbol_points):
-        if i < len(symbol_points) - 1:
-            next_point = symbol_points[i + 1]
-            # Create gradient line
-            steps = 20
-            for step in range(steps):
-                ratio = step / steps
-                x1 = point[0] + (next_point[0] - point[0]) * ratio
-                y1 = point[1] + (next_point[1] - point[1]) * ratio
-                x2 = point[0] + (next_point[0] - point[0]) * (ratio + 1/steps)
-                y2 = point[1] + (next_point[1] - point[1]) * (ratio + 1/steps)
-                
-                # Blue to purple gradient
-                r = int(0 * (1 - ratio) + 138 * ratio)
-                g = int(162 * (1 - ratio) + 43 * ratio)
-                b = int(255 * (1 - ratio) + 226 * ratio)
-                
-                symbol_draw.line([x1, y1, x2, y2], fill=(r, g, b, 255), width=3)
-    
-    # Fill the symbol with gradient
-    symbol_draw.polygon(symbol_points, fill=(0, 162, 255, 200))
-    
-    # Add circuit traces and dots within the symbol
-    for i in range(5):
-        x = center_x - symbol_size // 2 + (i * symbol_size // 4)
-        y = center_y - symbol_size // 4
-        for j in range(3):
-            dot_y = y + (j * symbol_size // 6)
-            symbol_draw.ellipse([x - 1, dot_y - 1, x + 1, dot_y + 1], fill=(255, 255, 255, 255))
-    
-    # Add glow effect to symbol
-    glow_img = create_gradient_circle(size, (center_x, center_y + symbol_size // 4), 
-                                    symbol_size, [(138, 43, 226), (255, 0, 255)])
-    symbol_img = Image.alpha_composite(symbol_img, glow_img)
-    
-    # Apply symbol to main image
-    img = Image.alpha_composite(img, symbol_img)
+    # Dots and ring strokes are one pixel wide at 192px and scale with the icon
+    dot_radius = max(1.0, size / 192)
+    
+    outline_width = 3 * max(1.0, size / 192)
+    symbol_colors = theme['ramp']
+    fill_color = theme['fill_color']
+    
+    def paint_symbol(canvas):
+        distance, segment, t, inside = outline_geometry(canvas.box, symbol_points)
+        
+        # Draw the main symbol with gradient: every edge ramps blue to purple
+        ratio = path_ratio(segment, t, symbol_points, mode='edge')
+        outline = gradient_fill(coverage(distance - outline_width / 2), symbol_colors, ratio)
+        
+        # Fill the symbol, covering the inner half of the outline
+        fill = coverage(signed_distance(distance, inside))
+        pixels = paste_over(outline, shade(fill, fill_color), fill)
+        canvas.composite(shape_image(pixels), canvas.origin)
+        
+        # Add circuit traces and dots within the symbol
+        dots = [(center_x - symbol_size // 2 + (i * symbol_size // 4),
+                 center_y - symbol_size // 4 + (j * symbol_size // 6))
+                for i in range(5) for j in range(3)]
+        canvas.composite(shape_image(fill_circles(canvas.box, dots, dot_radius, (255, 255, 255, 255))),
+                         canvas.origin)
+    
+    # Add glow effect to symbol, evaluated over its bounding box only
+    glow_center = (center_x, center_y + symbol_size // 4)
+    glow_colors = theme['glow_colors']
+    
+    def paint_glow(canvas):
+        glow = radial_glow_array(glow_center, symbol_size, glow_colors, canvas.box)
+        return Image.fromarray(glow, 'RGBA')
     
     # Add "TECHVERSE" text
     text_y = center_y + symbol_size + size // 12
     
-    try:
-        font_size = max(8, size // 12)
-        font = ImageFont.truetype("arial.ttf", font_size)
-    except:
-        font = ImageFont.load_default()
+    # Faces and glyph metrics are cached per process and shared across densities
+    font = load_font(max(8, size // 12))
     
     text = "TECHVERSE"
-    bbox = draw.textbbox((0, 0), text, font=font)
+    bbox = text_bbox(font, text)
     text_width = bbox[2] - bbox[0]
     text_x = (size - text_width) // 2
     
-    # Draw text with gradient effect
-    for i, char in enumerate(text):
-        char_bbox = draw.textbbox((0, 0), char, font=font)
-        char_width = char_bbox[2] - char_bbox[0]
-        char_x = text_x + sum(draw.textbbox((0, 0), text[:j], font=font)[2] - draw.textbbox((0, 0), text[:j], font=font)[0] for j in range(i))
-        
-        # Blue to purple gradient for each character
-        ratio = i / (len(text) - 1) if len(text) > 1 else 0
-        r = int(0 * (1 - ratio) + 138 * ratio)
-        g = int(162 * (1 - ratio) + 43 * ratio)
-        b = int(255 * (1 - ratio) + 226 * ratio)
-        
-        # Add glow to text
-        for offset in range(2, 0, -1):
-            glow_alpha = 100 - (offset * 40)
-            draw.text((char_x + offset, text_y + offset), char, 
-                     font=font, fill=(r, g, b, glow_alpha))
+    # The blue to purple ramp runs from the first character's center to the last's
+    offsets = glyph_offsets(font, text)
+    ramp_start = text_x + offsets[0] + glyph_advance(font, text[0]) / 2
+    ramp_end = text_x + offsets[-1] + glyph_advance(font, text[-1]) / 2
+    
+    def paint_text(canvas):
+        xs, _ = sample_grid(canvas.box)
         
-        # Draw main text
-        draw.text((char_x, text_y), char, font=font, fill=(r, g, b, 255))
+        # Rasterize the word once; the glow copies are the same mask shifted down-right
+        main = text_coverage(canvas.box, text, font, (text_x, text_y))
+        cover = stack_coverage([
+            (shift_coverage(main, 2, 2), 20 / 255),
+            (shift_coverage(main, 1, 1), 60 / 255),
+            (main, 1.0),
+        ])
+        pixels = gradient_fill(cover, symbol_colors, baseline_ratio(xs, ramp_start, ramp_end))
+        return shape_image(pixels)
     
     # Add concentric circular rings
     ring_center = (size // 2, size // 2)
     ring_radius = size // 2 - size // 16
     
-    for ring in range(3):
-        radius = ring_radius - (ring * size // 32)
-        alpha = 100 - (ring * 30)
-        
-        # Blue to purple gradient for rings
-        for angle in range(0, 360, 5):
-            rad = math.radians(angle)
-            x1 = ring_center[0] + radius * math.cos(rad)
-            y1 = ring_center[1] + radius * math.sin(rad)
-            x2 = ring_center[0] + (radius - 1) * math.cos(rad)
-            y2 = ring_center[1] + (radius - 1) * math.sin(rad)
-            
-            ratio = angle / 360
-            r = int(0 * (1 - ratio) + 138 * ratio)
-            g = int(162 * (1 - ratio) + 43 * ratio)
-            b = int(255 * (1 - ratio) + 226 * ratio)
+    ring_width = max(1.0, size / 192)
+    
+    def paint_rings(canvas):
+        for ring in range(3):
+            radius = ring_radius - (ring * size // 32)
+            alpha = 100 - (ring * 30)
             
-            draw.line([x1, y1, x2, y2], fill=(r, g, b, alpha), width=1)
+            # Blue to purple gradient for rings, swept clockwise from 3 o'clock
+            pixels = stroke_ring(canvas.box, ring_center, radius - ring_width / 2, ring_width,
+                                 (0, 0, 0, alpha), colors=symbol_colors)
+            canvas.composite(shape_image(pixels), canvas.origin)
     
     # Add small diamond icon in bottom right
     diamond_size = size // 20
@@ -207,30 +188,43 @@ def create_exact_techverse_icon(size, output_path):
         (diamond_x - diamond_size, diamond_y)
     ]
     
-    draw.polygon(diamond_points, fill=(150, 150, 150, 200))
+    badge_color = theme['badge_color']
+    
+    def paint_badge(canvas):
+        return shape_image(fill_polygon(canvas.box, diamond_points, badge_color))
+    
+    # The text glow copies are offset by up to two pixels down and right
+    text_box = (text_x + bbox[0] - 1, text_y + bbox[1] - 1,
+                text_x + bbox[2] + 4, text_y + bbox[3] + 4)
+    
+    return [
+        layer('grid', full, paint_grid, blend='replace'),
+        layer('stars', full, paint_stars),
+        layer('symbol', bbox_of(symbol_points, pad=int(outline_width / 2) + 2), paint_symbol),
+        layer('glow', glow_bounds(glow_center, symbol_size), paint_glow),
+        layer('text', text_box, paint_text, halo=2),
+        layer('rings', bbox_of([(ring_center[0] - ring_radius, ring_center[1] - ring_radius),
+                                (ring_center[0] + ring_radius, ring_center[1] + ring_radius)], pad=1),
+              paint_rings),
+        layer('badge', bbox_of(diamond_points, pad=1), paint_badge),
+    ]
+
+def create_exact_techverse_icon(size, output_path):
+    """Create the exact TECHVERSE logo from the image"""
+    img = render_exact_techverse_icon(size)
     
     # Save the image
-    img.save(output_path, 'PNG')
-    print(f"Created exact TECHVERSE icon: {output_path} ({size}x{size})")
+    save_icon(img, output_path, 'exact TECHVERSE')
 
-def main():
+def main(argv=None):
     """Create all required Android icon densities with exact logo"""
-    # Android icon densities and their sizes
-    densities = {
-        'mipmap-mdpi': 48,
-        'mipmap-hdpi': 72,
-        'mipmap-xhdpi': 96,
-        'mipmap-xxhdpi': 144,
-        'mipmap-xxxhdpi': 192
-    }
-    
-    base_path = "android/app/src/main/res"
-    
-    for density, size in densities.items():
-        density_path = os.path.join(base_path, density)
-        os.makedirs(density_path, exist_ok=True)
-        output_path = os.path.join(density_path, "ic_launcher.png")
-        create_exact_techverse_icon(size, output_path)
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_pipeline_arguments(parser)
+    add_adaptive_arguments(parser)
+    args = parser.parse_args(argv)
+    
+    build_launcher_icons(render_exact_techverse_icon, render_exact_techverse_background,
+                         render_exact_techverse_foreground, 'exact TECHVERSE', args)
     
     print("All exact TECHVERSE Android app icons created successfully!")
     print("Features recreated:")
@@ -4,205 +4,244 @@ Advanced TechVerse Android App Icon Generator with App Name
 Creates a sophisticated logo with "TechVerse" text and modern color scheme
 """
 
-from PIL import Image, ImageDraw, ImageFont
-import os
+from PIL import Image, ImageDraw
+import argparse
 import math
 
-def create_gradient_background(size, colors):
+from techverse_icons.adaptive import add_adaptive_arguments, build_launcher_icons
+from techverse_icons.fonts import load_font, text_bbox
+from techverse_icons.glow import blur_reach, composite_glow, text_mask
+from techverse_icons.gradients import create_gradient_image
+from techverse_icons.layers import (
+    OffsetDraw, bbox_of, compose, frame_boxes, intersect_boxes, layer, split_layers
+)
+from techverse_icons.pipeline import add_pipeline_arguments, save_icon
+from techverse_icons.shapes import fill_circles, shape_image
+
+# Layers drawn on the adaptive icon's background; the rest form the foreground
+BACKGROUND_LAYERS = ('background', 'pattern')
+
+# Modern color scheme - Purple to Orange gradient; themes override any of these
+DEFAULT_THEME = {
+    'primary_gradient': [(139, 69, 19), (255, 140, 0)],  # Brown to Orange
+    'accent_gradient': [(75, 0, 130), (138, 43, 226)],  # Indigo to Blue Violet
+    'highlight_color': (255, 255, 255),  # White
+    'text_color': (255, 255, 255),  # White text
+    'glow_color': (255, 140, 0, 150),  # Orange glow
+    'trim_color': (255, 140, 0),  # Orange V, circuit traces and border glow
+    'monogram_color': (255, 165, 0),  # Amber T and inner border
+}
+
+def create_gradient_background(size, colors, box=None):
     """Create a diagonal gradient background"""
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-    
-    for i in range(size):
-        for j in range(size):
-            # Diagonal gradient
-            ratio = (i + j) / (size * 2)
-            r = int(colors[0][0] * (1 - ratio) + colors[1][0] * ratio)
-            g = int(colors[0][1] * (1 - ratio) + colors[1][1] * ratio)
-            b = int(colors[0][2] * (1 - ratio) + colors[1][2] * ratio)
-            
-            draw.point((i, j), fill=(r, g, b, 255))
-    
-    return img
+    return create_gradient_image(size, colors, 'diagonal', box)
 
-def create_named_techverse_icon(size, output_path):
-    """Create an advanced TechVerse app icon with app name and modern design"""
-    # Create base image with transparent background
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
+def corners_reaching(box, rect, radius):
+    """Flag which corner arcs of a rounded rectangle reach into a box, as rounded_rectangle's corners"""
+    left, top, right, bottom = rect
+    span = 2 * radius
+    squares = [(left, top, left + span, top + span), (right - span, top, right, top + span),
+               (right - span, bottom - span, right, bottom), (left, bottom - span, left + span, bottom)]
+    return tuple(x0 < box[2] and box[0] <= x1 and y0 < box[3] and box[1] <= y1
+                 for x0, y0, x1, y1 in squares)
+
+def reaches(box, coords):
+    """Whether a rectangle or 1 px line given as flat [x0, y0, x1, y1] touches a box"""
+    return intersect_boxes(box, bbox_of([coords[:2], coords[2:]])) is not None
+
+def render_named_techverse_icon(size, theme=None):
+    """Render the named TechVerse app icon as an RGBA image"""
+    return compose(size, named_techverse_layers(size, theme))
+
+def render_named_techverse_background(size, theme=None):
+    """Render only the background layers (gradient and diamond pattern) for adaptive icons"""
+    return compose(size, split_layers(named_techverse_layers(size, theme), BACKGROUND_LAYERS)[0])
+
+def render_named_techverse_foreground(size, theme=None):
+    """Render the foreground layers on a transparent canvas for adaptive icons"""
+    return compose(size, split_layers(named_techverse_layers(size, theme), BACKGROUND_LAYERS)[1])
+
+def named_techverse_layers(size, theme=None):
+    """Declare the named TechVerse icon as bounding-boxed layers, bottom to top"""
+    full = (0, 0, size, size)
     
-    # Modern color scheme - Purple to Orange gradient
-    primary_gradient = [(139, 69, 19), (255, 140, 0)]  # Brown to Orange
-    accent_gradient = [(75, 0, 130), (138, 43, 226)]  # Indigo to Blue Violet
-    highlight_color = (255, 255, 255)  # White
-    text_color = (255, 255, 255)  # White text
-    glow_color = (255, 140, 0, 150)  # Orange glow
+    # Color scheme, with any theme overrides applied
+    theme = {**DEFAULT_THEME, **(theme or {})}
+    primary_gradient = theme['primary_gradient']
+    accent_gradient = theme['accent_gradient']
+    highlight_color = theme['highlight_color']
+    text_color = theme['text_color']
+    glow_color = theme['glow_color']
+    trim_color = tuple(theme['trim_color'][:3])
+    monogram_color = tuple(theme['monogram_color'][:3])
     
     # Calculate dimensions
     margin = size // 16
     corner_radius = size // 10
     
-    # Create gradient background
-    bg_img = create_gradient_background(size, primary_gradient)
-    img.paste(bg_img, (0, 0))
+    def paint_background(canvas):
+        # Create gradient background
+        return create_gradient_background(size, primary_gradient, box=canvas.box)
     
-    # Add geometric pattern overlay
-    pattern_size = size // 25
-    for i in range(0, size, pattern_size * 3):
-        for j in range(0, size, pattern_size * 3):
-            if (i + j) % (pattern_size * 6) == 0:
-                # Create diamond pattern
-                center_x, center_y = i + pattern_size, j + pattern_size
-                points = [
-                    (center_x, center_y - pattern_size),
-                    (center_x + pattern_size, center_y),
-                    (center_x, center_y + pattern_size),
-                    (center_x - pattern_size, center_y)
-                ]
-                draw.polygon(points, fill=(255, 255, 255, 15))
+    def paint_pattern(canvas):
+        # Add geometric pattern overlay
+        pattern_size = size // 25
+        for i in range(0, size, pattern_size * 3):
+            for j in range(0, size, pattern_size * 3):
+                if (i + j) % (pattern_size * 6) == 0:
+                    # Create diamond pattern
+                    center_x, center_y = i + pattern_size, j + pattern_size
+                    points = [
+                        (center_x, center_y - pattern_size),
+                        (center_x + pattern_size, center_y),
+                        (center_x, center_y + pattern_size),
+                        (center_x - pattern_size, center_y)
+                    ]
+                    canvas.draw.polygon(points, fill=(255, 255, 255, 15))
     
     # Create main container with advanced styling
     container_margin = margin + size // 32
-    draw.rounded_rectangle(
-        [container_margin, container_margin, size - container_margin, size - container_margin],
-        radius=corner_radius,
-        fill=(75, 0, 130, 220)  # Semi-transparent indigo
-    )
-    
-    # Add multiple border layers for depth
     border_widths = [max(3, size // 32), max(2, size // 48), max(1, size // 64)]
-    border_colors = [(255, 140, 0, 200), (255, 165, 0, 150), (255, 255, 255, 100)]
+    border_colors = [trim_color + (200,), monogram_color + (150,), (255, 255, 255, 100)]
     
-    for i, (width, color) in enumerate(zip(border_widths, border_colors)):
+    def paint_container(canvas):
+        draw = canvas.draw
+        rect = [container_margin, container_margin, size - container_margin, size - container_margin]
         draw.rounded_rectangle(
-            [container_margin - i, container_margin - i, 
-             size - container_margin + i, size - container_margin + i],
-            radius=corner_radius + i,
-            outline=color,
-            width=width
+            rect,
+            radius=corner_radius,
+            fill=tuple(accent_gradient[0][:3]) + (220,),  # Semi-transparent indigo
+            corners=corners_reaching(canvas.box, rect, corner_radius)
         )
+        
+        # Add multiple border layers for depth
+        for i, (width, color) in enumerate(zip(border_widths, border_colors)):
+            rect = [container_margin - i, container_margin - i, 
+                    size - container_margin + i, size - container_margin + i]
+            draw.rounded_rectangle(
+                rect,
+                radius=corner_radius + i,
+                outline=color,
+                width=width,
+                corners=corners_reaching(canvas.box, rect, corner_radius + i)
+            )
     
     # Create the "TV" monogram with enhanced styling
     center_x, center_y = size // 2, size // 2 - size // 8
     letter_size = size // 4
     letter_width = max(4, size // 20)
     
-    # Add glow effect for TV letters
+    v_start_x = center_x + letter_size // 6
+    v_start_y = center_y - letter_size // 4
+    v_end_x = center_x + letter_size // 2
+    v_end_y = center_y + letter_size // 2
+    v_bottom_x = v_end_x - letter_size // 4
+    v_bottom_y = v_end_y - letter_width // 2
+    
+    # Glow effect for TV letters: the letterforms go into one mask that is
+    # blurred and tinted, so the cost does not depend on the glow radius
     glow_size = letter_width + 6
-    for offset in range(4, 0, -1):
-        glow_alpha = 80 - (offset * 20)
-        glow_color_with_alpha = (255, 140, 0, glow_alpha)
+    letters_glow_radius = max(2, size // 48)
+    v_glow_strokes = [
+        [(v_start_x, v_start_y), (v_start_x + glow_size - 1, v_start_y),
+         (v_bottom_x, v_bottom_y + glow_size - 1), (v_bottom_x, v_bottom_y)],
+        [(v_bottom_x, v_bottom_y), (v_bottom_x, v_bottom_y + glow_size - 1),
+         (v_end_x + glow_size - 1, v_start_y), (v_end_x, v_start_y)],
+    ]
+    
+    def paint_letters_glow(canvas):
+        letters_mask = Image.new('L', canvas.image.size, 0)
+        mask_draw = OffsetDraw(ImageDraw.Draw(letters_mask), canvas.origin)
         
         # T letter glow
-        draw.rectangle([
-            center_x - letter_size // 2 - offset, center_y - letter_size // 4 - letter_width // 2 - offset,
-            center_x + letter_size // 2 + offset, center_y - letter_size // 4 + letter_width // 2 + offset
-        ], fill=glow_color_with_alpha)
-        
-        draw.rectangle([
-            center_x - letter_width // 2 - offset, center_y - letter_size // 2 - offset,
-            center_x + letter_width // 2 + offset, center_y + letter_size // 2 + offset
-        ], fill=glow_color_with_alpha)
+        mask_draw.rectangle([
+            center_x - letter_size // 2, center_y - letter_size // 4 - letter_width // 2,
+            center_x + letter_size // 2, center_y - letter_size // 4 + letter_width // 2
+        ], fill=255)
+        mask_draw.rectangle([
+            center_x - letter_width // 2, center_y - letter_size // 2,
+            center_x + letter_width // 2, center_y + letter_size // 2
+        ], fill=255)
         
-        # V letter glow
-        v_start_x = center_x + letter_size // 6
-        v_start_y = center_y - letter_size // 4
-        v_end_x = center_x + letter_size // 2
-        v_end_y = center_y + letter_size // 2
+        # V letter glow, each stroke swept glow_size pixels wide. Pillow fills a polygon
+        # cut by the canvas edge slightly differently, so each stroke is drawn whole on
+        # its own mask and pasted, keeping a tile's glow identical to the full icon's
+        for stroke in v_glow_strokes:
+            box = bbox_of(stroke)
+            stroke_mask = Image.new('L', (box[2] - box[0], box[3] - box[1]), 0)
+            ImageDraw.Draw(stroke_mask).polygon([(x - box[0], y - box[1]) for x, y in stroke], fill=255)
+            letters_mask.paste(255, canvas.local(*box[:2]), stroke_mask)
         
-        for i in range(glow_size):
-            draw.line([
-                v_start_x + i - offset, v_start_y - offset,
-                v_end_x - letter_size // 4, v_end_y - letter_width // 2 + i - offset
-            ], fill=glow_color_with_alpha, width=1)
-            
-            draw.line([
-                v_end_x - letter_size // 4, v_end_y - letter_width // 2 + i - offset,
-                v_end_x + i - offset, v_start_y - offset
-            ], fill=glow_color_with_alpha, width=1)
-    
-    # Draw main "T" letter with gradient effect
-    # T horizontal line
-    for i in range(letter_width):
-        alpha = 255 - (i * 15)
-        color = (255, 165, 0, alpha)
-        draw.rectangle([
-            center_x - letter_size // 2, center_y - letter_size // 4 - letter_width // 2 + i,
-            center_x + letter_size // 2, center_y - letter_size // 4 + letter_width // 2 + i
-        ], fill=color)
-    
-    # T vertical line
-    for i in range(letter_width):
-        alpha = 255 - (i * 15)
-        color = (255, 165, 0, alpha)
-        draw.rectangle([
-            center_x - letter_width // 2 + i, center_y - letter_size // 2,
-            center_x + letter_width // 2 + i, center_y + letter_size // 2
-        ], fill=color)
+        composite_glow(canvas.image, letters_mask, glow_color, radius=letters_glow_radius, strength=1.5)
     
-    # Draw main "V" letter with gradient effect
-    v_start_x = center_x + letter_size // 6
-    v_start_y = center_y - letter_size // 4
-    v_end_x = center_x + letter_size // 2
-    v_end_y = center_y + letter_size // 2
-    
-    for i in range(letter_width):
-        alpha = 255 - (i * 15)
-        color = (255, 140, 0, alpha)
+    def paint_letters(canvas):
+        draw = canvas.draw
+        # A tile of a large render skips the strokes it cannot see
+        box = canvas.box
+        
+        # Draw main "T" letter with gradient effect
+        # T horizontal line
+        for i in range(letter_width):
+            alpha = 255 - (i * 15)
+            color = monogram_color + (alpha,)
+            rect = [
+                center_x - letter_size // 2, center_y - letter_size // 4 - letter_width // 2 + i,
+                center_x + letter_size // 2, center_y - letter_size // 4 + letter_width // 2 + i
+            ]
+            if reaches(box, rect):
+                draw.rectangle(rect, fill=color)
         
-        # Left diagonal of V
-        draw.line([
-            v_start_x + i, v_start_y,
-            v_end_x - letter_size // 4, v_end_y - letter_width // 2 + i
-        ], fill=color, width=1)
+        # T vertical line
+        for i in range(letter_width):
+            alpha = 255 - (i * 15)
+            color = monogram_color + (alpha,)
+            rect = [
+                center_x - letter_width // 2 + i, center_y - letter_size // 2,
+                center_x + letter_width // 2 + i, center_y + letter_size // 2
+            ]
+            if reaches(box, rect):
+                draw.rectangle(rect, fill=color)
         
-        # Right diagonal of V
-        draw.line([
-            v_end_x - letter_size // 4, v_end_y - letter_width // 2 + i,
-            v_end_x + i, v_start_y
-        ], fill=color, width=1)
+        # Draw main "V" letter with gradient effect
+        for i in range(letter_width):
+            alpha = 255 - (i * 15)
+            color = trim_color + (alpha,)
+            
+            # Left diagonal of V
+            line = [
+                v_start_x + i, v_start_y,
+                v_bottom_x, v_bottom_y + i
+            ]
+            if reaches(box, line):
+                draw.line(line, fill=color, width=1)
+            
+            # Right diagonal of V
+            line = [
+                v_bottom_x, v_bottom_y + i,
+                v_end_x + i, v_start_y
+            ]
+            if reaches(box, line):
+                draw.line(line, fill=color, width=1)
     
     # Add "TechVerse" text below the TV logo
     text_y = center_y + letter_size + size // 16
     
-    # Try to use a system font, fallback to default
-    try:
-        font_size = max(8, size // 12)
-        font = ImageFont.truetype("arial.ttf", font_size)
-    except:
-        try:
-            font = ImageFont.load_default()
-        except:
-            font = None
+    # Faces and text metrics are cached per process and shared across densities
+    font = load_font(max(8, size // 12))
+    bbox = text_bbox(font, "TechVerse")
+    text_width = bbox[2] - bbox[0]
+    text_x = (size - text_width) // 2
+    text_glow_radius = max(1.5, size // 64)
     
-    # Add text glow effect
-    for offset in range(3, 0, -1):
-        glow_alpha = 100 - (offset * 30)
-        text_glow_color = (255, 140, 0, glow_alpha)
+    def paint_text(canvas):
+        # Add text glow effect from one blurred rasterization of the text, cropped to
+        # the canvas so a tile of a large render blurs only its own share
+        mask, (x, y) = text_mask("TechVerse", font, canvas.local(text_x, text_y))
+        mask = mask.crop((-x, -y, canvas.image.width - x, canvas.image.height - y))
+        composite_glow(canvas.image, mask, glow_color, radius=text_glow_radius, strength=2.0)
         
-        if font:
-            # Get text bounding box
-            bbox = draw.textbbox((0, 0), "TechVerse", font=font)
-            text_width = bbox[2] - bbox[0]
-            text_x = (size - text_width) // 2
-            
-            # Draw glow
-            for dx in range(-offset, offset + 1):
-                for dy in range(-offset, offset + 1):
-                    if dx != 0 or dy != 0:
-                        draw.text((text_x + dx, text_y + dy), "TechVerse", 
-                                font=font, fill=text_glow_color)
-    
-    # Draw main text
-    if font:
-        bbox = draw.textbbox((0, 0), "TechVerse", font=font)
-        text_width = bbox[2] - bbox[0]
-        text_x = (size - text_width) // 2
-        draw.text((text_x, text_y), "TechVerse", font=font, fill=text_color)
-    else:
-        # Fallback: draw text manually
-        text_x = size // 4
-        draw.text((text_x, text_y), "TechVerse", fill=text_color)
+        # Draw main text
+        canvas.draw.text((text_x, text_y), "TechVerse", font=font, fill=text_color)
     
     # Add advanced tech elements - circuit patterns
     circuit_dot_size = max(2, size // 40)
@@ -217,80 +256,104 @@ def create_named_techverse_icon(size, output_path):
         (center_x + letter_size // 4, center_y + letter_size // 4)
     ]
     
-    for dot_x, dot_y in circuit_dots:
-        if 0 <= dot_x < size and 0 <= dot_y < size:
-            # Outer glow
-            draw.ellipse([
-                dot_x - circuit_dot_size - 3, dot_y - circuit_dot_size - 3,
-                dot_x + circuit_dot_size + 3, dot_y + circuit_dot_size + 3
-            ], fill=(255, 140, 0, 100))
-            
-            # Main dot
-            draw.ellipse([
-                dot_x - circuit_dot_size, dot_y - circuit_dot_size,
-                dot_x + circuit_dot_size, dot_y + circuit_dot_size
-            ], fill=highlight_color)
-    
-    # Add connecting lines between circuit dots
-    if len(circuit_dots) >= 4:
-        line_color = (255, 140, 0, 150)
-        # Horizontal connections
-        draw.line([circuit_dots[0][0], circuit_dots[0][1], circuit_dots[1][0], circuit_dots[1][1]], 
-                 fill=line_color, width=1)
-        draw.line([circuit_dots[2][0], circuit_dots[2][1], circuit_dots[3][0], circuit_dots[3][1]], 
-                 fill=line_color, width=1)
-        # Diagonal connections
-        draw.line([circuit_dots[4][0], circuit_dots[4][1], circuit_dots[5][0], circuit_dots[5][1]], 
-                 fill=line_color, width=1)
-        draw.line([circuit_dots[6][0], circuit_dots[6][1], circuit_dots[7][0], circuit_dots[7][1]], 
-                 fill=line_color, width=1)
+    def paint_circuit(canvas):
+        draw = canvas.draw
+        dots = [(dot_x, dot_y) for dot_x, dot_y in circuit_dots if 0 <= dot_x < size and 0 <= dot_y < size]
+        
+        # Outer glow, then the main dot over it
+        canvas.composite(shape_image(fill_circles(canvas.box, dots, circuit_dot_size + 3, trim_color + (100,))),
+                         canvas.origin)
+        canvas.composite(shape_image(fill_circles(canvas.box, dots, circuit_dot_size, highlight_color)),
+                         canvas.origin)
+        
+        # Add connecting lines between circuit dots
+        if len(circuit_dots) >= 4:
+            line_color = trim_color + (150,)
+            # Horizontal connections
+            draw.line([circuit_dots[0][0], circuit_dots[0][1], circuit_dots[1][0], circuit_dots[1][1]], 
+                     fill=line_color, width=1)
+            draw.line([circuit_dots[2][0], circuit_dots[2][1], circuit_dots[3][0], circuit_dots[3][1]], 
+                     fill=line_color, width=1)
+            # Diagonal connections
+            draw.line([circuit_dots[4][0], circuit_dots[4][1], circuit_dots[5][0], circuit_dots[5][1]], 
+                     fill=line_color, width=1)
+            draw.line([circuit_dots[6][0], circuit_dots[6][1], circuit_dots[7][0], circuit_dots[7][1]], 
+                     fill=line_color, width=1)
     
     # Add subtle highlight overlay
-    highlight_img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    highlight_draw = ImageDraw.Draw(highlight_img)
-    
-    # Top highlight
-    highlight_draw.ellipse([
-        size // 6, size // 12, size * 5 // 6, size // 3
-    ], fill=(255, 255, 255, 25))
+    highlight_box = [size // 6, size // 12, size * 5 // 6, size // 3]
     
-    # Apply highlight
-    img = Image.alpha_composite(img, highlight_img)
+    def paint_highlight(canvas):
+        # Top highlight
+        canvas.draw.ellipse(highlight_box, fill=(255, 255, 255, 25))
     
     # Add final border glow
     final_glow_width = max(2, size // 48)
-    for i in range(final_glow_width):
-        alpha = 120 - (i * 40)
-        glow_color = (255, 140, 0, alpha)
-        draw.rounded_rectangle(
-            [margin - i, margin - i, size - margin + i, size - margin + i],
-            radius=corner_radius + i,
-            outline=glow_color,
-            width=1
-        )
+    
+    def paint_borders(canvas):
+        for i in range(final_glow_width):
+            alpha = 120 - (i * 40)
+            rect = [margin - i, margin - i, size - margin + i, size - margin + i]
+            # Pillow traces every corner arc in full however little of it the canvas
+            # shows, so a tile of a large render skips the arcs it cannot see
+            canvas.draw.rounded_rectangle(
+                rect,
+                radius=corner_radius + i,
+                outline=trim_color + (alpha,),
+                width=1,
+                corners=corners_reaching(canvas.box, rect, corner_radius + i)
+            )
+    
+    letters_box = bbox_of([
+        (center_x - letter_size // 2, center_y - letter_size // 2),
+        (max(center_x + letter_size // 2, v_end_x + glow_size), center_y + letter_size // 2),
+        (v_bottom_x, v_bottom_y + glow_size),
+    ], pad=letter_width)
+    glow_pad = blur_reach(letters_glow_radius)
+    text_pad = blur_reach(text_glow_radius)
+    dot_reach = circuit_dot_size + 3
+    
+    # The rounded frames are declared piece by piece, so a tile of a large render
+    # reuses each traced corner instead of tracing it again
+    container_box = bbox_of([(container_margin, container_margin),
+                             (size - container_margin, size - container_margin)], pad=len(border_widths))
+    container_corner = 2 * (corner_radius + len(border_widths))
+    borders_box = bbox_of([(margin, margin), (size - margin, size - margin)], pad=final_glow_width)
+    borders_corner = 2 * (corner_radius + final_glow_width)
+    
+    return [
+        layer('background', full, paint_background, blend='replace'),
+        layer('pattern', full, paint_pattern),
+        *[layer('container', box, paint_container) for box in frame_boxes(container_box, container_corner)],
+        layer('glow', (letters_box[0] - glow_pad, letters_box[1] - glow_pad,
+                       letters_box[2] + glow_pad, letters_box[3] + glow_pad), paint_letters_glow,
+              halo=glow_pad),
+        layer('symbol', letters_box, paint_letters),
+        layer('text', (text_x + bbox[0] - text_pad, text_y + bbox[1] - text_pad,
+                       text_x + bbox[2] + text_pad, text_y + bbox[3] + text_pad), paint_text,
+              halo=text_pad),
+        layer('circuit', bbox_of(circuit_dots, pad=dot_reach), paint_circuit),
+        layer('highlight', bbox_of([highlight_box[:2], highlight_box[2:]]), paint_highlight),
+        *[layer('borders', box, paint_borders)
+          for box in frame_boxes(borders_box, borders_corner, final_glow_width + 1)],
+    ]
+
+def create_named_techverse_icon(size, output_path):
+    """Create an advanced TechVerse app icon with app name and modern design"""
+    img = render_named_techverse_icon(size)
     
     # Save the image
-    img.save(output_path, 'PNG')
-    print(f"Created named TechVerse icon: {output_path} ({size}x{size})")
+    save_icon(img, output_path, 'named TechVerse')
 
-def main():
+def main(argv=None):
     """Create all required Android icon densities with app name"""
-    # Android icon densities and their sizes
-    densities = {
-        'mipmap-mdpi': 48,
-        'mipmap-hdpi': 72,
-        'mipmap-xhdpi': 96,
-        'mipmap-xxhdpi': 144,
-        'mipmap-xxxhdpi': 192
-    }
-    
-    base_path = "android/app/src/main/res"
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_pipeline_arguments(parser)
+    add_adaptive_arguments(parser)
+    args = parser.parse_args(argv)
     
-    for density, size in densities.items():
-        density_path = os.path.join(base_path, density)
-        os.makedirs(density_path, exist_ok=True)
-        output_path = os.path.join(density_path, "ic_launcher.png")
-        create_named_techverse_icon(size, output_path)
+    build_launcher_icons(render_named_techverse_icon, render_named_techverse_background,
+                         render_named_techverse_foreground, 'named TechVerse', args)
     
     print("All named TechVerse Android app icons created successfully!")
     print("New features included:")
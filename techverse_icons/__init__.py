@@ -0,0 +1,13 @@
+"""
+TechVerse Icon Tooling
+Shared rendering helpers used by the TechVerse launcher icon generators
+"""
+
+# The render API pulls in Pillow and numpy, so it is imported on first use
+_API = ('render_icon', 'render_icon_bytes', 'render_set')
+
+def __getattr__(name):
+    if name in _API:
+        from techverse_icons import api
+        return getattr(api, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
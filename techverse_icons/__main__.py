@@ -0,0 +1,11 @@
+"""
+TechVerse Icon Tools
+Run as `python -m techverse_icons COMMAND`
+"""
+
+import sys
+
+from techverse_icons.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
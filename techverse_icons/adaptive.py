@@ -0,0 +1,158 @@
+"""
+Android Adaptive Icons
+Renders the background layers once and reuses them for the legacy, round and
+adaptive foreground/background/monochrome launcher icons
+"""
+
+from PIL import Image, ImageChops, ImageDraw
+import os
+
+from techverse_icons.cache import cache_from_args, render_key, write_if_changed
+from techverse_icons.encode import DEFAULT_TOLERANCE, encode_images, encode_png, format_saving
+from techverse_icons.fonts import configure_font_search_path
+from techverse_icons.pipeline import build_android_icons, downsample
+from techverse_icons.profiling import stage, tracing
+from techverse_icons.registry import (
+    ADAPTIVE_DIR, ADAPTIVE_XML_FILES, ANDROID_DENSITIES, ANDROID_RES_PATH, VISIBLE_SCALE,
+    adaptive_outputs, adaptive_size, master_size_for
+)
+
+ADAPTIVE_ICON_XML = """<?xml version="1.0" encoding="utf-8"?>
+<adaptive-icon xmlns:android="http://schemas.android.com/apk/res/android">
+    <background android:drawable="@mipmap/ic_launcher_background"/>
+    <foreground android:drawable="@mipmap/ic_launcher_foreground"/>
+    <monochrome android:drawable="@mipmap/ic_launcher_monochrome"/>
+</adaptive-icon>
+"""
+
+def round_icon(img):
+    """Clip an icon to a circle (anti-aliased once the master is resampled)"""
+    mask = Image.new('L', img.size, 0)
+    ImageDraw.Draw(mask).ellipse([0, 0, img.width - 1, img.height - 1], fill=255)
+    clipped = img.copy()
+    clipped.putalpha(ImageChops.multiply(img.getchannel('A'), mask))
+    return clipped
+
+def monochrome_icon(foreground):
+    """Turn a foreground into the white silhouette launchers tint for themed icons"""
+    silhouette = Image.new('RGBA', foreground.size, (255, 255, 255, 0))
+    silhouette.putalpha(foreground.getchannel('A'))
+    return silhouette
+
+def render_adaptive_masters(render_background, render_foreground, master_size, resample=downsample):
+    """Render each layer set once and derive every master icon from them
+    
+    Returns {filename: master image}; the legacy masters are master_size
+    square and the adaptive ones adaptive_size(master_size). resample(img,
+    size) shrinks the layer sets to the legacy size.
+    """
+    canvas_size = adaptive_size(master_size)
+    visible_size = round(master_size * VISIBLE_SCALE)
+    
+    # The background is the costliest part, so it is drawn exactly once, full-bleed
+    with stage(f"background {canvas_size}px"):
+        background = render_background(canvas_size)
+    with stage(f"foreground {visible_size}px"):
+        foreground = render_foreground(visible_size)
+    
+    with stage('derive'):
+        legacy = resample(background, master_size)
+        legacy.alpha_composite(resample(foreground, master_size))
+    
+        adaptive_foreground = Image.new('RGBA', (canvas_size, canvas_size), (0, 0, 0, 0))
+        offset = (canvas_size - visible_size) // 2
+        adaptive_foreground.alpha_composite(foreground, (offset, offset))
+    
+    return {
+        'ic_launcher.png': legacy,
+        'ic_launcher_round.png': round_icon(legacy),
+        'ic_launcher_foreground.png': adaptive_foreground,
+        'ic_launcher_background.png': background,
+        'ic_launcher_monochrome.png': monochrome_icon(adaptive_foreground),
+    }
+
+def render_adaptive_encoded(render_background, render_foreground, densities=ANDROID_DENSITIES,
+                            master_size=None, cache=None, optimize=True,
+                            tolerance=DEFAULT_TOLERANCE, report=None, workers=None):
+    """Render the adaptive icon set to {relative path: bytes}, reusing cached files
+    
+    report, if given, collects the EncodeResult of every PNG encoded this run;
+    workers caps the encoding threads.
+    """
+    master_size = master_size_for(densities.values(), master_size)
+    encoding = {'optimize': optimize, 'tolerance': tolerance if optimize else None}
+    outputs = adaptive_outputs(densities)
+    
+    # Both render functions live in the generator's module, so one identity covers them
+    keys = {path: render_key(render_foreground, output=path, size=size, master_size=master_size,
+                             encoding=encoding)
+            for path, size in outputs.items()}
+    
+    encoded = {}
+    if cache is not None:
+        for path, key in keys.items():
+            data = cache.get(key)
+            if data is not None:
+                encoded[path] = data
+    
+    missing = [path for path in outputs if path not in encoded]
+    if missing:
+        masters = render_adaptive_masters(render_background, render_foreground, master_size)
+        with stage('resample'):
+            images = {path: downsample(masters[os.path.basename(path)], outputs[path])
+                      for path in missing}
+        with stage('encode'):
+            if optimize:
+                results = encode_images(images, tolerance, workers)
+                if report is not None:
+                    report.update(results)
+                fresh = {path: result.data for path, result in results.items()}
+            else:
+                fresh = {path: encode_png(img) for path, img in images.items()}
+        for path, data in fresh.items():
+            encoded[path] = data
+            if cache is not None:
+                cache.put(keys[path], data)
+    
+    encoded = {path: encoded[path] for path in outputs}
+    xml = ADAPTIVE_ICON_XML.encode()
+    for name in ADAPTIVE_XML_FILES:
+        encoded[os.path.join(ADAPTIVE_DIR, name)] = xml
+    return encoded
+
+def write_outputs(encoded, label, base_path=ANDROID_RES_PATH, report=None):
+    """Write {relative path: bytes} under base_path, skipping unchanged files"""
+    report = report or {}
+    for relative, data in encoded.items():
+        output_path = os.path.join(base_path, relative)
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        if relative in report:
+            detail = format_saving(report[relative].baseline_bytes, len(data))
+        else:
+            detail = f"{len(data)} bytes"
+    
+        status = "Created" if write_if_changed(output_path, data) else "Unchanged"
+        print(f"{status} {label} icon: {output_path} ({detail})")
+
+def add_adaptive_arguments(parser):
+    """Add the adaptive icon options to a generator's argument parser"""
+    parser.add_argument('--flat', action='store_true',
+                        help="write only the flat legacy ic_launcher.png (honours --per-density/--native)")
+
+def build_launcher_icons(render, render_background, render_foreground, label, args,
+                         densities=ANDROID_DENSITIES, base_path=None):
+    """Write the adaptive icon set, or only the flat legacy icons with --flat
+    
+    base_path defaults to the --output directory.
+    """
+    if args.flat:
+        build_android_icons(render, label, args, densities, base_path)
+        return
+    
+    configure_font_search_path(args.font_dir)
+    report = {}
+    with tracing(args.trace):
+        encoded = render_adaptive_encoded(render_background, render_foreground, densities,
+                                          args.master_size, cache_from_args(args),
+                                          args.optimize, args.tolerance, report)
+    write_outputs(encoded, label, base_path or args.output, report)
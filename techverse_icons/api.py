@@ -0,0 +1,100 @@
+"""
+In-Memory Render API
+Renders icons to Pillow images or encoded PNG bytes without touching the
+filesystem, so build tooling and tests can call the generators in-process
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from techverse_icons.adaptive import render_adaptive_encoded
+from techverse_icons.batch import DEFAULT_SIZE, coerce_theme, default_theme
+from techverse_icons.cache import atomic_write
+from techverse_icons.encode import DEFAULT_TOLERANCE, encode_png, encode_smallest
+from techverse_icons.fonts import configure_font_search_path
+from techverse_icons.pipeline import add_encoding_arguments, downsample, render_encoded
+from techverse_icons.registry import (
+    ANDROID_DENSITIES, GENERATORS, VARIANTS, load_adaptive_renderers, load_renderer,
+    master_size_for
+)
+
+def render_icon(generator, size, theme=None, master_size=None):
+    """Render a generator's icon as a size x size RGBA image
+    
+    The icon is drawn once at master_size (default: supersampled) and
+    resampled down; theme overrides any of the generator's DEFAULT_THEME keys.
+    """
+    render = load_renderer(generator)
+    master = render(master_size_for([size], master_size), theme=theme)
+    return downsample(master, size)
+
+def render_icon_bytes(generator, size, theme=None, master_size=None, optimize=True,
+                      tolerance=DEFAULT_TOLERANCE):
+    """Render a generator's icon and return it as PNG bytes"""
+    img = render_icon(generator, size, theme, master_size)
+    if not optimize:
+        return encode_png(img)
+    return encode_smallest(img, tolerance).data
+
+def render_set(generator, variant='adaptive', densities=ANDROID_DENSITIES, master_size=None,
+               native=(), cache=None, optimize=True, tolerance=DEFAULT_TOLERANCE, report=None,
+               workers=None):
+    """Render one variant's Android icon set to {path relative to res/: bytes}
+    
+    Densities named in native are rendered at their own size (launcher
+    variant only); report, if given, collects the EncodeResult of every PNG
+    encoded this call; workers caps the encoding threads.
+    """
+    if variant == 'adaptive':
+        render_background, render_foreground = load_adaptive_renderers(generator)
+        return render_adaptive_encoded(render_background, render_foreground, densities,
+                                       master_size, cache, optimize, tolerance, report, workers)
+    
+    encoded = render_encoded(load_renderer(generator), densities, master_size, native, cache,
+                             optimize, tolerance, report, workers)
+    return {os.path.join(density, VARIANTS[variant]): data for density, data in encoded.items()}
+
+def load_theme(generator, path):
+    """Read a JSON object of theme overrides and check it against the generator's defaults"""
+    with open(path) as f:
+        return coerce_theme(json.load(f), default_theme(generator))
+
+def main(argv=None):
+    """Render one icon in memory and write it to a file or stdout"""
+    parser = argparse.ArgumentParser(description="Render one TechVerse icon without building a resource tree")
+    parser.add_argument('generator', choices=sorted(GENERATORS),
+                        help="generator to render")
+    parser.add_argument('--size', type=int, default=DEFAULT_SIZE,
+                        help=f"icon size in pixels (default: {DEFAULT_SIZE})")
+    parser.add_argument('--theme', metavar='FILE',
+                        help="JSON object overriding any of the generator's DEFAULT_THEME keys")
+    parser.add_argument('--master-size', type=int, default=None,
+                        help="master render size (default: 4x the icon size)")
+    parser.add_argument('--output', metavar='FILE',
+                        help="PNG file to write, or - for stdout (default: GENERATOR-SIZE.png)")
+    parser.add_argument('--font-dir', action='append', default=[], metavar='DIR',
+                        help="search this directory for fonts first (repeatable)")
+    add_encoding_arguments(parser)
+    args = parser.parse_args(argv)
+    
+    configure_font_search_path(args.font_dir)
+    try:
+        theme = load_theme(args.generator, args.theme) if args.theme else None
+    except ValueError as exc:
+        parser.error(str(exc))
+    data = render_icon_bytes(args.generator, args.size, theme, args.master_size,
+                             args.optimize, args.tolerance)
+    
+    if args.output == '-':
+        sys.stdout.buffer.write(data)
+        return 0
+    output = args.output or f"{args.generator}-{args.size}.png"
+    atomic_write(output, data)
+    print(f"Rendered {GENERATORS[args.generator][2]} icon: {output} ({args.size}x{args.size}, "
+          f"{len(data)} bytes)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,266 @@
+"""
+Batch Theme Variants
+Renders a parameter grid or a CSV/JSON list of color themes in parallel and
+streams the results into a zip/tar archive or paged contact sheets
+"""
+
+from PIL import Image, ImageDraw
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import csv
+import importlib
+import io
+import itertools
+import json
+import math
+import os
+import sys
+import tarfile
+import zipfile
+
+from techverse_icons.encode import encode_png
+from techverse_icons.fonts import configure_font_search_path, load_font
+from techverse_icons.pipeline import downsample, master_size_for
+from techverse_icons.registry import GENERATORS, load_renderer
+from techverse_icons.shapes import cached_geometry
+
+DEFAULT_SIZE = 192
+DEFAULT_THUMB = 128
+DEFAULT_PER_PAGE = 100
+
+# Geometry reused by every variant a worker renders (kept for the worker's lifetime)
+_worker_geometry = {}
+
+def default_theme(generator):
+    """Return a generator's DEFAULT_THEME, the keys a variant may override"""
+    return importlib.import_module(GENERATORS[generator][0]).DEFAULT_THEME
+
+def parse_color(text):
+    """Parse '#rrggbb', '#rrggbbaa' or 'r,g,b[,a]' into a tuple"""
+    text = text.strip()
+    if text.startswith('#'):
+        digits = text[1:]
+        if len(digits) not in (6, 8):
+            raise ValueError(f"Bad hex color: {text!r}")
+        return tuple(int(digits[i:i + 2], 16) for i in range(0, len(digits), 2))
+    return tuple(int(part) for part in text.split(','))
+
+def coerce_value(key, value, default):
+    """Convert a theme value from CSV/CLI text or JSON lists to the default's shape"""
+    gradient = isinstance(default, list)
+    if isinstance(value, str):
+        # Gradients are written as two colors joined by ':'
+        parts = value.split(':') if gradient else [value]
+        value = [parse_color(part) for part in parts] if gradient else parse_color(parts[0])
+    elif gradient:
+        value = [tuple(color) for color in value]
+    else:
+        value = tuple(value)
+    
+    if gradient and len(value) != len(default):
+        raise ValueError(f"Theme key {key!r} expects {len(default)} colors")
+    return value
+
+def check_keys(keys, defaults):
+    """Reject theme keys the generator does not define"""
+    unknown = sorted(set(keys) - set(defaults))
+    if unknown:
+        raise ValueError(f"Unknown theme keys {unknown}; expected some of {sorted(defaults)}")
+
+def coerce_theme(theme, defaults):
+    """Validate a theme's keys against the generator defaults and normalize its values"""
+    check_keys(theme, defaults)
+    return {key: coerce_value(key, value, defaults[key]) for key, value in theme.items()}
+
+def load_themes(path):
+    """Read named themes from a JSON list of objects or a CSV with one column per key"""
+    with open(path, newline='') as f:
+        if path.lower().endswith('.json'):
+            rows = json.load(f)
+        else:
+            # Empty cells keep the default for that key
+            rows = [{key: value for key, value in row.items() if value} for row in csv.DictReader(f)]
+    return [(row.pop('name', None), row) for row in rows]
+
+def iter_variants(defaults, themes=None, grid=None):
+    """Yield (name, theme) for every base theme crossed with every grid combination
+    
+    Every theme and grid value is validated before the first variant is yielded;
+    names become archive members, so two themes may not share one.
+    """
+    themes = [(name, coerce_theme(base, defaults)) for name, base in themes or [(None, {})]]
+    named = [name for name, _ in themes if name]
+    duplicates = sorted({name for name in named if named.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Duplicate theme names {duplicates}")
+    keys = sorted(grid or {})
+    check_keys(keys, defaults)
+    values = [[coerce_value(key, value, defaults[key]) for value in grid[key]] for key in keys]
+    
+    def variants():
+        index = 0
+        for base_name, base in themes:
+            for combination in itertools.product(*values):
+                index += 1
+                name = base_name if base_name and not keys else f"{base_name or 'variant'}-{index:04d}"
+                yield name, {**base, **dict(zip(keys, combination))}
+    return variants()
+
+def render_variant(generator, size, theme, master_size=None, thumb=None):
+    """Render one variant in a worker: PNG bytes, or raw RGBA thumbnail bytes"""
+    render = load_renderer(generator)
+    with cached_geometry(_worker_geometry):
+        master = render(master_size_for([size], master_size), theme=theme)
+    if thumb:
+        return downsample(master, thumb).tobytes()
+    return encode_png(downsample(master, size))
+
+def render_variants(generator, variants, size=DEFAULT_SIZE, workers=None, master_size=None, thumb=None):
+    """Render variants in parallel, yielding (name, theme, payload) in input order
+    
+    At most two tasks per worker are in flight, so memory stays flat however
+    many variants the iterator produces.
+    """
+    workers = workers or os.cpu_count()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for name, theme in variants:
+            pending.append((name, theme, pool.submit(render_variant, generator, size, theme,
+                                                     master_size, thumb)))
+            if len(pending) >= 2 * workers:
+                name, theme, future = pending.popleft()
+                yield name, theme, future.result()
+        while pending:
+            name, theme, future = pending.popleft()
+            yield name, theme, future.result()
+
+def jsonable(theme):
+    """Turn a theme's tuples into lists for the manifest"""
+    return {key: [list(color) for color in value] if isinstance(value, list) else list(value)
+            for key, value in theme.items()}
+
+def add_to_manifest(manifest, name, theme):
+    """Record a variant's theme, refusing a name that would overwrite an earlier member"""
+    if name in manifest:
+        raise ValueError(f"Duplicate variant name {name!r}")
+    manifest[name] = jsonable(theme)
+
+def write_archive(path, results):
+    """Stream (name, theme, png) results into a .zip or .tar[.gz] with a themes.json manifest
+    
+    Returns the number of images written.
+    """
+    manifest = {}
+    if path.endswith('.zip'):
+        # PNG data is already deflated, so store it as-is
+        with zipfile.ZipFile(path, 'w', zipfile.ZIP_STORED) as archive:
+            for name, theme, data in results:
+                add_to_manifest(manifest, name, theme)
+                archive.writestr(f"{name}.png", data)
+            archive.writestr('themes.json', json.dumps(manifest, indent=2))
+    else:
+        mode = 'w:gz' if path.endswith(('.tar.gz', '.tgz')) else 'w'
+        with tarfile.open(path, mode) as archive:
+            def add(member, data):
+                info = tarfile.TarInfo(member)
+                info.size = len(data)
+                archive.addfile(info, io.BytesIO(data))
+            for name, theme, data in results:
+                add_to_manifest(manifest, name, theme)
+                add(f"{name}.png", data)
+            add('themes.json', json.dumps(manifest, indent=2).encode())
+    return len(manifest)
+
+def page_path(path, page, pages):
+    """Number contact sheet pages only when there is more than one"""
+    if pages == 1:
+        return path
+    root, ext = os.path.splitext(path)
+    return f"{root}-{page:03d}{ext}"
+
+def write_contact_sheets(path, results, count, thumb=DEFAULT_THUMB, per_page=DEFAULT_PER_PAGE):
+    """Tile labelled thumbnails into pages of at most per_page, holding one page in memory"""
+    columns = math.ceil(math.sqrt(min(per_page, count)))
+    label_height = max(12, thumb // 8)
+    cell = (thumb + 8, thumb + label_height + 8)
+    font = load_font(label_height - 2)
+    pages = math.ceil(count / per_page)
+    
+    sheet = None
+    written = 0
+    for index, (name, _, data) in enumerate(results):
+        slot = index % per_page
+        if slot == 0:
+            rows = math.ceil(min(per_page, count - index) / columns)
+            sheet = Image.new('RGB', (columns * cell[0], rows * cell[1]), (32, 32, 32))
+            draw = ImageDraw.Draw(sheet)
+        x, y = (slot % columns) * cell[0] + 4, (slot // columns) * cell[1] + 4
+        tile = Image.frombytes('RGBA', (thumb, thumb), data)
+        sheet.paste(tile, (x, y), tile)
+        draw.text((x, y + thumb + 1), name, font=font, fill=(220, 220, 220))
+    
+        if slot == per_page - 1 or index == count - 1:
+            sheet.save(page_path(path, index // per_page + 1, pages))
+            sheet = None
+        written += 1
+    return written
+
+def run_batch(generator, output, themes=None, grid=None, size=DEFAULT_SIZE, workers=None,
+              master_size=None, thumb=DEFAULT_THUMB, per_page=DEFAULT_PER_PAGE):
+    """Render every variant and stream it into output; returns the number of variants"""
+    defaults = default_theme(generator)
+    if output.endswith(('.zip', '.tar', '.tar.gz', '.tgz')):
+        variants = iter_variants(defaults, themes, grid)
+        return write_archive(output, render_variants(generator, variants, size, workers, master_size))
+    
+    # Sheets need the page layout up front; themes are tiny, the images are what stream
+    count = len(themes or [None]) * math.prod(len(values) for values in (grid or {}).values())
+    variants = iter_variants(defaults, themes, grid)
+    results = render_variants(generator, variants, size, workers, master_size, thumb)
+    return write_contact_sheets(output, results, count, thumb, per_page)
+
+def main(argv=None):
+    """Render theme variants into an archive or contact sheet"""
+    parser = argparse.ArgumentParser(description="Render TechVerse icon theme variants in bulk")
+    parser.add_argument('--generator', choices=sorted(GENERATORS), default='named',
+                        help="generator to theme (default: named)")
+    parser.add_argument('--themes', metavar='FILE',
+                        help="CSV or JSON list of themes; a 'name' column/key labels each one")
+    parser.add_argument('--vary', nargs='+', action='append', default=[], metavar=('KEY', 'VALUE'),
+                        help="theme key and the values to sweep, e.g. glow_color '#ff8c0096' "
+                             "'#00ffff96'; gradients are 'color:color' (repeatable, values multiply)")
+    parser.add_argument('--output', required=True,
+                        help="a .zip/.tar/.tar.gz archive, or a .png/.jpg contact sheet")
+    parser.add_argument('--size', type=int, default=DEFAULT_SIZE,
+                        help="icon size stored in archives (default: 192)")
+    parser.add_argument('--master-size', type=int, default=None,
+                        help="master render size (default: 4x the icon size)")
+    parser.add_argument('--thumb', type=int, default=DEFAULT_THUMB,
+                        help="contact sheet thumbnail size (default: 128)")
+    parser.add_argument('--per-page', type=int, default=DEFAULT_PER_PAGE,
+                        help="thumbnails per contact sheet page (default: 100)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                        help="number of worker processes (default: CPU count)")
+    parser.add_argument('--font-dir', action='append', default=[], metavar='DIR',
+                        help="search this directory for fonts first (repeatable)")
+    args = parser.parse_args(argv)
+    
+    grid = {}
+    for key, *values in args.vary:
+        if not values:
+            parser.error(f"--vary {key} needs at least one value")
+        grid[key] = values
+    
+    configure_font_search_path(args.font_dir)
+    themes = load_themes(args.themes) if args.themes else None
+    try:
+        count = run_batch(args.generator, args.output, themes, grid, args.size, args.workers,
+                          args.master_size, args.thumb, args.per_page)
+    except ValueError as exc:
+        parser.error(str(exc))
+    print(f"Rendered {count} {GENERATORS[args.generator][2]} variant(s) into {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+"""
+Icon Generator Benchmarks
+Times each generator and each drawing stage across icon sizes, records peak
+memory, writes JSON and fails when a stage regresses against a stored baseline
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import json
+import multiprocessing
+import platform
+import resource
+import sys
+import time
+
+import numpy as np
+import PIL
+
+from techverse_icons.profiling import StageRecorder, recording
+from techverse_icons.registry import GENERATORS, load_renderer
+
+DEFAULT_SIZES = (48, 192, 512, 1024, 2048)
+DEFAULT_THRESHOLD = 0.25
+
+# Differences below this many seconds are timer noise, never regressions
+NOISE_FLOOR = 0.002
+
+def max_rss_bytes():
+    """Return this process's peak resident set size in bytes"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+def bench_case(generator, size, repeat):
+    """Benchmark one generator at one size; runs in a fresh process"""
+    render = load_renderer(generator)
+    baseline_rss = max_rss_bytes()
+    
+    # The first render is cold: fonts, tiles and stencils are not cached yet
+    start = time.perf_counter()
+    render(size)
+    cold = time.perf_counter() - start
+    peak_memory = max(max_rss_bytes() - baseline_rss, 0)
+    
+    totals, stages = [], {}
+    for _ in range(repeat):
+        with recording(StageRecorder()) as recorder:
+            start = time.perf_counter()
+            render(size)
+            totals.append(time.perf_counter() - start)
+        for name, seconds in recorder.totals().items():
+            stages.setdefault(name, []).append(seconds)
+    
+    return {
+        'generator': generator,
+        'size': size,
+        'seconds': min(totals),
+        'cold_seconds': cold,
+        'stages': {name: min(samples) for name, samples in stages.items()},
+        'peak_memory_bytes': peak_memory,
+    }
+
+def run_benchmarks(generators, sizes, repeat=3):
+    """Run every (generator, size) case, each in its own process"""
+    # A fresh process per case keeps peak memory readings independent
+    context = multiprocessing.get_context('spawn')
+    results = []
+    for generator in generators:
+        for size in sizes:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                results.append(pool.submit(bench_case, generator, size, repeat).result())
+    return results
+
+def environment():
+    """Describe the machine and libraries the numbers were taken on"""
+    return {
+        'python': platform.python_version(),
+        'pillow': PIL.__version__,
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+    }
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """List stages and totals that got slower than the baseline allows"""
+    previous = {(entry['generator'], entry['size']): entry for entry in baseline['results']}
+    regressions = []
+    for entry in results:
+        old = previous.get((entry['generator'], entry['size']))
+        if old is None:
+            continue
+        pairs = [('total', entry['seconds'], old['seconds'])]
+        pairs += [(name, seconds, old['stages'][name])
+                  for name, seconds in entry['stages'].items() if name in old['stages']]
+        for name, now, before in pairs:
+            if now > before * (1 + threshold) and now - before > NOISE_FLOOR:
+                regressions.append({
+                    'generator': entry['generator'],
+                    'size': entry['size'],
+                    'stage': name,
+                    'baseline_seconds': before,
+                    'seconds': now,
+                    'ratio': now / before if before else float('inf'),
+                })
+    return regressions
+
+def format_results(results):
+    """Format results as a readable table"""
+    lines = []
+    for entry in results:
+        stages = ', '.join(f"{name} {seconds * 1000:.1f}" for name, seconds in entry['stages'].items())
+        lines.append(f"{entry['generator']:<6} {entry['size']:>5}px  "
+                     f"{entry['seconds'] * 1000:9.1f} ms (cold {entry['cold_seconds'] * 1000:.1f})  "
+                     f"peak {entry['peak_memory_bytes'] / 2**20:7.1f} MiB  [{stages}]")
+    return "\n".join(lines)
+
+def main(argv=None):
+    """Run the icon generator benchmarks"""
+    parser = argparse.ArgumentParser(description="Benchmark the TechVerse icon generators")
+    parser.add_argument('--generator', action='append', choices=sorted(GENERATORS),
+                        help="generator to benchmark (repeatable, default: all)")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES),
+                        help="icon sizes in pixels")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="timed renders per case; the fastest is reported")
+    parser.add_argument('--output', help="write results as JSON to this file")
+    parser.add_argument('--baseline', help="compare against results saved earlier with --output")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown per stage as a fraction (default: 0.25)")
+    args = parser.parse_args(argv)
+    
+    results = run_benchmarks(args.generator or sorted(GENERATORS), args.sizes, args.repeat)
+    report = {'environment': environment(), 'results': results}
+    print(format_results(results))
+    
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        for item in regressions:
+            print(f"REGRESSION {item['generator']} {item['size']}px {item['stage']}: "
+                  f"{item['baseline_seconds'] * 1000:.1f} -> {item['seconds'] * 1000:.1f} ms "
+                  f"({item['ratio']:.2f}x)")
+        if regressions:
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
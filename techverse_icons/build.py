@@ -0,0 +1,131 @@
+"""
+Parallel Icon Build
+Spreads (generator, density, variant) render jobs across a process pool
+"""
+
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import nullcontext
+import argparse
+import os
+import time
+
+from techverse_icons.api import render_set
+from techverse_icons.cache import add_cache_arguments, cache_from_args, write_if_changed
+from techverse_icons.encode import DEFAULT_TOLERANCE
+from techverse_icons.fonts import configure_font_search_path
+from techverse_icons.pipeline import add_encoding_arguments
+from techverse_icons.profiling import TraceRecorder, recording, stage, write_trace
+from techverse_icons.registry import (
+    ANDROID_DENSITIES, ANDROID_RES_PATH, add_plan_arguments, format_plan, load_adaptive_renderers,
+    load_renderer, output_root, plan_from_args
+)
+
+BuildResult = namedtuple('BuildResult', 'job outputs written seconds trace saved')
+
+def run_job(job, root, densities=ANDROID_DENSITIES, cache=None, trace=False, optimize=True,
+            tolerance=DEFAULT_TOLERANCE, encode_workers=None):
+    """Render one job, write its files and return the paths with the elapsed time"""
+    # Import outside the timed region so timings measure rendering, not worker start-up
+    if job.variant == 'adaptive':
+        load_adaptive_renderers(job.generator)
+    else:
+        load_renderer(job.generator)
+    start = time.perf_counter()
+    
+    recorder = TraceRecorder() if trace else None
+    report = {}
+    with recording(recorder) if trace else nullcontext():
+        with stage(f"{job.generator} {job.density or 'master'} {job.variant}"):
+            if job.density is None:
+                encoded = render_set(job.generator, job.variant, densities, job.master_size,
+                                     cache=cache, optimize=optimize, tolerance=tolerance, report=report,
+                                     workers=encode_workers)
+            else:
+                encoded = render_set(job.generator, job.variant, {job.density: densities[job.density]},
+                                     native=(job.density,), cache=cache, optimize=optimize,
+                                     tolerance=tolerance, report=report, workers=encode_workers)
+    
+    outputs = []
+    written = 0
+    for relative, data in encoded.items():
+        output_path = os.path.join(root, relative)
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        written += write_if_changed(output_path, data)
+        outputs.append(output_path)
+    
+    events = recorder.trace_events() if trace else None
+    saved = sum(result.baseline_bytes - len(result.data) for result in report.values())
+    return BuildResult(job, outputs, written, time.perf_counter() - start, events, saved)
+
+def run_build(jobs, base_path=ANDROID_RES_PATH, workers=None, densities=ANDROID_DENSITIES,
+              cache=None, trace=False, optimize=True, tolerance=DEFAULT_TOLERANCE):
+    """Run build jobs, in a process pool when more than one worker is allowed"""
+    generators = sorted({job.generator for job in jobs})
+    roots = {generator: output_root(base_path, generator, generators) for generator in generators}
+    
+    if workers == 1 or len(jobs) <= 1:
+        return [run_job(job, roots[job.generator], densities, cache, trace, optimize, tolerance)
+                for job in jobs]
+    
+    # The pool already keeps every core busy, so each job encodes on its own thread
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_job, job, roots[job.generator], densities, cache, trace,
+                               optimize, tolerance, 1)
+                   for job in jobs]
+        for future in as_completed(futures):
+            results.append(future.result())
+    
+    # Report in plan order regardless of completion order
+    order = {job: index for index, job in enumerate(jobs)}
+    return sorted(results, key=lambda result: order[result.job])
+
+def format_report(results, wall_time):
+    """Format per-job timings and the overall build summary"""
+    lines = []
+    for result in results:
+        job = result.job
+        density = job.density or f"master@{job.master_size}"
+        lines.append(f"{job.generator:<8} {density:<18} {job.variant:<10} "
+                     f"{result.seconds * 1000:9.1f} ms  {result.written}/{len(result.outputs)} file(s) written"
+                     f", {result.saved} bytes saved")
+    
+    busy = sum(result.seconds for result in results)
+    slowest = max((result.seconds for result in results), default=0.0)
+    saved = sum(result.saved for result in results)
+    lines.append(f"{len(results)} job(s): wall {wall_time:.2f}s, "
+                 f"cpu {busy:.2f}s, slowest job {slowest:.2f}s, {saved} bytes saved by encoding")
+    return "\n".join(lines)
+
+def main(argv=None):
+    """Build launcher icons for several generators and variants in parallel"""
+    parser = argparse.ArgumentParser(description="Build TechVerse launcher icons in parallel")
+    add_plan_arguments(parser)
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                        help="number of worker processes (default: CPU count)")
+    parser.add_argument('--font-dir', action='append', default=[], metavar='DIR',
+                        help="search this directory for fonts first (repeatable)")
+    parser.add_argument('--trace', metavar='FILE',
+                        help="write a Chrome trace of every job's stages, draw calls and allocations")
+    add_encoding_arguments(parser)
+    add_cache_arguments(parser)
+    args = parser.parse_args(argv)
+    jobs = plan_from_args(parser, args)
+    if args.dry_run:
+        print(format_plan(jobs, args.output))
+        return
+    
+    configure_font_search_path(args.font_dir)
+    
+    start = time.perf_counter()
+    results = run_build(jobs, args.output, args.workers, cache=cache_from_args(args),
+                        trace=args.trace is not None, optimize=args.optimize, tolerance=args.tolerance)
+    print(format_report(results, time.perf_counter() - start))
+    
+    if args.trace:
+        # Worker processes show up as separate rows, keyed by their pid
+        write_trace(args.trace, [event for result in results for event in result.trace])
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""
+Content-Addressed Render Cache
+Keys encoded icons on generator identity, render parameters and code version so
+unchanged outputs are restored from disk instead of being rendered again
+"""
+
+from contextlib import contextmanager
+from functools import lru_cache
+import glob
+import hashlib
+import inspect
+import json
+import os
+import stat
+import tempfile
+
+import numpy as np
+import PIL
+from PIL import features
+
+from techverse_icons.fonts import font_fingerprint
+
+DEFAULT_CACHE_DIR = os.environ.get('TECHVERSE_ICON_CACHE', '.icon_cache')
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+@lru_cache(maxsize=None)
+def _file_digest(path, mtime_ns, size):
+    """Hash one source file (memoized on its mtime and size)"""
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def file_digest(path):
+    """Hash a file's contents, reusing the digest while the file is unchanged"""
+    stat = os.stat(path)
+    return _file_digest(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+def code_version(render):
+    """Fingerprint the code and libraries that determine a renderer's output"""
+    sources = [inspect.getsourcefile(render)]
+    sources += sorted(glob.glob(os.path.join(PACKAGE_DIR, '*.py')))
+    
+    digest = hashlib.sha256()
+    for path in sources:
+        digest.update(file_digest(path).encode())
+    # Anti-aliasing and text rasterization change between library releases
+    digest.update(f"pillow={PIL.__version__};numpy={np.__version__};"
+                  f"freetype={features.version('freetype2')}".encode())
+    return digest.hexdigest()
+
+def renderer_identity(render):
+    """Name a renderer the same way whether it was imported or run as a script"""
+    return f"{os.path.basename(inspect.getsourcefile(render))}:{render.__qualname__}"
+
+def render_key(render, **params):
+    """Build the cache key for one rendered output"""
+    payload = {
+        'renderer': renderer_identity(render),
+        'code': code_version(render),
+        'font': font_fingerprint(),
+        'params': params,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+def output_mode(path):
+    """Permissions for a file replacing path: its current mode, or what open() would give a new file"""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except OSError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+@contextmanager
+def atomic_output(path):
+    """Yield a temporary file that replaces path once the block completes
+    
+    mkstemp creates owner-only files, so the temporary file takes path's
+    permissions before it is moved into place.
+    """
+    directory = os.path.dirname(path) or '.'
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            yield f
+        os.chmod(tmp_path, output_mode(path))
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def atomic_write(path, data):
+    """Write bytes to path via a temporary file so readers never see a partial file"""
+    with atomic_output(path) as f:
+        f.write(data)
+
+def write_if_changed(path, data):
+    """Write data to path unless it already holds exactly these bytes
+    
+    Returns True when the file was written. Identical files are left alone so
+    their mtime does not change and Gradle's resource caching stays valid.
+    """
+    try:
+        if os.path.getsize(path) == len(data):
+            with open(path, 'rb') as f:
+                if f.read() == data:
+                    return False
+    except OSError:
+        pass
+    
+    atomic_write(path, data)
+    return True
+
+class RenderCache:
+    """On-disk store of encoded icons with size-bounded LRU eviction"""
+    
+    def __init__(self, root=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+    
+    def path_for(self, key):
+        """Return the file an entry lives in"""
+        return os.path.join(self.root, key[:2], key + '.png')
+    
+    def get(self, key):
+        """Return cached bytes for key, or None on a miss"""
+        path = self.path_for(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            # mtime doubles as the LRU timestamp
+            os.utime(path)
+        except OSError:
+            return None
+        return data
+    
+    def put(self, key, data):
+        """Store bytes under key and evict old entries beyond the size budget"""
+        path = self.path_for(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        atomic_write(path, data)
+        self.evict()
+    
+    def entries(self):
+        """List (mtime, size, path) for every entry, oldest first"""
+        entries = []
+        for path in glob.glob(os.path.join(self.root, '*', '*.png')):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                # Another build process evicted it meanwhile
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        return sorted(entries)
+    
+    def evict(self):
+        """Remove least recently used entries until the cache fits its budget"""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+
+def add_cache_arguments(parser):
+    """Add the render cache options to an argument parser"""
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR,
+                        help=f"render cache directory (default: {DEFAULT_CACHE_DIR})")
+    parser.add_argument('--cache-size', type=int, default=DEFAULT_MAX_BYTES // (1024 * 1024),
+                        metavar='MB', help="evict least recently used entries beyond this size")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="always render, without reading or filling the cache")
+
+def cache_from_args(args):
+    """Create the RenderCache selected on the command line, or None"""
+    if args.no_cache:
+        return None
+    return RenderCache(args.cache_dir, args.cache_size * 1024 * 1024)
@@ -0,0 +1,74 @@
+"""
+TechVerse Icon Command Line
+One entry point for every icon tool; each command's module is imported only
+when that command runs, so `list` and `build --dry-run` never load Pillow
+"""
+
+import argparse
+import importlib
+import sys
+
+from techverse_icons.registry import (
+    ANDROID_DENSITIES, GENERATORS, VARIANTS, add_plan_arguments, format_plan, plan_from_args
+)
+
+# Command name -> (module, main function, summary)
+COMMANDS = {
+    'list': ('techverse_icons.cli', 'list_main', "list generators, variants and densities"),
+    'render': ('techverse_icons.api', 'main', "render one icon to a PNG file or stdout"),
+    'build': ('techverse_icons.cli', 'build_main', "build Android launcher icons (--dry-run to plan only)"),
+    'tiled': ('techverse_icons.tiled', 'main', "render a print-scale icon tile by tile, streaming it to PNG"),
+    'watch': ('techverse_icons.watch', 'main', "re-render icons whenever a theme file or generator changes"),
+    'export': ('techverse_icons.export', 'main', "export every platform's icon set"),
+    'batch': ('techverse_icons.batch', 'main', "render theme variants into an archive or contact sheet"),
+    'golden': ('techverse_icons.golden', 'main', "check icons against the golden references (--update to refresh)"),
+    'bench': ('techverse_icons.bench', 'main', "benchmark the generators"),
+    'optimize': ('techverse_icons.encode', 'main', "re-encode existing PNGs to their smallest faithful form"),
+}
+
+def list_main(argv=None):
+    """Print the generators, variants and Android densities"""
+    parser = argparse.ArgumentParser(description="List what the icon tools can render")
+    parser.parse_args(argv)
+    
+    print("generators:")
+    for name, (module, function, label) in sorted(GENERATORS.items()):
+        print(f"  {name:<8} {label:<18} {module}.{function}")
+    print("variants:")
+    for name, filename in sorted(VARIANTS.items()):
+        print(f"  {name:<8} {filename or 'adaptive icon set'}")
+    print("densities:")
+    for name, size in ANDROID_DENSITIES.items():
+        print(f"  {name:<16} {size}px")
+    return 0
+
+def build_main(argv=None):
+    """Plan a build from the registry alone, or hand it to the parallel builder"""
+    argv = sys.argv[1:] if argv is None else argv
+    if '--dry-run' not in argv:
+        return importlib.import_module('techverse_icons.build').main(argv)
+    
+    # Rendering options do not change the plan, so they are accepted and ignored
+    parser = argparse.ArgumentParser(description="Plan a TechVerse launcher icon build")
+    add_plan_arguments(parser)
+    args, _ = parser.parse_known_args(argv)
+    print(format_plan(plan_from_args(parser, args), args.output))
+    return 0
+
+def main(argv=None):
+    """Dispatch to a command's main(), importing its module on demand"""
+    epilog = "commands:\n" + "\n".join(f"  {name:<10} {summary}"
+                                       for name, (_, _, summary) in COMMANDS.items())
+    parser = argparse.ArgumentParser(prog='python -m techverse_icons',
+                                     description="TechVerse icon tools",
+                                     epilog=epilog, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('command', choices=COMMANDS, metavar='COMMAND',
+                        help="command to run; COMMAND -h shows its options")
+    parser.add_argument('args', nargs=argparse.REMAINDER, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    
+    # Commands build their own parsers, which name themselves after argv[0]
+    sys.argv[0] = f"{parser.prog} {args.command}"
+    module_name, function_name, _ = COMMANDS[args.command]
+    result = getattr(importlib.import_module(module_name), function_name)(args.args)
+    return result or 0
@@ -0,0 +1,150 @@
+"""
+Size-Optimized PNG Encoding
+Picks the smallest faithful PNG per icon by trying RGB, palette and zlib variants
+"""
+
+from PIL import Image
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import argparse
+import io
+import os
+import sys
+import zlib
+
+import numpy as np
+
+from techverse_icons.cache import atomic_write
+
+# zlib strategies Pillow passes through as compress_type; the PNG row filters
+# themselves are chosen adaptively by Pillow's encoder
+ZLIB_STRATEGIES = {
+    'default': zlib.Z_DEFAULT_STRATEGY,
+    'filtered': zlib.Z_FILTERED,
+    'huffman': zlib.Z_HUFFMAN_ONLY,
+    'rle': zlib.Z_RLE,
+    'fixed': zlib.Z_FIXED,
+}
+
+# Largest RMS error (0-255 scale) a lossy palette may introduce; 0 keeps encoding lossless
+DEFAULT_TOLERANCE = 0.0
+
+EncodeResult = namedtuple('EncodeResult', 'data representation strategy baseline_bytes')
+
+def encode_png(img, **options):
+    """Encode an image exactly as img.save(path, 'PNG', **options) would"""
+    buffer = io.BytesIO()
+    img.save(buffer, 'PNG', **options)
+    return buffer.getvalue()
+
+def exact_palette(img):
+    """Convert an RGB/RGBA image to 'P' without loss, or None if it has over 256 colors"""
+    # Pillow's color count bails out early, long before a full sort would finish
+    if img.getcolors(256) is None:
+        return None
+    
+    pixels = np.ascontiguousarray(np.asarray(img.convert('RGBA')))
+    packed = pixels.view(np.uint32).reshape(pixels.shape[:2])
+    colors, index = np.unique(packed, return_inverse=True)
+    
+    paletted = Image.fromarray(index.reshape(packed.shape).astype(np.uint8), 'P')
+    palette = colors.view(np.uint8).reshape(-1, 4)
+    paletted.putpalette(palette[:, :len(img.mode)].tobytes(), img.mode)
+    return paletted
+
+def quantized_palette(img, tolerance):
+    """Quantize to 256 colors if the RMS error stays within tolerance, else None"""
+    method = Image.Quantize.FASTOCTREE if img.mode == 'RGBA' else Image.Quantize.MEDIANCUT
+    paletted = img.quantize(256, method=method)
+    restored = np.asarray(paletted.convert(img.mode), dtype=np.float32)
+    rms = float(np.sqrt(np.mean((restored - np.asarray(img, dtype=np.float32)) ** 2)))
+    return paletted if rms <= tolerance else None
+
+def candidate_images(img, tolerance=DEFAULT_TOLERANCE):
+    """Yield (representation, image) pairs that decode back to img (within tolerance)"""
+    img = img.convert('RGBA') if img.mode not in ('RGB', 'RGBA') else img
+    if img.mode == 'RGBA' and img.getextrema()[3][0] == 255:
+        # Fully opaque: the alpha channel carries nothing, and RGB always encodes smaller
+        img = img.convert('RGB')
+    yield img.mode, img
+    
+    paletted = exact_palette(img)
+    if paletted is not None:
+        yield 'P', paletted
+    elif tolerance > 0:
+        paletted = quantized_palette(img, tolerance)
+        if paletted is not None:
+            yield 'P~', paletted
+
+def encode_smallest(img, tolerance=DEFAULT_TOLERANCE):
+    """Return the smallest PNG encoding of img across representations and zlib settings"""
+    baseline = len(encode_png(img))
+    best = None
+    for representation, candidate in candidate_images(img, tolerance):
+        for strategy, compress_type in ZLIB_STRATEGIES.items():
+            data = encode_png(candidate, compress_level=9, compress_type=compress_type)
+            if best is None or len(data) < len(best.data):
+                best = EncodeResult(data, representation, strategy, baseline)
+    return best
+
+def encode_images(images, tolerance=DEFAULT_TOLERANCE, workers=None):
+    """Encode a {name: image} mapping to {name: EncodeResult}, several at a time
+    
+    zlib and numpy release the GIL, so threads overlap the per-file searches.
+    """
+    if len(images) <= 1 or workers == 1:
+        return {name: encode_smallest(img, tolerance) for name, img in images.items()}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {name: pool.submit(encode_smallest, img, tolerance) for name, img in images.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+def format_saving(before, after):
+    """Describe the bytes saved by re-encoding one file"""
+    saved = before - after
+    percent = 100 * saved / before if before else 0
+    return f"{before} -> {after} bytes, saved {saved} ({percent:.0f}%)"
+
+def optimize_file(path, tolerance=DEFAULT_TOLERANCE):
+    """Re-encode one PNG in place when a smaller faithful encoding exists
+    
+    Returns (path, bytes before, bytes after, EncodeResult).
+    """
+    with Image.open(path) as img:
+        img.load()
+        result = encode_smallest(img, tolerance)
+    
+    # Compare against the file on disk, which may already be better than Pillow's default
+    before = os.path.getsize(path)
+    if len(result.data) >= before:
+        return path, before, before, result
+    atomic_write(path, result.data)
+    return path, before, len(result.data), result
+
+def optimize_files(paths, tolerance=DEFAULT_TOLERANCE, workers=None):
+    """Optimize PNG files across a process pool, returning results in input order"""
+    if workers == 1 or len(paths) <= 1:
+        return [optimize_file(path, tolerance) for path in paths]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(optimize_file, paths, [tolerance] * len(paths)))
+
+def main(argv=None):
+    """Shrink existing PNG icons in place"""
+    parser = argparse.ArgumentParser(description="Re-encode PNG icons to their smallest faithful form")
+    parser.add_argument('paths', nargs='+', help="PNG files to optimize")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed RMS error for lossy palettes (default: 0, lossless)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                        help="number of worker processes")
+    args = parser.parse_args(argv)
+    
+    total_before = total_after = 0
+    for path, before, after, result in optimize_files(args.paths, args.tolerance, args.workers):
+        kept = "unchanged" if after == before else f"{result.representation}, {result.strategy}"
+        print(f"{path}: {format_saving(before, after)} [{kept}]")
+        total_before += before
+        total_after += after
+    print(f"{len(args.paths)} file(s): {format_saving(total_before, total_after)}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,257 @@
+"""
+Multi-Platform Icon Export
+Renders one master per generator and fans it out to the Android, iOS, macOS,
+web and Windows icon sets, including Contents.json and .ico containers (and an
+opt-in .icns for projects that reference one)
+"""
+
+from PIL import Image
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+import argparse
+import io
+import json
+import os
+import time
+
+from techverse_icons.cache import write_if_changed
+from techverse_icons.encode import DEFAULT_TOLERANCE, encode_png, encode_smallest, format_saving
+from techverse_icons.fonts import configure_font_search_path
+from techverse_icons.pipeline import (
+    ANDROID_DENSITIES, ANDROID_RES_PATH, add_encoding_arguments, downsample
+)
+from techverse_icons.profiling import stage, tracing
+from techverse_icons.registry import GENERATORS, load_renderer
+
+PLATFORMS = ('android', 'ios', 'macos', 'web', 'windows')
+
+IOS_APPICONSET = "ios/Runner/Assets.xcassets/AppIcon.appiconset"
+MACOS_APPICONSET = "macos/Runner/Assets.xcassets/AppIcon.appiconset"
+
+# (points, idiom, scale) in the order Xcode lists them in Contents.json
+IOS_ICONS = [
+    ('20', 'iphone', 2), ('20', 'iphone', 3),
+    ('29', 'iphone', 1), ('29', 'iphone', 2), ('29', 'iphone', 3),
+    ('40', 'iphone', 2), ('40', 'iphone', 3),
+    ('60', 'iphone', 2), ('60', 'iphone', 3),
+    ('20', 'ipad', 1), ('20', 'ipad', 2),
+    ('29', 'ipad', 1), ('29', 'ipad', 2),
+    ('40', 'ipad', 1), ('40', 'ipad', 2),
+    ('76', 'ipad', 1), ('76', 'ipad', 2),
+    ('83.5', 'ipad', 2),
+    ('1024', 'ios-marketing', 1),
+]
+
+MACOS_ICONS = [('16', 1), ('16', 2), ('32', 1), ('32', 2), ('128', 1), ('128', 2),
+               ('256', 1), ('256', 2), ('512', 1), ('512', 2)]
+
+WINDOWS_ICO_SIZES = (16, 32, 48, 256)
+ICNS_SIZES = (16, 32, 64, 128, 256, 512, 1024)
+
+# Maskable web icons keep their content inside the central 80% safe zone
+MASKABLE_SAFE_ZONE = 0.8
+
+# kind is 'png', 'opaque' (alpha flattened), 'maskable', 'ico' or 'icns';
+# size is a tuple of sizes for the multi-resolution containers
+ExportTarget = namedtuple('ExportTarget', 'platform path kind size')
+
+def ios_filename(points, scale):
+    """Name an iOS app icon file the way Flutter's template does"""
+    return f"Icon-App-{points}x{points}@{scale}x.png"
+
+def ios_contents():
+    """Build the iOS AppIcon.appiconset Contents.json document"""
+    images = [{'size': f"{points}x{points}", 'idiom': idiom,
+               'filename': ios_filename(points, scale), 'scale': f"{scale}x"}
+              for points, idiom, scale in IOS_ICONS]
+    return {'images': images, 'info': {'version': 1, 'author': 'xcode'}}
+
+def macos_contents():
+    """Build the macOS AppIcon.appiconset Contents.json document"""
+    images = [{'size': f"{points}x{points}", 'idiom': 'mac',
+               'filename': f"app_icon_{int(points) * scale}.png", 'scale': f"{scale}x"}
+              for points, scale in MACOS_ICONS]
+    return {'images': images, 'info': {'version': 1, 'author': 'xcode'}}
+
+def contents_json(document):
+    """Serialize a Contents.json document in Xcode's own formatting"""
+    return (json.dumps(document, indent=2, separators=(',', ' : ')) + "\n").encode()
+
+def platform_targets(platform, icns=False):
+    """List the icon files one platform needs
+    
+    Flutter's macOS runner uses the AppIcon.appiconset; icns also lists
+    macos/Runner/AppIcon.icns for projects whose Xcode target references one.
+    """
+    if platform == 'android':
+        return [ExportTarget(platform, os.path.join(ANDROID_RES_PATH, density, "ic_launcher.png"), 'png', size)
+                for density, size in ANDROID_DENSITIES.items()]
+    if platform == 'ios':
+        # The App Store rejects icons with an alpha channel
+        targets = {}
+        for points, _, scale in IOS_ICONS:
+            path = os.path.join(IOS_APPICONSET, ios_filename(points, scale))
+            targets[path] = ExportTarget(platform, path, 'opaque', round(float(points) * scale))
+        return list(targets.values())
+    if platform == 'macos':
+        sizes = sorted({int(points) * scale for points, scale in MACOS_ICONS})
+        targets = [ExportTarget(platform, os.path.join(MACOS_APPICONSET, f"app_icon_{size}.png"), 'png', size)
+                   for size in sizes]
+        if icns:
+            targets.append(ExportTarget(platform, "macos/Runner/AppIcon.icns", 'icns', ICNS_SIZES))
+        return targets
+    if platform == 'web':
+        return [
+            ExportTarget(platform, "web/favicon.png", 'png', 16),
+            ExportTarget(platform, "web/icons/Icon-192.png", 'png', 192),
+            ExportTarget(platform, "web/icons/Icon-512.png", 'png', 512),
+            ExportTarget(platform, "web/icons/Icon-maskable-192.png", 'maskable', 192),
+            ExportTarget(platform, "web/icons/Icon-maskable-512.png", 'maskable', 512),
+        ]
+    if platform == 'windows':
+        return [ExportTarget(platform, "windows/runner/resources/app_icon.ico", 'ico', WINDOWS_ICO_SIZES)]
+    raise ValueError(f"Unknown platform: {platform}")
+
+# Contents.json files regenerated alongside each platform's images
+PLATFORM_MANIFESTS = {
+    'ios': (os.path.join(IOS_APPICONSET, "Contents.json"), ios_contents),
+    'macos': (os.path.join(MACOS_APPICONSET, "Contents.json"), macos_contents),
+}
+
+def target_sizes(targets):
+    """Every distinct pixel size the targets need"""
+    sizes = set()
+    for target in targets:
+        sizes.update(target.size if isinstance(target.size, tuple) else (target.size,))
+    return sorted(sizes)
+
+def flatten(img, color=(0, 0, 0)):
+    """Composite an RGBA image over a solid color and drop the alpha channel"""
+    if img.mode == 'RGB':
+        return img
+    background = Image.new('RGBA', img.size, color + (255,))
+    background.alpha_composite(img.convert('RGBA'))
+    return background.convert('RGB')
+
+def edge_color(img):
+    """Average the corner pixels, used to bleed the background into maskable padding"""
+    w, h = img.size
+    corners = [img.getpixel(point) for point in ((0, 0), (w - 1, 0), (0, h - 1), (w - 1, h - 1))]
+    return tuple(sum(channel) // len(corners) for channel in zip(*corners))
+
+def maskable(master, size):
+    """Shrink the logo into the maskable safe zone over a full-bleed background"""
+    inner = round(size * MASKABLE_SAFE_ZONE)
+    canvas = Image.new('RGBA', (size, size), edge_color(master.convert('RGBA')))
+    offset = (size - inner) // 2
+    canvas.alpha_composite(downsample(master, inner), (offset, offset))
+    return canvas
+
+def encode_target(target, images, master, optimize=True, tolerance=DEFAULT_TOLERANCE):
+    """Encode one export target to (bytes, bytes with Pillow's default encoding)"""
+    if target.kind in ('ico', 'icns'):
+        # Containers hold PNG frames at every size, taken from the shared downsamples
+        frames = [images[size] for size in target.size]
+        largest = frames[-1]
+        buffer = io.BytesIO()
+        if target.kind == 'ico':
+            largest.save(buffer, 'ICO', sizes=[(size, size) for size in target.size],
+                         append_images=frames[:-1])
+        else:
+            largest.save(buffer, 'ICNS', append_images=frames[:-1])
+        data = buffer.getvalue()
+        return data, len(data)
+    
+    if target.kind == 'maskable':
+        img = maskable(master, target.size)
+    elif target.kind == 'opaque':
+        img = flatten(images[target.size])
+    else:
+        img = images[target.size]
+    
+    if not optimize:
+        data = encode_png(img)
+        return data, len(data)
+    result = encode_smallest(img, tolerance)
+    return result.data, result.baseline_bytes
+
+def export_icons(render, platforms=PLATFORMS, root='.', master_size=None, optimize=True,
+                 tolerance=DEFAULT_TOLERANCE, workers=None, icns=False):
+    """Render once and write every platform's icons under root
+    
+    Returns (path, written, bytes, default-encoding bytes) per output file,
+    with Contents.json files reported alongside the images they describe.
+    """
+    targets = [target for platform in platforms for target in platform_targets(platform, icns)]
+    sizes = target_sizes(targets)
+    # The largest target (the 1024px store icon) is already 4x most launcher sizes
+    master_size = master_size or max(sizes)
+    
+    with stage(f"render {master_size}px"):
+        master = render(master_size)
+    with stage('resample'):
+        images = {size: downsample(master, size) for size in sizes}
+    
+    # Targets that share a kind and size (app_icon_512 and Icon-512) are encoded once
+    with stage('encode'):
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {}
+            for target in targets:
+                if (target.kind, target.size) not in futures:
+                    futures[target.kind, target.size] = pool.submit(
+                        encode_target, target, images, master, optimize, tolerance)
+            encoded = [futures[target.kind, target.size].result() for target in targets]
+    
+    outputs = []
+    with stage('write'):
+        for target, (data, baseline) in zip(targets, encoded):
+            path = os.path.join(root, target.path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            outputs.append((target.path, write_if_changed(path, data), len(data), baseline))
+        for platform in platforms:
+            if platform in PLATFORM_MANIFESTS:
+                relative, build = PLATFORM_MANIFESTS[platform]
+                data = contents_json(build())
+                outputs.append((relative, write_if_changed(os.path.join(root, relative), data),
+                                len(data), len(data)))
+    return outputs
+
+def main(argv=None):
+    """Export one generator's logo to every platform icon set"""
+    parser = argparse.ArgumentParser(description="Export TechVerse icons for every Flutter platform")
+    parser.add_argument('--generator', choices=sorted(GENERATORS), default='exact',
+                        help="generator to export (default: exact)")
+    parser.add_argument('--platform', action='append', choices=PLATFORMS,
+                        help="platform to export (repeatable, default: all)")
+    parser.add_argument('--root', default='.',
+                        help="Flutter project root to write into")
+    parser.add_argument('--master-size', type=int, default=None,
+                        help="master render size (default: the largest target, 1024)")
+    parser.add_argument('--icns', action='store_true',
+                        help="also write macos/Runner/AppIcon.icns, for Xcode targets that use one")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                        help="number of encoder threads (default: CPU count)")
+    parser.add_argument('--font-dir', action='append', default=[], metavar='DIR',
+                        help="search this directory for fonts first (repeatable)")
+    parser.add_argument('--trace', metavar='FILE',
+                        help="record per-stage time, draw calls and allocations as a Chrome trace")
+    add_encoding_arguments(parser)
+    args = parser.parse_args(argv)
+    
+    configure_font_search_path(args.font_dir)
+    render = load_renderer(args.generator)
+    label = GENERATORS[args.generator][2]
+    
+    start = time.perf_counter()
+    with tracing(args.trace):
+        outputs = export_icons(render, args.platform or PLATFORMS, args.root, args.master_size,
+                               args.optimize, args.tolerance, args.workers, args.icns)
+    
+    for path, written, size, baseline in outputs:
+        status = "Created" if written else "Unchanged"
+        detail = format_saving(baseline, size) if size != baseline else f"{size} bytes"
+        print(f"{status} {label} icon: {path} ({detail})")
+    print(f"{len(outputs)} file(s) exported in {time.perf_counter() - start:.2f}s")
+
+if __name__ == "__main__":
+    main()
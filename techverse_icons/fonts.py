@@ -0,0 +1,109 @@
+"""
+Font Subsystem
+Finds fonts on a configurable search path, keeps one loaded face per (path, size)
+for the whole process and memoizes per-glyph advances and kerning
+"""
+
+from functools import lru_cache
+import os
+import sys
+
+from PIL import ImageFont
+
+FONT_PATH_ENV = 'TECHVERSE_FONT_PATH'
+
+# Preferred faces, in order; Arial is what the logos were designed with
+DEFAULT_FONT_NAMES = ('arial.ttf', 'Arial.ttf', 'LiberationSans-Regular.ttf', 'DejaVuSans.ttf')
+
+def system_font_dirs():
+    """Return the usual font directories for this platform"""
+    home = os.path.expanduser('~')
+    if sys.platform == 'win32':
+        return [os.path.join(os.environ.get('WINDIR', r'C:\Windows'), 'Fonts')]
+    if sys.platform == 'darwin':
+        return ['/Library/Fonts', '/System/Library/Fonts', os.path.join(home, 'Library', 'Fonts')]
+    return ['/usr/share/fonts', '/usr/local/share/fonts',
+            os.path.join(home, '.fonts'), os.path.join(home, '.local', 'share', 'fonts')]
+
+def font_search_path():
+    """Return the directories searched for fonts, configured ones first"""
+    configured = [path for path in os.environ.get(FONT_PATH_ENV, '').split(os.pathsep) if path]
+    return configured + system_font_dirs()
+
+def configure_font_search_path(dirs):
+    """Put extra font directories in front of the search path
+    
+    The setting lives in the environment so build worker processes inherit it.
+    """
+    if not dirs:
+        return
+    current = os.environ.get(FONT_PATH_ENV, '')
+    os.environ[FONT_PATH_ENV] = os.pathsep.join(list(dirs) + ([current] if current else []))
+    clear_font_caches()
+
+@lru_cache(maxsize=None)
+def _font_index(search_path):
+    """Map lower-cased font file names to the first path providing them"""
+    index = {}
+    for directory in search_path:
+        for root, _, files in os.walk(directory):
+            for name in sorted(files):
+                index.setdefault(name.lower(), os.path.join(root, name))
+    return index
+
+def find_font(names=DEFAULT_FONT_NAMES):
+    """Return the path of the first available font from names, or None"""
+    index = _font_index(tuple(font_search_path()))
+    for name in names:
+        if os.path.isfile(name):
+            return name
+        path = index.get(name.lower())
+        if path:
+            return path
+    return None
+
+@lru_cache(maxsize=None)
+def _load_face(path, size):
+    """Load one face; shared by every render in the process"""
+    if path is None:
+        return ImageFont.load_default(size)
+    return ImageFont.truetype(path, size)
+
+def load_font(size, names=DEFAULT_FONT_NAMES):
+    """Return the cached font for the preferred face at size"""
+    return _load_face(find_font(names), size)
+
+@lru_cache(maxsize=4096)
+def glyph_advance(font, char):
+    """Return the horizontal advance of one character"""
+    return font.getlength(char)
+
+@lru_cache(maxsize=4096)
+def kerning(font, left, right):
+    """Return the kerning adjustment between two adjacent characters"""
+    return font.getlength(left + right) - glyph_advance(font, left) - glyph_advance(font, right)
+
+@lru_cache(maxsize=1024)
+def glyph_offsets(font, text):
+    """Return the x-offset of every character of text, laid out left to right"""
+    offsets = []
+    x = 0.0
+    for i, char in enumerate(text):
+        if i:
+            x += glyph_advance(font, text[i - 1]) + kerning(font, text[i - 1], char)
+        offsets.append(x)
+    return tuple(offsets)
+
+@lru_cache(maxsize=1024)
+def text_bbox(font, text):
+    """Return the ink bounding box of text drawn at the origin"""
+    return font.getbbox(text)
+
+def font_fingerprint(names=DEFAULT_FONT_NAMES):
+    """Describe the face renders will use, for cache keys"""
+    return find_font(names) or 'pillow-default'
+
+def clear_font_caches():
+    """Forget discovered fonts, loaded faces and metrics"""
+    for cached in (_font_index, _load_face, glyph_advance, kerning, glyph_offsets, text_bbox):
+        cached.cache_clear()
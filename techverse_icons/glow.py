@@ -0,0 +1,115 @@
+"""
+Glow Effects
+Analytic radial glows evaluated from a distance field, and blur-based glows and
+drop shadows computed from a shape's alpha mask, over their bounding box only
+"""
+
+from PIL import Image, ImageDraw, ImageFilter
+import numpy as np
+import math
+
+def glow_bounds(center, radius, canvas_size=None):
+    """Return the (left, top, right, bottom) box a radial glow touches"""
+    left, top = center[0] - radius, center[1] - radius
+    right, bottom = center[0] + radius + 1, center[1] + radius + 1
+    if canvas_size is not None:
+        left, top = max(left, 0), max(top, 0)
+        right, bottom = min(right, canvas_size[0]), min(bottom, canvas_size[1])
+    return left, top, right, bottom
+
+def radial_glow_array(center, radius, colors, bounds, max_alpha=0.3, falloff=1.0):
+    """Evaluate a two-color radial glow over a box as an RGBA uint8 array
+    
+    Matches painting concentric ellipses from the outside in: a pixel takes the
+    color of the smallest whole-pixel ring that still covers it, blending from
+    colors[0] at the center to colors[1] at the rim while alpha fades out.
+    """
+    left, top, right, bottom = bounds
+    ys, xs = np.ogrid[top:bottom, left:right]
+    dist = np.hypot(xs - center[0], ys - center[1])
+    
+    # Pillow fills an ellipse of radius r out to r + 0.5 from the center
+    ring = np.maximum(np.ceil(dist - 0.5), 1)
+    inside = ring <= radius
+    ratio = ring / max(radius, 1)
+    
+    pixels = np.zeros((bottom - top, right - left, 4), dtype=np.uint8)
+    for channel in range(3):
+        value = colors[0][channel] * (1 - ratio) + colors[1][channel] * ratio
+        pixels[..., channel] = np.where(inside, np.trunc(value), 0)
+    alpha = 255 * (1 - ratio) ** falloff * max_alpha
+    pixels[..., 3] = np.where(inside, np.trunc(alpha), 0)
+    
+    return pixels
+
+def composite_radial_glow(img, center, radius, colors, max_alpha=0.3, falloff=1.0):
+    """Composite a radial glow onto img in place, touching only its bounding box"""
+    bounds = glow_bounds(center, radius, img.size)
+    if bounds[0] >= bounds[2] or bounds[1] >= bounds[3]:
+        return img
+    
+    glow = radial_glow_array(center, radius, colors, bounds, max_alpha, falloff)
+    img.alpha_composite(Image.fromarray(glow, 'RGBA'), dest=bounds[:2])
+    return img
+
+def create_radial_glow(size, center, radius, colors, max_alpha=0.3, falloff=1.0):
+    """Create a full-size transparent layer holding one radial glow"""
+    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    bounds = glow_bounds(center, radius, img.size)
+    if bounds[0] < bounds[2] and bounds[1] < bounds[3]:
+        glow = radial_glow_array(center, radius, colors, bounds, max_alpha, falloff)
+        img.paste(Image.fromarray(glow, 'RGBA'), bounds[:2])
+    return img
+
+def blur_reach(radius, passes=3):
+    """How many whole pixels GaussianBlur(radius) can carry ink from a shape"""
+    # Pillow approximates the Gaussian with box blurs of a fractional radius, as in
+    # its _gaussian_blur_radius(); each pass spreads ink by that radius rounded up
+    sigma2 = radius * radius / passes
+    length = math.sqrt(12 * sigma2 + 1)
+    whole = math.floor((length - 1) / 2)
+    fraction = (2 * whole + 1) * (whole * (whole + 1) - 3 * sigma2) / (6 * (sigma2 - (whole + 1) ** 2))
+    return passes * math.ceil(whole + fraction)
+
+def blurred_alpha(mask, radius, strength=1.0):
+    """Blur an 'L' mask with a separable Gaussian and scale it to 0..1"""
+    # Pillow's GaussianBlur runs as repeated box passes, so cost does not grow with radius
+    blurred = np.asarray(mask.filter(ImageFilter.GaussianBlur(radius)), dtype=np.float32) / 255
+    return np.minimum(blurred * strength, 1.0)
+
+def composite_glow(img, mask, color, radius, strength=1.0, origin=(0, 0), offset=(0, 0)):
+    """Blur a shape's alpha mask, tint it and composite it onto img in place
+    
+    mask is an 'L' coverage image placed at origin on img; offset shifts the
+    glow away from the shape for a drop shadow. Only the mask's ink box plus
+    the blur margin is processed.
+    """
+    ink = mask.getbbox()
+    if ink is None:
+        return img
+    
+    # Pad the shape by the blur's full reach so the falloff is not clipped
+    pad = blur_reach(radius)
+    crop = mask.crop((ink[0] - pad, ink[1] - pad, ink[2] + pad, ink[3] + pad))
+    left = origin[0] + offset[0] + ink[0] - pad
+    top = origin[1] + offset[1] + ink[1] - pad
+    
+    alpha = blurred_alpha(crop, radius, strength) * (color[3] if len(color) > 3 else 255)
+    glow = np.empty(alpha.shape + (4,), dtype=np.uint8)
+    glow[..., :3] = color[:3]
+    glow[..., 3] = np.round(alpha).astype(np.uint8)
+    
+    # Clip the glow to the canvas before compositing in place
+    x0, y0 = max(left, 0), max(top, 0)
+    x1, y1 = min(left + glow.shape[1], img.width), min(top + glow.shape[0], img.height)
+    if x0 < x1 and y0 < y1:
+        patch = glow[y0 - top:y1 - top, x0 - left:x1 - left]
+        img.alpha_composite(Image.fromarray(np.ascontiguousarray(patch), 'RGBA'), dest=(x0, y0))
+    return img
+
+def text_mask(text, font, position):
+    """Rasterize text to a tight 'L' mask, returning the mask and its origin"""
+    bbox = font.getbbox(text)
+    mask = Image.new('L', (max(bbox[2] - bbox[0], 1), max(bbox[3] - bbox[1], 1)), 0)
+    ImageDraw.Draw(mask).text((-bbox[0], -bbox[1]), text, font=font, fill=255)
+    return mask, (position[0] + bbox[0], position[1] + bbox[1])
@@ -0,0 +1,298 @@
+"""
+Golden-Image Regression Checks
+Renders every generator, variant and density in parallel and compares each
+image with a stored reference using vectorized per-channel and SSIM diffs,
+writing heatmaps for the ones that drift
+"""
+
+from PIL import Image
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import argparse
+import json
+import os
+import sys
+
+import numpy as np
+
+from techverse_icons.adaptive import render_adaptive_masters
+from techverse_icons.cache import PACKAGE_DIR, write_if_changed
+from techverse_icons.encode import encode_smallest
+from techverse_icons.export import PLATFORMS, platform_targets, target_sizes
+from techverse_icons.fonts import configure_font_search_path, font_fingerprint
+from techverse_icons.pipeline import downsample, render_densities
+from techverse_icons.registry import (
+    ANDROID_DENSITIES, GENERATORS, adaptive_outputs, load_adaptive_renderers, load_renderer,
+    master_size_for
+)
+
+REPO_ROOT = os.path.dirname(PACKAGE_DIR)
+GOLDEN_DIR = os.path.join(REPO_ROOT, 'test', 'icons', 'golden')
+DIFF_DIR = os.path.join(REPO_ROOT, 'test', 'icons', 'failures')
+MANIFEST = 'manifest.json'
+
+# 'adaptive' and 'launcher' are what the build ships, 'native' renders every
+# density at its own size, 'themed' exercises the theme overrides and
+# 'export' covers the other platforms' sizes from one 1024px master
+GOLDEN_VARIANTS = ('adaptive', 'launcher', 'native', 'themed', 'export')
+
+GOLDEN_THEMES = {
+    'exact': {'ramp': [(255, 80, 0), (255, 220, 0)], 'glow_colors': [(0, 200, 120), (0, 90, 255)],
+              'badge_color': (255, 255, 255, 255)},
+    'named': {'primary_gradient': [(10, 40, 90), (0, 160, 200)], 'glow_color': (0, 255, 180, 150),
+              'trim_color': (0, 220, 255)},
+}
+THEMED_SIZE = 192
+
+# Maximum and mean absolute difference of any premultiplied channel, in 0-255
+# levels, and the lowest mean SSIM of any channel
+Tolerance = namedtuple('Tolerance', 'max_delta mean_delta min_ssim')
+GOLDEN_TOLERANCE = Tolerance(max_delta=24, mean_delta=0.5, min_ssim=0.98)
+
+# delta is the per-pixel largest channel difference, kept for heatmaps
+ImageDiff = namedtuple('ImageDiff', 'max_delta mean_delta ssim delta')
+
+SSIM_WINDOW = 7
+SSIM_C1 = (0.01 * 255) ** 2
+SSIM_C2 = (0.03 * 255) ** 2
+
+GoldenCase = namedtuple('GoldenCase', 'generator variant')
+
+def golden_cases(generators=None):
+    """Every (generator, variant) pair the suite renders"""
+    return [GoldenCase(generator, variant)
+            for generator in sorted(generators or GENERATORS) for variant in GOLDEN_VARIANTS]
+
+def export_sizes():
+    """Every distinct pixel size the platform exports need"""
+    return target_sizes([target for platform in PLATFORMS for target in platform_targets(platform)])
+
+def case_outputs(case):
+    """List the image names one case renders, without rendering anything"""
+    if case.variant == 'adaptive':
+        return list(adaptive_outputs())
+    if case.variant in ('launcher', 'native'):
+        return [os.path.join(density, 'ic_launcher.png') for density in ANDROID_DENSITIES]
+    if case.variant == 'themed':
+        return [f"ic_launcher-{THEMED_SIZE}.png"]
+    return [f"icon-{size}.png" for size in export_sizes()]
+
+def render_case(case):
+    """Render one case to {image name: RGBA array}, as the build would ship it"""
+    if case.variant == 'adaptive':
+        masters = render_adaptive_masters(*load_adaptive_renderers(case.generator),
+                                          master_size_for(ANDROID_DENSITIES.values()))
+        images = {name: downsample(masters[os.path.basename(name)], size)
+                  for name, size in adaptive_outputs().items()}
+    elif case.variant in ('launcher', 'native'):
+        render = load_renderer(case.generator)
+        overrides = {density: render for density in ANDROID_DENSITIES} if case.variant == 'native' else None
+        images = {os.path.join(density, 'ic_launcher.png'): img
+                  for density, img in render_densities(render, ANDROID_DENSITIES, overrides=overrides).items()}
+    elif case.variant == 'themed':
+        render = load_renderer(case.generator)
+        master = render(master_size_for([THEMED_SIZE]), theme=GOLDEN_THEMES[case.generator])
+        images = {f"ic_launcher-{THEMED_SIZE}.png": downsample(master, THEMED_SIZE)}
+    else:
+        sizes = export_sizes()
+        master = load_renderer(case.generator)(max(sizes))
+        images = {f"icon-{size}.png": downsample(master, size) for size in sizes}
+    return {name: np.asarray(img.convert('RGBA')) for name, img in images.items()}
+
+def run_cases(function, cases, workers=None):
+    """Map function over cases in a process pool, returning {case: result}
+    
+    Workers render and compare in place, so only small results cross
+    process boundaries, never the images themselves.
+    """
+    if workers == 1:
+        return {case: function(case) for case in cases}
+    # The slowest cases go first so they do not hold up the end of the run
+    ordered = sorted(cases, key=lambda case: case.variant not in ('adaptive', 'export'))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return dict(zip(ordered, pool.map(function, ordered)))
+
+def reference_name(case, name):
+    """Path of an image's reference, relative to the golden directory"""
+    return os.path.join(case.generator, case.variant, name)
+
+def premultiplied(pixels):
+    """RGBA array as float premultiplied RGB plus alpha, so hidden colors do not count"""
+    pixels = pixels.astype(np.float64)
+    alpha = pixels[..., 3:] / 255
+    return np.concatenate([pixels[..., :3] * alpha, pixels[..., 3:]], axis=-1)
+
+def box_mean(values, window=SSIM_WINDOW):
+    """Mean of every window x window patch per channel, from summed-area tables"""
+    table = np.pad(values.cumsum(axis=0).cumsum(axis=1), ((1, 0), (1, 0), (0, 0)))
+    sums = (table[window:, window:] - table[:-window, window:]
+            - table[window:, :-window] + table[:-window, :-window])
+    return sums / (window * window)
+
+def ssim(a, b, window=SSIM_WINDOW):
+    """Mean structural similarity of two float images, per channel"""
+    window = min(window, a.shape[0], a.shape[1])
+    mu_a, mu_b = box_mean(a, window), box_mean(b, window)
+    var_a = box_mean(a * a, window) - mu_a * mu_a
+    var_b = box_mean(b * b, window) - mu_b * mu_b
+    covariance = box_mean(a * b, window) - mu_a * mu_b
+    similarity = ((2 * mu_a * mu_b + SSIM_C1) * (2 * covariance + SSIM_C2)
+                  / ((mu_a * mu_a + mu_b * mu_b + SSIM_C1) * (var_a + var_b + SSIM_C2)))
+    return similarity.mean(axis=(0, 1))
+
+def compare(actual, expected):
+    """Diff two same-sized RGBA arrays"""
+    if np.array_equal(actual, expected):
+        # The common case needs no float work at all
+        return ImageDiff(0.0, 0.0, 1.0, None)
+    a, b = premultiplied(actual), premultiplied(expected)
+    delta = np.abs(a - b)
+    return ImageDiff(float(delta.max()), float(delta.mean(axis=(0, 1)).max()),
+                     float(ssim(a, b).min()), delta.max(axis=-1))
+
+def failures(diff, tolerance=GOLDEN_TOLERANCE):
+    """Describe every way a diff exceeds the tolerance; empty when it passes"""
+    problems = []
+    if diff.max_delta > tolerance.max_delta:
+        problems.append(f"max channel delta {diff.max_delta:.1f} > {tolerance.max_delta}")
+    if diff.mean_delta > tolerance.mean_delta:
+        problems.append(f"mean channel delta {diff.mean_delta:.3f} > {tolerance.mean_delta}")
+    if diff.ssim < tolerance.min_ssim:
+        problems.append(f"SSIM {diff.ssim:.4f} < {tolerance.min_ssim}")
+    return problems
+
+def heatmap(actual, expected, delta, scale=None):
+    """Expected, actual and a black-red-yellow-white difference map side by side"""
+    height, width = delta.shape
+    scale = scale or max(1, 256 // max(height, width))
+    heat = delta / max(float(delta.max()), 1.0)
+    colors = np.stack([np.clip(3 * heat - offset, 0, 1) for offset in range(3)], axis=-1)
+    
+    panels = []
+    for pixels in (expected, actual):
+        # Transparent areas show as mid-grey
+        panel = Image.new('RGBA', (width, height), (128, 128, 128, 255))
+        panel.alpha_composite(Image.fromarray(pixels, 'RGBA'))
+        panels.append(panel.convert('RGB'))
+    panels.append(Image.fromarray(np.round(colors * 255).astype(np.uint8), 'RGB'))
+    
+    sheet = Image.new('RGB', (3 * width + 8, height), (0, 0, 0))
+    for index, panel in enumerate(panels):
+        sheet.paste(panel, (index * (width + 4), 0))
+    return sheet.resize((sheet.width * scale, sheet.height * scale), Image.NEAREST)
+
+def load_reference(path):
+    """Read a reference image as an RGBA array, or None when it is missing"""
+    if not os.path.exists(path):
+        return None
+    with Image.open(path) as img:
+        return np.asarray(img.convert('RGBA'))
+
+def check_image(case, name, pixels, golden_dir=GOLDEN_DIR, diff_dir=DIFF_DIR,
+                tolerance=GOLDEN_TOLERANCE):
+    """Compare one rendered image with its reference; returns the failures found
+    
+    A heatmap is written under diff_dir for every image that fails.
+    """
+    relative = reference_name(case, name)
+    expected = load_reference(os.path.join(golden_dir, relative))
+    if expected is None:
+        return [f"no reference {relative}; run `python -m techverse_icons golden --update`"]
+    if expected.shape != pixels.shape:
+        return [f"size {pixels.shape[1]}x{pixels.shape[0]} != reference "
+                f"{expected.shape[1]}x{expected.shape[0]}"]
+    
+    diff = compare(pixels, expected)
+    problems = failures(diff, tolerance)
+    if problems and diff_dir:
+        path = os.path.join(diff_dir, relative)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        heatmap(pixels, expected, diff.delta).save(path)
+        problems.append(f"heatmap: {path}")
+    return problems
+
+def check_case(case, golden_dir=GOLDEN_DIR, diff_dir=DIFF_DIR, tolerance=GOLDEN_TOLERANCE):
+    """Render one case and compare every image; returns {image name: failures}"""
+    return {name: check_image(case, name, pixels, golden_dir, diff_dir, tolerance)
+            for name, pixels in render_case(case).items()}
+
+def check_references(cases, golden_dir=GOLDEN_DIR, diff_dir=DIFF_DIR, tolerance=GOLDEN_TOLERANCE,
+                     workers=None):
+    """Check cases in parallel, returning {case: {image name: failures}}"""
+    return run_cases(partial(check_case, golden_dir=golden_dir, diff_dir=diff_dir, tolerance=tolerance),
+                     cases, workers)
+
+def reference_font():
+    """The face file name renders use here, which references depend on"""
+    return os.path.basename(font_fingerprint())
+
+def read_manifest(golden_dir=GOLDEN_DIR):
+    """Return how the references were rendered, or {} before the first update"""
+    try:
+        with open(os.path.join(golden_dir, MANIFEST)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+def update_case(case, golden_dir=GOLDEN_DIR):
+    """Render one case and store it as the reference; returns the paths that changed"""
+    written = []
+    for name, pixels in render_case(case).items():
+        path = os.path.join(golden_dir, reference_name(case, name))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Lossless: the smallest encoding still decodes to identical pixels
+        if write_if_changed(path, encode_smallest(Image.fromarray(pixels, 'RGBA')).data):
+            written.append(path)
+    return written
+
+def update_references(cases, golden_dir=GOLDEN_DIR, workers=None):
+    """Re-render cases in parallel as the new references; returns the paths that changed"""
+    results = run_cases(partial(update_case, golden_dir=golden_dir), cases, workers)
+    manifest = {'font': reference_font()}
+    write_if_changed(os.path.join(golden_dir, MANIFEST),
+                     (json.dumps(manifest, indent=2, sort_keys=True) + "\n").encode())
+    return [path for case in cases for path in results[case]]
+
+def main(argv=None):
+    """Check rendered icons against the golden references, or refresh them"""
+    parser = argparse.ArgumentParser(description="Compare TechVerse icons with golden references")
+    parser.add_argument('--generator', action='append', choices=sorted(GENERATORS),
+                        help="generator to check (repeatable, default: all)")
+    parser.add_argument('--update', action='store_true',
+                        help="re-render and overwrite the references instead of checking")
+    parser.add_argument('--golden-dir', default=GOLDEN_DIR,
+                        help="directory holding the reference images")
+    parser.add_argument('--diff-dir', default=DIFF_DIR,
+                        help="directory heatmaps of failing images are written to")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                        help="number of render processes (default: CPU count)")
+    parser.add_argument('--font-dir', action='append', default=[], metavar='DIR',
+                        help="search this directory for fonts first (repeatable)")
+    args = parser.parse_args(argv)
+    
+    configure_font_search_path(args.font_dir)
+    cases = golden_cases(args.generator)
+    if args.update:
+        written = update_references(cases, args.golden_dir, args.workers)
+        print(f"{len(written)} reference(s) updated in {args.golden_dir}")
+        return 0
+    
+    expected_font = read_manifest(args.golden_dir).get('font')
+    if expected_font and expected_font != reference_font():
+        print(f"warning: references were rendered with {expected_font}, this machine uses "
+              f"{reference_font()}; text will not match", file=sys.stderr)
+    
+    results = check_references(cases, args.golden_dir, args.diff_dir, workers=args.workers)
+    checked = failed = 0
+    for case in cases:
+        for name, problems in results[case].items():
+            checked += 1
+            if problems:
+                failed += 1
+                print(f"FAIL {reference_name(case, name)}: {'; '.join(problems)}")
+    print(f"{checked - failed}/{checked} image(s) match their references")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+"""
+Tile-Stamped Hexagonal Grid
+Rasterizes one periodic hexagon tile per (grid size, color, layout) and fills
+the canvas by repeating it instead of drawing every cell
+"""
+
+from functools import lru_cache
+import math
+
+from PIL import Image, ImageDraw
+import numpy as np
+
+GRID_LAYOUTS = ('square', 'offset')
+
+def hexagon_points(center_x, center_y, radius):
+    """Return the six flat-top hexagon vertices around a center"""
+    points = []
+    for angle in range(0, 360, 60):
+        rad = math.radians(angle)
+        points.append((center_x + radius * math.cos(rad), center_y + radius * math.sin(rad)))
+    return points
+
+def tile_period(grid_size, layout):
+    """Return the (width, height) after which a grid layout repeats"""
+    if layout == 'square':
+        return grid_size, grid_size
+    if layout == 'offset':
+        # Every other column is shifted down by half a cell
+        return 2 * grid_size, grid_size
+    raise ValueError(f"Unknown grid layout: {layout!r} (expected one of {GRID_LAYOUTS})")
+
+@lru_cache(maxsize=64)
+def hexagon_tile(grid_size, color, layout='square'):
+    """Rasterize one period of the hexagonal grid as a read-only RGBA array"""
+    width, height = tile_period(grid_size, layout)
+    radius = grid_size // 3
+    
+    # Cell centers inside one period; the lattice origin sits on (0, 0)
+    centers = [(0, 0)]
+    if layout == 'offset':
+        centers.append((grid_size, grid_size // 2))
+    
+    # Draw each cell once on a canvas with a margin, then fold the overhang back
+    # into the period so cells straddling the tile edge wrap around
+    margin = radius + 2
+    canvas = Image.new('RGBA', (width + 2 * margin, height + 2 * margin), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(canvas)
+    for center_x, center_y in centers:
+        draw.polygon(hexagon_points(center_x + margin, center_y + margin, radius),
+                     outline=color, width=1)
+    
+    pixels = np.asarray(canvas)
+    tile = np.zeros((height, width, 4), dtype=np.uint8)
+    ys = (np.arange(pixels.shape[0]) - margin) % height
+    xs = (np.arange(pixels.shape[1]) - margin) % width
+    covered = pixels[..., 3] > 0
+    tile[ys[:, None].repeat(pixels.shape[1], 1)[covered],
+         xs[None, :].repeat(pixels.shape[0], 0)[covered]] = pixels[covered]
+    
+    tile.flags.writeable = False
+    return tile
+
+def tile_canvas(tile, size, box=None):
+    """Fill a size x size canvas, or one box of it, by repeating a tile from the origin"""
+    left, top, right, bottom = box or (0, 0, size, size)
+    height, width = tile.shape[:2]
+    # Start the repeat at the phase the box's corner falls on
+    tile = np.roll(tile, (-(top % height), -(left % width)), axis=(0, 1))
+    reps = (-(-(bottom - top) // height), -(-(right - left) // width), 1)
+    return np.tile(tile, reps)[:bottom - top, :right - left]
+
+@lru_cache(maxsize=64)
+def composited_tile(grid_size, color, background, layout='square'):
+    """Composite the grid tile over an opaque background color once"""
+    tile = Image.fromarray(np.array(hexagon_tile(grid_size, color, layout)), 'RGBA')
+    base = Image.new('RGBA', tile.size, tuple(background) + (255,))
+    pixels = np.asarray(Image.alpha_composite(base, tile)).copy()
+    pixels.flags.writeable = False
+    return pixels
+
+def create_hex_grid(size, grid_size, color, layout='square', background=None, box=None):
+    """Create a hexagonal grid layer, or the grid already over a solid background
+    
+    With a box, only that part of the size x size grid is returned.
+    """
+    if background is None:
+        tile = hexagon_tile(grid_size, color, layout)
+    else:
+        tile = composited_tile(grid_size, color, tuple(background), layout)
+    return Image.fromarray(np.ascontiguousarray(tile_canvas(tile, size, box)), 'RGBA')
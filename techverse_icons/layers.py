@@ -0,0 +1,255 @@
+"""
+Layer-Graph Compositor
+Icons are declared as ordered layers, each confined to a bounding box with a
+blend mode; the compositor paints every layer into a canvas the size of its
+box and blends it into the icon once, touching only that region
+"""
+
+from collections import namedtuple
+from contextlib import contextmanager
+from numbers import Number
+import hashlib
+import types
+
+from PIL import Image, ImageDraw
+
+from techverse_icons.profiling import stage
+
+BLEND_MODES = ('normal', 'replace')
+
+# Painted patches reused between renders while cached_layers() is active,
+# as a (store, previous store) pair
+_patches = None
+
+# paint(canvas) draws on canvas.draw / canvas.image, or returns a finished RGBA
+# image the size of the box; halo is how far outside a pixel the painter reads
+# (blur reach, shifted copies), so tiles paint that much extra and crop it off
+Layer = namedtuple('Layer', 'name bbox paint blend halo', defaults=(0,))
+
+def layer(name, bbox, paint, blend='normal', halo=0):
+    """Declare one layer of an icon"""
+    if blend not in BLEND_MODES:
+        raise ValueError(f"Unknown blend mode: {blend!r} (expected one of {BLEND_MODES})")
+    return Layer(name, tuple(int(v) for v in bbox), paint, blend, int(halo))
+
+def bbox_of(points, pad=0):
+    """Return the integer box covering a list of (x, y) points, grown by pad"""
+    xs = [point[0] for point in points]
+    ys = [point[1] for point in points]
+    return (int(min(xs)) - pad, int(min(ys)) - pad, int(max(xs)) + pad + 1, int(max(ys)) + pad + 1)
+
+def intersect_boxes(box, other):
+    """Return the overlap of two boxes, or None when they do not overlap"""
+    left, top = max(box[0], other[0]), max(box[1], other[1])
+    right, bottom = min(box[2], other[2]), min(box[3], other[3])
+    if left >= right or top >= bottom:
+        return None
+    return left, top, right, bottom
+
+def clip_box(box, size):
+    """Clip a box to a size x size canvas; returns None when nothing is left"""
+    return intersect_boxes(box, (0, 0, size, size))
+
+def grow_box(box, pad):
+    """Grow a box by pad pixels on every side"""
+    return box[0] - pad, box[1] - pad, box[2] + pad, box[3] + pad
+
+def frame_boxes(box, corner, thickness=None):
+    """Cut a box into its four corner x corner squares and the pieces between them
+    
+    Declaring a rounded rectangle's layer over these pieces keeps its costly
+    corner arcs in small patches of their own. With thickness, only edge
+    strips that deep are kept between the corners, for outlines that leave
+    the middle empty.
+    """
+    left, top, right, bottom = box
+    corner = min(corner, (right - left) // 2, (bottom - top) // 2)
+    x0, y0, x1, y1 = left + corner, top + corner, right - corner, bottom - corner
+    pieces = [(left, top, x0, y0), (x1, top, right, y0), (x1, y1, right, bottom), (left, y1, x0, bottom)]
+    if thickness is None:
+        pieces += [(x0, top, x1, y0), (left, y0, right, y1), (x0, y1, x1, bottom)]
+    else:
+        pieces += [(x0, top, x1, top + thickness), (left, y0, left + thickness, y1),
+                   (right - thickness, y0, right, y1), (x0, bottom - thickness, x1, bottom)]
+    return [piece for piece in pieces if piece[0] < piece[2] and piece[1] < piece[3]]
+
+def _shift(xy, dx, dy):
+    """Translate any ImageDraw coordinate argument by (-dx, -dy)"""
+    if len(xy) and isinstance(xy[0], Number):
+        # Flat [x0, y0, x1, y1, ...] or a single (x, y)
+        return [value - (dy if i % 2 else dx) for i, value in enumerate(xy)]
+    return [(point[0] - dx, point[1] - dy) for point in xy]
+
+class OffsetDraw:
+    """ImageDraw proxy that takes icon coordinates and draws on a box-sized canvas"""
+    
+    def __init__(self, draw, origin):
+        self._draw = draw
+        self._origin = origin
+    
+    def __getattr__(self, name):
+        method = getattr(self._draw, name)
+        if not callable(method):
+            return method
+        
+        def translated(xy, *args, **kwargs):
+            return method(_shift(xy, *self._origin), *args, **kwargs)
+        return translated
+
+class LayerCanvas:
+    """The box-sized canvas handed to a layer's painter"""
+    
+    def __init__(self, image, box):
+        self.image = image
+        self.box = box
+        self.origin = box[:2]
+        self.draw = OffsetDraw(ImageDraw.Draw(image), self.origin)
+    
+    def local(self, x, y):
+        """Convert icon coordinates to this canvas's pixel coordinates"""
+        return x - self.origin[0], y - self.origin[1]
+    
+    def composite(self, img, position):
+        """Alpha-composite an image placed at icon coordinates onto this canvas"""
+        x, y = self.local(*position)
+        # Clip to the canvas; Pillow rejects negative destinations
+        left, top = max(-x, 0), max(-y, 0)
+        right = min(img.width, self.image.width - x)
+        bottom = min(img.height, self.image.height - y)
+        if left < right and top < bottom:
+            self.image.alpha_composite(img, dest=(x + left, y + top), source=(left, top, right, bottom))
+
+def blend(canvas, patch, box, mode):
+    """Blend a finished layer patch into the canvas over its box, in place"""
+    if mode == 'normal':
+        canvas.alpha_composite(patch, dest=box[:2])
+    else:
+        canvas.paste(patch, box[:2])
+
+def paint_layer(item, box):
+    """Run a layer's painter and return its box-sized RGBA patch"""
+    patch = Image.new('RGBA', (box[2] - box[0], box[3] - box[1]), (0, 0, 0, 0))
+    result = item.paint(LayerCanvas(patch, box))
+    if result is None:
+        return patch
+    if result.size != patch.size:
+        raise ValueError(f"Layer {item.name!r} painted {result.width}x{result.height} "
+                         f"for a {patch.width}x{patch.height} box")
+    return result
+
+@contextmanager
+def cached_layers(store=None, previous=None):
+    """Reuse painted layer patches whose painter, inputs and box are unchanged
+    
+    Patches found only in previous are carried over into store, so a
+    long-running caller can pass last round's store as previous and let
+    whatever went unused be dropped with it.
+    """
+    global _patches
+    saved, _patches = _patches, ({} if store is None else store, previous or {})
+    try:
+        yield _patches[0]
+    finally:
+        _patches = saved
+
+def _describe(value, seen):
+    """Reduce a value a painter depends on to a stable, comparable form"""
+    if value is None or isinstance(value, (bool, Number, str, bytes)):
+        return value
+    if isinstance(value, (tuple, list)):
+        return (type(value).__name__,) + tuple(_describe(item, seen) for item in value)
+    if isinstance(value, dict):
+        return ('dict',) + tuple((key, _describe(item, seen)) for key, item in sorted(value.items()))
+    if isinstance(value, types.CodeType):
+        return ('code', value.co_code, value.co_names,
+                tuple(_describe(const, seen) for const in value.co_consts))
+    if isinstance(value, types.FunctionType):
+        return ('function', value.__module__, value.__qualname__, _function_inputs(value, seen))
+    if isinstance(value, types.ModuleType):
+        return ('module', value.__name__)
+    # Fonts and other heavyweight objects are cached per process, so identity suffices
+    return ('object', type(value).__qualname__, id(value))
+
+def _function_inputs(function, seen):
+    """Describe a function's code and everything it reads from its closure and module"""
+    if function in seen:
+        return ('recursive', function.__qualname__)
+    seen.add(function)
+    code = function.__code__
+    cells = tuple(_describe(cell.cell_contents, seen) for cell in function.__closure__ or ())
+    defaults = _describe(function.__defaults__, seen), _describe(function.__kwdefaults__, seen)
+    
+    # Module-level helpers are followed into, so editing one re-paints its callers;
+    # functions from other modules only change when the process restarts
+    names = []
+    for name in code.co_names:
+        if name not in function.__globals__:
+            continue
+        value = function.__globals__[name]
+        if callable(value) and getattr(value, '__module__', None) != function.__module__:
+            names.append((name, getattr(value, '__qualname__', type(value).__qualname__)))
+        else:
+            names.append((name, _describe(value, seen)))
+    return _describe(code, seen), cells, defaults, tuple(names)
+
+def paint_fingerprint(item):
+    """Digest a layer's painter code, the values it closes over and its blend"""
+    description = (item.name, item.blend, _describe(item.paint, set()))
+    return hashlib.sha256(repr(description).encode()).hexdigest()
+
+def cached_patch(item, box):
+    """paint_layer(), reusing an identical patch from the active layer cache"""
+    if _patches is None:
+        return paint_layer(item, box)
+    store, previous = _patches
+    key = (box, paint_fingerprint(item))
+    if key not in store:
+        store[key] = previous[key] if key in previous else paint_layer(item, box)
+    return store[key]
+
+def compose(size, layers):
+    """Composite layers bottom to top into a size x size RGBA icon"""
+    return compose_region(size, layers, (0, 0, size, size))
+
+def compose_region(size, layers, region):
+    """Composite layers bottom to top over one region of a size x size icon
+    
+    Each layer is painted over its box within the region grown by its halo,
+    then cropped back, so a tile comes out exactly as that part of the whole
+    icon would.
+    """
+    width, height = region[2] - region[0], region[3] - region[1]
+    canvas = None
+    for item in layers:
+        bounds = clip_box(item.bbox, size)
+        target = bounds and intersect_boxes(bounds, region)
+        if target is None:
+            continue
+        box = intersect_boxes(bounds, grow_box(region, item.halo))
+        with stage(item.name):
+            patch = cached_patch(item, box)
+            shared = patch.readonly or _patches
+            if box != target:
+                patch = patch.crop((target[0] - box[0], target[1] - box[1],
+                                    target[2] - box[0], target[3] - box[1]))
+                shared = False
+            local = (target[0] - region[0], target[1] - region[1],
+                     target[2] - region[0], target[3] - region[1])
+            if canvas is None and item.blend == 'replace' and target == region:
+                # An opaque bottom layer covering the region becomes the canvas itself;
+                # cached patches are shared, so those are copied first
+                canvas = patch.copy() if shared else patch
+                continue
+            if canvas is None:
+                canvas = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+            blend(canvas, patch, local, item.blend)
+    
+    if canvas is None:
+        canvas = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+    return canvas
+
+def split_layers(layers, background):
+    """Split layers into (background, foreground) lists by layer name, keeping their order"""
+    back = [item for item in layers if item.name in background]
+    front = [item for item in layers if item.name not in background]
+    return back, front
@@ -0,0 +1,154 @@
+"""
+Icon Render Pipeline
+Renders one supersampled master per icon and resamples it down to every density
+"""
+
+from PIL import Image
+import os
+
+from techverse_icons.cache import add_cache_arguments, cache_from_args, render_key, write_if_changed
+from techverse_icons.encode import DEFAULT_TOLERANCE, encode_images, encode_png, format_saving
+from techverse_icons.fonts import configure_font_search_path
+from techverse_icons.profiling import stage, tracing
+from techverse_icons.registry import ANDROID_DENSITIES, ANDROID_RES_PATH, SUPERSAMPLE, master_size_for
+
+def downsample(master, size):
+    """Resample a master image down to size x size with Lanczos filtering"""
+    if master.size == (size, size):
+        return master.copy()
+    # Pillow premultiplies alpha for RGBA resizes, so edges do not pick up dark fringes
+    return master.resize((size, size), Image.LANCZOS)
+
+def render_densities(render, densities, master_size=None, overrides=None):
+    """Render every density from a single master image
+    
+    render is called once with the master size and must return an RGBA image.
+    overrides maps density names to their own render(size) callables, for
+    densities that need hand-hinted pixels instead of a resampled master.
+    """
+    overrides = overrides or {}
+    resampled = {name: size for name, size in densities.items() if name not in overrides}
+    
+    images = {}
+    if resampled:
+        size = master_size_for(resampled.values(), master_size)
+        with stage(f"render {size}px"):
+            master = render(size)
+        with stage('resample'):
+            for name, size in resampled.items():
+                images[name] = downsample(master, size)
+    
+    for name, override in overrides.items():
+        if name in densities:
+            with stage(f"render {densities[name]}px"):
+                images[name] = override(densities[name])
+    
+    # Keep the caller's density order
+    return {name: images[name] for name in densities}
+
+def render_encoded(render, densities, master_size=None, native=(), cache=None,
+                   optimize=True, tolerance=DEFAULT_TOLERANCE, report=None, workers=None):
+    """Render densities to PNG bytes, restoring unchanged ones from the cache
+    
+    Densities named in native are rendered at their own size; the rest are
+    resampled from one master. Nothing is rendered when every key is cached.
+    With optimize, each icon gets its smallest faithful encoding and report,
+    if given, collects the EncodeResult of every density encoded this run;
+    workers caps the encoding threads.
+    """
+    master_size = master_size_for(densities.values(), master_size)
+    encoding = {'optimize': optimize, 'tolerance': tolerance if optimize else None}
+    keys = {
+        name: render_key(render, size=size, master_size=None if name in native else master_size,
+                         encoding=encoding)
+        for name, size in densities.items()
+    }
+    
+    encoded = {}
+    if cache is not None:
+        for name, key in keys.items():
+            data = cache.get(key)
+            if data is not None:
+                encoded[name] = data
+    
+    missing = {name: size for name, size in densities.items() if name not in encoded}
+    if missing:
+        overrides = {name: render for name in native if name in missing}
+        images = render_densities(render, missing, master_size, overrides)
+        with stage('encode'):
+            if optimize:
+                results = encode_images(images, tolerance, workers)
+                if report is not None:
+                    report.update(results)
+                fresh = {name: result.data for name, result in results.items()}
+            else:
+                fresh = {name: encode_png(img) for name, img in images.items()}
+        for name, data in fresh.items():
+            encoded[name] = data
+            if cache is not None:
+                cache.put(keys[name], data)
+    
+    return {name: encoded[name] for name in densities}
+
+def save_icon(img, output_path, label):
+    """Save a rendered icon as PNG and report it"""
+    img.save(output_path, 'PNG')
+    print(f"Created {label} icon: {output_path} ({img.width}x{img.height})")
+
+def write_densities(encoded, densities, label, base_path=ANDROID_RES_PATH, filename="ic_launcher.png",
+                    report=None):
+    """Write one encoded icon per density directory, skipping unchanged files"""
+    report = report or {}
+    for density, data in encoded.items():
+        density_path = os.path.join(base_path, density)
+        os.makedirs(density_path, exist_ok=True)
+        output_path = os.path.join(density_path, filename)
+        size = densities[density]
+        
+        if density in report:
+            detail = f"{size}x{size}, {format_saving(report[density].baseline_bytes, len(data))}"
+        else:
+            detail = f"{size}x{size}, {len(data)} bytes"
+        
+        if write_if_changed(output_path, data):
+            print(f"Created {label} icon: {output_path} ({detail})")
+        else:
+            print(f"Unchanged {label} icon: {output_path} ({detail})")
+
+def add_pipeline_arguments(parser):
+    """Add the shared render pipeline options to a generator's argument parser"""
+    parser.add_argument('--output', default=ANDROID_RES_PATH,
+                        help=f"resource directory to write into (default: {ANDROID_RES_PATH})")
+    parser.add_argument('--master-size', type=int, default=None,
+                        help=f"master render size (default: {SUPERSAMPLE}x the largest density)")
+    parser.add_argument('--per-density', action='store_true',
+                        help="render every density natively instead of resampling one master")
+    parser.add_argument('--native', action='append', default=[], choices=list(ANDROID_DENSITIES),
+                        metavar='DENSITY',
+                        help="render this density natively for pixel hinting (repeatable)")
+    parser.add_argument('--font-dir', action='append', default=[], metavar='DIR',
+                        help="search this directory for fonts first (repeatable)")
+    parser.add_argument('--trace', metavar='FILE',
+                        help="record per-stage time, draw calls and allocations as a Chrome trace")
+    add_encoding_arguments(parser)
+    add_cache_arguments(parser)
+
+def add_encoding_arguments(parser):
+    """Add the PNG size-optimization options to an argument parser"""
+    parser.add_argument('--no-optimize', dest='optimize', action='store_false',
+                        help="write Pillow's default PNG encoding instead of the smallest one")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed RMS error for lossy palette quantization (default: 0, lossless)")
+
+def build_android_icons(render, label, args, densities=ANDROID_DENSITIES, base_path=None):
+    """Render and write every Android density according to the pipeline options
+    
+    base_path defaults to the --output directory.
+    """
+    configure_font_search_path(args.font_dir)
+    native = list(densities) if args.per_density else args.native
+    report = {}
+    with tracing(args.trace):
+        encoded = render_encoded(render, densities, args.master_size, native, cache_from_args(args),
+                                 args.optimize, args.tolerance, report)
+    write_densities(encoded, densities, label, base_path or args.output, report=report)
@@ -0,0 +1,223 @@
+"""
+Render Stage Profiling
+Named stage markers for the icon renderers; free unless a recorder is active.
+TraceRecorder also counts Pillow draw calls and the canvases each stage
+allocates, and exports everything as a Chrome trace.
+"""
+
+from contextlib import contextmanager, nullcontext
+import functools
+import json
+import os
+import threading
+import time
+
+from PIL import Image, ImageDraw
+
+# The recorder collecting stages in this process, or None when profiling is off
+_active = None
+_NULL_STAGE = nullcontext()
+
+def stage(name):
+    """Mark a named drawing stage inside a renderer"""
+    if _active is None:
+        return _NULL_STAGE
+    return _active.stage(name)
+
+class StageRecorder:
+    """Collects the wall time of every stage run while it is active"""
+    
+    def __init__(self):
+        self.events = []
+    
+    @contextmanager
+    def stage(self, name):
+        """Time one stage"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.events.append((name, start, time.perf_counter() - start))
+    
+    def totals(self):
+        """Return the summed seconds per stage name, in first-seen order"""
+        totals = {}
+        for name, _, seconds in self.events:
+            totals[name] = totals.get(name, 0.0) + seconds
+        return totals
+
+# ImageDraw methods counted as draw calls
+DRAW_METHODS = (
+    'arc', 'bitmap', 'chord', 'ellipse', 'line', 'pieslice', 'point', 'polygon',
+    'rectangle', 'regular_polygon', 'rounded_rectangle', 'text', 'multiline_text',
+)
+
+# Module functions and Image methods that return a newly allocated canvas
+ALLOCATING_FUNCTIONS = ('new', 'fromarray', 'alpha_composite')
+ALLOCATING_METHODS = ('convert', 'copy', 'crop', 'filter', 'resize')
+
+def canvas_bytes(img):
+    """Return the bytes Pillow holds for an image's pixels"""
+    # Pillow stores 8-bit single-band images in one byte and everything else in four
+    if img.mode in ('1', 'L', 'P'):
+        bytes_per_pixel = 1
+    elif img.mode.startswith('I;16'):
+        bytes_per_pixel = 2
+    else:
+        bytes_per_pixel = 4
+    return img.width * img.height * bytes_per_pixel
+
+class TraceRecorder(StageRecorder):
+    """Records per-stage time, Pillow draw calls and canvas allocations
+    
+    Pillow is patched only while the recorder is active, so renders outside a
+    recording() block run the original, uninstrumented functions.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self.stats = []
+        self._stack = []
+        self._unstaged = self._new_stats()
+        self._patches = []
+        self._in_draw = False
+    
+    @staticmethod
+    def _new_stats():
+        return {'draw_calls': 0, 'allocated_bytes': 0, 'canvases': []}
+    
+    def _current(self):
+        return self._stack[-1] if self._stack else self._unstaged
+    
+    @contextmanager
+    def stage(self, name):
+        """Time one stage and attribute draw calls and allocations to it"""
+        stats = self._new_stats()
+        self._stack.append(stats)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.events.append((name, start, time.perf_counter() - start))
+            self.stats.append(stats)
+            self._stack.pop()
+    
+    def count_draw(self):
+        """Count one top-level draw call"""
+        self._current()['draw_calls'] += 1
+    
+    def count_canvas(self, img, origin):
+        """Record one newly allocated canvas"""
+        stats = self._current()
+        size = canvas_bytes(img)
+        stats['allocated_bytes'] += size
+        stats['canvases'].append({'origin': origin, 'mode': img.mode,
+                                  'size': [img.width, img.height], 'bytes': size})
+    
+    def _wrap_draw(self, method):
+        @functools.wraps(method)
+        def wrapper(draw, *args, **kwargs):
+            # Shapes built from other draw calls (polygon outlines, regular polygons) count once
+            if self._in_draw:
+                return method(draw, *args, **kwargs)
+            self._in_draw = True
+            try:
+                self.count_draw()
+                return method(draw, *args, **kwargs)
+            finally:
+                self._in_draw = False
+        return wrapper
+    
+    def _wrap_allocator(self, function, origin):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            result = function(*args, **kwargs)
+            if isinstance(result, Image.Image):
+                self.count_canvas(result, origin)
+            return result
+        return wrapper
+    
+    def _patch(self, owner, name, replacement):
+        self._patches.append((owner, name, getattr(owner, name)))
+        setattr(owner, name, replacement)
+    
+    def install(self):
+        """Patch Pillow so draw calls and allocations are recorded"""
+        for name in DRAW_METHODS:
+            if hasattr(ImageDraw.ImageDraw, name):
+                self._patch(ImageDraw.ImageDraw, name, self._wrap_draw(getattr(ImageDraw.ImageDraw, name)))
+        for name in ALLOCATING_FUNCTIONS:
+            self._patch(Image, name, self._wrap_allocator(getattr(Image, name), f"Image.{name}"))
+        for name in ALLOCATING_METHODS:
+            self._patch(Image.Image, name, self._wrap_allocator(getattr(Image.Image, name), name))
+    
+    def uninstall(self):
+        """Restore the original Pillow functions"""
+        while self._patches:
+            owner, name, original = self._patches.pop()
+            setattr(owner, name, original)
+    
+    def summary(self):
+        """Return per-stage totals: seconds, draw calls, bytes and canvas count"""
+        summary = {}
+        for (name, _, seconds), stats in zip(self.events, self.stats):
+            entry = summary.setdefault(name, {'seconds': 0.0, 'calls': 0, 'draw_calls': 0,
+                                              'allocated_bytes': 0, 'canvases': 0})
+            entry['seconds'] += seconds
+            entry['calls'] += 1
+            entry['draw_calls'] += stats['draw_calls']
+            entry['allocated_bytes'] += stats['allocated_bytes']
+            entry['canvases'] += len(stats['canvases'])
+        return summary
+    
+    def trace_events(self, pid=None, tid=None):
+        """Convert the recorded stages to Chrome trace 'complete' events"""
+        pid = os.getpid() if pid is None else pid
+        tid = threading.get_ident() if tid is None else tid
+        events = []
+        for (name, start, seconds), stats in zip(self.events, self.stats):
+            events.append({
+                'name': name,
+                'cat': 'render',
+                'ph': 'X',
+                'ts': start * 1e6,
+                'dur': seconds * 1e6,
+                'pid': pid,
+                'tid': tid,
+                'args': stats,
+            })
+        return events
+
+def write_trace(path, events, summary=None):
+    """Write Chrome trace events (chrome://tracing, Perfetto) with a JSON summary"""
+    trace = {'traceEvents': events, 'displayTimeUnit': 'ms'}
+    if summary is not None:
+        trace['otherData'] = {'stages': summary}
+    with open(path, 'w') as f:
+        json.dump(trace, f, indent=1)
+
+@contextmanager
+def recording(recorder=None):
+    """Activate a recorder for the duration of the block"""
+    global _active
+    recorder = recorder if recorder is not None else StageRecorder()
+    previous, _active = _active, recorder
+    install = getattr(recorder, 'install', None)
+    if install is not None:
+        install()
+    try:
+        yield recorder
+    finally:
+        if install is not None:
+            recorder.uninstall()
+        _active = previous
+
+@contextmanager
+def tracing(path):
+    """Record a full trace of the block and write it to path; no-op when path is None"""
+    if path is None:
+        yield None
+        return
+    with recording(TraceRecorder()) as recorder:
+        yield recorder
+    write_trace(path, recorder.trace_events(), recorder.summary())
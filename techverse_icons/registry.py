@@ -0,0 +1,185 @@
+"""
+Generator Registry
+Names the icon generators, variants and Android densities and plans build
+output paths using only the standard library, so listing and dry runs start
+without importing Pillow or numpy
+"""
+
+from collections import namedtuple
+import importlib
+import os
+
+# Generator name -> (module, render function, label)
+GENERATORS = {
+    'exact': ('create_exact_techverse_logo', 'render_exact_techverse_icon', 'exact TECHVERSE'),
+    'named': ('create_named_techverse_logo', 'render_named_techverse_icon', 'named TechVerse'),
+}
+
+# Generator name -> (background, foreground) render functions for adaptive icons
+ADAPTIVE_RENDERERS = {
+    'exact': ('render_exact_techverse_background', 'render_exact_techverse_foreground'),
+    'named': ('render_named_techverse_background', 'render_named_techverse_foreground'),
+}
+
+# Generator name -> function declaring its layer stack, for tiled rendering
+LAYER_FUNCTIONS = {
+    'exact': 'exact_techverse_layers',
+    'named': 'named_techverse_layers',
+}
+
+# Variant name -> output file name inside each density directory; the adaptive
+# variant writes the whole adaptive set, flat ic_launcher.png included
+VARIANTS = {
+    'launcher': 'ic_launcher.png',
+    'adaptive': None,
+}
+DEFAULT_VARIANTS = ('adaptive',)
+
+# Android icon densities and their sizes
+ANDROID_DENSITIES = {
+    'mipmap-mdpi': 48,
+    'mipmap-hdpi': 72,
+    'mipmap-xhdpi': 96,
+    'mipmap-xxhdpi': 144,
+    'mipmap-xxxhdpi': 192
+}
+
+ANDROID_RES_PATH = "android/app/src/main/res"
+
+# The generator whose icons ship in the app when a build writes into a res/ directory
+DEFAULT_GENERATOR = 'exact'
+
+# The master is rendered at this multiple of the largest requested size
+SUPERSAMPLE = 4
+
+ADAPTIVE_DIR = "mipmap-anydpi-v26"
+
+# Adaptive layers are 108dp squares whose central 72dp shows through the
+# launcher mask; legacy icons are 48dp
+ADAPTIVE_SCALE = 108 / 48
+VISIBLE_SCALE = 72 / 48
+
+# Output file -> whether it is drawn on the 108dp adaptive canvas
+ADAPTIVE_FILES = {
+    'ic_launcher.png': False,
+    'ic_launcher_round.png': False,
+    'ic_launcher_foreground.png': True,
+    'ic_launcher_background.png': True,
+    'ic_launcher_monochrome.png': True,
+}
+ADAPTIVE_XML_FILES = ('ic_launcher.xml', 'ic_launcher_round.xml')
+
+# density is None for master jobs, which resample one render to every density
+BuildJob = namedtuple('BuildJob', 'generator density variant master_size')
+
+def load_renderer(generator):
+    """Import a generator module and return its render(size) function"""
+    module_name, function_name, _ = GENERATORS[generator]
+    return getattr(importlib.import_module(module_name), function_name)
+
+def load_adaptive_renderers(generator):
+    """Return a generator's (background, foreground) render functions"""
+    module = importlib.import_module(GENERATORS[generator][0])
+    return tuple(getattr(module, name) for name in ADAPTIVE_RENDERERS[generator])
+
+def load_layers(generator):
+    """Return a generator's layers(size, theme=None) declaration function"""
+    module = importlib.import_module(GENERATORS[generator][0])
+    return getattr(module, LAYER_FUNCTIONS[generator])
+
+def master_size_for(sizes, master_size=None):
+    """Pick the master resolution for a set of target sizes"""
+    if master_size is not None:
+        return master_size
+    return SUPERSAMPLE * max(sizes)
+
+def adaptive_size(size):
+    """Pixel size of the adaptive canvas for a legacy icon size"""
+    return round(size * ADAPTIVE_SCALE)
+
+def adaptive_outputs(densities=ANDROID_DENSITIES):
+    """Map every PNG in the adaptive set to its pixel size, by relative path"""
+    outputs = {}
+    for density, size in densities.items():
+        for filename, adaptive in ADAPTIVE_FILES.items():
+            outputs[os.path.join(density, filename)] = adaptive_size(size) if adaptive else size
+    return outputs
+
+def job_outputs(job, densities=ANDROID_DENSITIES):
+    """List the relative paths one build job writes"""
+    if job.variant == 'adaptive':
+        return list(adaptive_outputs(densities)) + [os.path.join(ADAPTIVE_DIR, name)
+                                                    for name in ADAPTIVE_XML_FILES]
+    names = [job.density] if job.density else list(densities)
+    return [os.path.join(density, VARIANTS[job.variant]) for density in names]
+
+def is_resource_dir(path):
+    """Whether a path is an Android res/ directory, where AAPT rejects nested folders"""
+    return os.path.basename(os.path.normpath(path)) == 'res'
+
+def output_root(base_path, generator, generators):
+    """Return the resource directory a generator writes into"""
+    # A single generator writes straight into base_path; several get a folder each
+    if len(generators) == 1:
+        return base_path
+    if is_resource_dir(base_path):
+        raise ValueError(f"{base_path} is an Android res/ directory, which takes exactly one "
+                         f"generator; build several into a staging directory instead")
+    return os.path.join(base_path, generator)
+
+def plan_jobs(generators, variants, densities=ANDROID_DENSITIES, per_density=False, master_size=None):
+    """List the render jobs for a build"""
+    jobs = []
+    for generator in generators:
+        for variant in variants:
+            # Adaptive sets share one background render, so they are never split per density
+            if per_density and variant != 'adaptive':
+                jobs.extend(BuildJob(generator, density, variant, None) for density in densities)
+            else:
+                jobs.append(BuildJob(generator, None, variant,
+                                     master_size_for(densities.values(), master_size)))
+    return jobs
+
+def add_plan_arguments(parser):
+    """Add the options that decide which jobs a build runs and where they write"""
+    parser.add_argument('--generator', action='append', choices=sorted(GENERATORS),
+                        help=f"generator to build (repeatable; default: {DEFAULT_GENERATOR} into a "
+                             f"res/ directory, all into any other --output)")
+    parser.add_argument('--variant', action='append', choices=sorted(VARIANTS),
+                        help="variant to build (repeatable, default: adaptive)")
+    parser.add_argument('--output', default=ANDROID_RES_PATH,
+                        help="resource directory to write into")
+    parser.add_argument('--master-size', type=int, default=None,
+                        help=f"master render size (default: {SUPERSAMPLE}x the largest density)")
+    parser.add_argument('--per-density', action='store_true',
+                        help="render every density natively instead of resampling one master")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="list the jobs and files a build would write, without rendering")
+
+def plan_from_args(parser, args):
+    """Plan the jobs for parsed add_plan_arguments() options"""
+    variants = args.variant or list(DEFAULT_VARIANTS)
+    if 'adaptive' in variants and 'launcher' in variants:
+        parser.error("the adaptive variant already writes the flat ic_launcher.png")
+    generators = sorted(set(args.generator or [])) or sorted(GENERATORS)
+    if is_resource_dir(args.output):
+        # res/ only holds the app's own icon set; the others go to a staging directory
+        if args.generator and len(generators) > 1:
+            parser.error(f"{args.output} is an Android res/ directory and takes one --generator; "
+                         f"pass --output DIR to build several side by side")
+        generators = generators if args.generator else [DEFAULT_GENERATOR]
+    return plan_jobs(generators, variants,
+                     per_density=args.per_density, master_size=args.master_size)
+
+def format_plan(jobs, base_path=ANDROID_RES_PATH, densities=ANDROID_DENSITIES):
+    """Describe each job and the files it would write"""
+    generators = sorted({job.generator for job in jobs})
+    lines = []
+    for job in jobs:
+        root = output_root(base_path, job.generator, generators)
+        density = job.density or f"master@{job.master_size}"
+        lines.append(f"{job.generator:<8} {density:<18} {job.variant}")
+        lines.extend(f"    {os.path.join(root, relative)}" for relative in job_outputs(job, densities))
+    files = sum(len(job_outputs(job, densities)) for job in jobs)
+    lines.append(f"{len(jobs)} job(s), {files} file(s) planned")
+    return "\n".join(lines)
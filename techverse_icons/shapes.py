@@ -0,0 +1,272 @@
+"""
+Anti-Aliased Shape Primitives
+Rasterizes circles, rings, polygons and text to coverage masks from signed
+distance fields, one array pass per shape, and fills them with gradient fields
+"""
+
+from PIL import Image
+from contextlib import contextmanager
+import numpy as np
+
+from techverse_icons.glow import text_mask
+from techverse_icons.gradients import blend_colors
+
+# Theme-independent geometry shared between renders while cached_geometry() is active
+_geometry = None
+
+@contextmanager
+def cached_geometry(store=None):
+    """Reuse distance fields and masks across renders of the same geometry
+    
+    Batch renders pass one long-lived dict per worker; the arrays are
+    read-only, so variants can share them safely.
+    """
+    global _geometry
+    previous, _geometry = _geometry, ({} if store is None else store)
+    try:
+        yield _geometry
+    finally:
+        _geometry = previous
+
+def _memoized(key, compute):
+    """Return compute()'s arrays, from the geometry cache when one is active"""
+    if _geometry is None:
+        return compute()
+    if key not in _geometry:
+        value = compute()
+        for array in (value if isinstance(value, tuple) else (value,)):
+            if isinstance(array, np.ndarray):
+                array.flags.writeable = False
+        _geometry[key] = value
+    return _geometry[key]
+
+def sample_grid(box):
+    """Return (xs, ys) pixel-center coordinates for a box, broadcastable to its shape"""
+    left, top, right, bottom = box
+    ys, xs = np.ogrid[top:bottom, left:right]
+    return xs.astype(np.float32), ys.astype(np.float32)
+
+def circle_sdf(xs, ys, center, radius):
+    """Signed distance to a circle's edge: negative inside"""
+    return np.hypot(xs - center[0], ys - center[1]) - radius
+
+def ring_sdf(xs, ys, center, radius, width):
+    """Signed distance to a ring of the given stroke width centered on radius"""
+    return np.abs(np.hypot(xs - center[0], ys - center[1]) - radius) - width / 2
+
+def polygon_sdf(xs, ys, points):
+    """Signed distance to a convex polygon (exact inside, a tight bound outside)"""
+    points = np.asarray(points, dtype=np.float32)
+    centroid = points.mean(axis=0)
+    sdf = None
+    for a, b in zip(points, np.roll(points, -1, axis=0)):
+        edge = b - a
+        length = np.hypot(*edge)
+        if length == 0:
+            continue
+        normal = np.array([edge[1], -edge[0]]) / length
+        # Point every normal away from the interior, whatever the winding
+        if np.dot(centroid - a, normal) > 0:
+            normal = -normal
+        distance = (xs - a[0]) * normal[0] + (ys - a[1]) * normal[1]
+        sdf = distance if sdf is None else np.maximum(sdf, distance)
+    return sdf
+
+def coverage(sdf):
+    """Turn a signed distance field into 0-1 pixel coverage with a one-pixel ramp"""
+    return np.clip(0.5 - sdf, 0.0, 1.0)
+
+def angular_ratio(xs, ys, center, start=0.0):
+    """0-1 position around center, clockwise on screen from start degrees"""
+    angle = np.degrees(np.arctan2(ys - center[1], xs - center[0])) - start
+    return np.mod(angle, 360.0) / 360.0
+
+def shade(cover, color, colors=None, ratio=None):
+    """Color a coverage mask as straight-alpha RGBA uint8
+    
+    color is (r, g, b, a); when colors and ratio are given the RGB follows the
+    two-color gradient instead and only color's alpha is used.
+    """
+    if colors is not None:
+        pixels = blend_colors(np.broadcast_to(ratio, cover.shape), colors)
+    else:
+        pixels = np.empty(cover.shape + (4,), dtype=np.uint8)
+        pixels[..., :3] = color[:3]
+    alpha = color[3] if len(color) > 3 else 255
+    pixels[..., 3] = np.round(cover * alpha).astype(np.uint8)
+    return pixels
+
+def shape_image(pixels):
+    """Wrap an RGBA array as a writable Pillow image"""
+    return Image.fromarray(pixels, 'RGBA').copy()
+
+def fill_circle(box, center, radius, color):
+    """Anti-aliased filled circle over a box, as an RGBA array"""
+    xs, ys = sample_grid(box)
+    return shade(coverage(circle_sdf(xs, ys, center, radius)), color)
+
+def ring_misses(box, center, radius, width):
+    """Whether a box lies wholly inside a ring's hole or wholly outside it"""
+    left, top, right, bottom = box
+    near = np.hypot(max(left - center[0], 0, center[0] - (right - 1)),
+                    max(top - center[1], 0, center[1] - (bottom - 1)))
+    far = np.hypot(max(abs(left - center[0]), abs(right - 1 - center[0])),
+                   max(abs(top - center[1]), abs(bottom - 1 - center[1])))
+    # Coverage ramps out to half a pixel past the stroke; one more pixel absorbs float32 rounding
+    reach = width / 2 + 1.5
+    return far < radius - reach or near > radius + reach
+
+def ring_geometry(box, center, radius, width, start=0.0):
+    """Coverage and angular position of a ring over a box"""
+    def compute():
+        if ring_misses(box, center, radius, width):
+            # Tiles of a large render mostly fall clear of the stroke
+            empty = np.zeros((box[3] - box[1], box[2] - box[0]), dtype=np.float32)
+            return empty, empty
+        xs, ys = sample_grid(box)
+        return coverage(ring_sdf(xs, ys, center, radius, width)), angular_ratio(xs, ys, center, start)
+    return _memoized(('ring', box, center, radius, width, start), compute)
+
+def stroke_ring(box, center, radius, width, color, colors=None, start=0.0):
+    """Anti-aliased ring over a box, optionally with an angular two-color gradient"""
+    cover, ratio = ring_geometry(box, center, radius, width, start)
+    return shade(cover, color, colors, ratio if colors is not None else None)
+
+def fill_polygon(box, points, color):
+    """Anti-aliased filled convex polygon over a box, as an RGBA array"""
+    xs, ys = sample_grid(box)
+    return shade(coverage(polygon_sdf(xs, ys, points)), color)
+
+def fill_circles(box, centers, radius, color):
+    """Anti-aliased dots of one radius and color over a box
+    
+    Each dot is evaluated only over its own footprint and merged by maximum
+    coverage, so cost grows with the dots' area, not the box's.
+    """
+    left, top, right, bottom = box
+    cover = np.zeros((bottom - top, right - left), dtype=np.float32)
+    reach = int(np.ceil(radius + 1))
+    for cx, cy in centers:
+        footprint = (max(int(cx) - reach, left), max(int(cy) - reach, top),
+                     min(int(cx) + reach + 1, right), min(int(cy) + reach + 1, bottom))
+        if footprint[0] >= footprint[2] or footprint[1] >= footprint[3]:
+            continue
+        xs, ys = sample_grid(footprint)
+        window = cover[footprint[1] - top:footprint[3] - top, footprint[0] - left:footprint[2] - left]
+        np.maximum(window, coverage(circle_sdf(xs, ys, (cx, cy), radius)), out=window)
+    return shade(cover, color)
+
+def polyline_distance(xs, ys, points):
+    """Distance to the nearest segment of a polyline, with that segment's index and position
+    
+    Returns (distance, segment, t) arrays, where t runs 0-1 along the segment;
+    one pass per segment however large the shape is drawn.
+    """
+    points = np.asarray(points, dtype=np.float32)
+    shape = np.broadcast_shapes(xs.shape, ys.shape)
+    distance = np.full(shape, np.inf, dtype=np.float32)
+    segment = np.zeros(shape, dtype=np.int32)
+    position = np.zeros(shape, dtype=np.float32)
+    for index, (a, b) in enumerate(zip(points[:-1], points[1:])):
+        edge = b - a
+        length_sq = float(np.dot(edge, edge)) or 1.0
+        t = np.clip(((xs - a[0]) * edge[0] + (ys - a[1]) * edge[1]) / length_sq, 0.0, 1.0)
+        d = np.hypot(xs - (a[0] + t * edge[0]), ys - (a[1] + t * edge[1]))
+        closer = d < distance
+        distance = np.where(closer, d, distance)
+        segment = np.where(closer, index, segment)
+        position = np.where(closer, t, position)
+    return distance, segment, position
+
+def inside_polygon(xs, ys, points):
+    """Even-odd point-in-polygon test for any simple polygon"""
+    points = np.asarray(points, dtype=np.float32)
+    inside = np.zeros(np.broadcast_shapes(xs.shape, ys.shape), dtype=bool)
+    for a, b in zip(points, np.roll(points, -1, axis=0)):
+        if a[1] == b[1]:
+            continue
+        crosses = (ys < a[1]) != (ys < b[1])
+        x_cross = a[0] + (ys - a[1]) * (b[0] - a[0]) / (b[1] - a[1])
+        inside ^= crosses & (xs < x_cross)
+    return inside
+
+PATH_RATIO_MODES = ('length', 'edge', 'vertex')
+
+def path_ratio(segment, t, points, mode='length'):
+    """Gradient position along a polyline from polyline_distance's segment and t
+    
+    'length' runs the ramp once along the path's total length, 'edge'
+    restarts it on every edge, and 'vertex' spaces the vertices evenly along
+    it, for ramps whose stops sit on the vertices whatever the edge lengths.
+    """
+    if mode not in PATH_RATIO_MODES:
+        raise ValueError(f"Unknown path ratio mode: {mode!r} (expected one of {PATH_RATIO_MODES})")
+    if mode == 'edge':
+        return t
+    if mode == 'vertex':
+        return (segment + t) / max(len(points) - 1, 1)
+    points = np.asarray(points, dtype=np.float32)
+    lengths = np.hypot(*np.diff(points, axis=0).T)
+    starts = np.concatenate([[0.0], np.cumsum(lengths)[:-1]])
+    total = float(lengths.sum()) or 1.0
+    return (starts[segment] + t * lengths[segment]) / total
+
+def baseline_ratio(xs, start, end):
+    """Gradient position along a text baseline from x=start to x=end"""
+    return np.clip((xs - start) / max(end - start, 1e-6), 0.0, 1.0)
+
+def outline_geometry(box, points):
+    """Outline distance, nearest segment, position along it and inside test for a polygon"""
+    def compute():
+        xs, ys = sample_grid(box)
+        distance, segment, t = polyline_distance(xs, ys, points)
+        return distance, segment, t, inside_polygon(xs, ys, points)
+    return _memoized(('outline', box, tuple(map(tuple, points))), compute)
+
+def text_coverage(box, text, font, position):
+    """Rasterize a whole string once into 0-1 coverage over a box"""
+    return _memoized(('text', box, text, id(font), tuple(position)),
+                     lambda: _text_coverage(box, text, font, position))
+
+def _text_coverage(box, text, font, position):
+    left, top, right, bottom = box
+    cover = np.zeros((bottom - top, right - left), dtype=np.float32)
+    mask, origin = text_mask(text, font, position)
+    
+    # Place the tight mask in the box, clipping whatever falls outside
+    x, y = int(origin[0]) - left, int(origin[1]) - top
+    src = np.asarray(mask, dtype=np.float32) / 255
+    x0, y0 = max(x, 0), max(y, 0)
+    x1, y1 = min(x + src.shape[1], cover.shape[1]), min(y + src.shape[0], cover.shape[0])
+    if x0 < x1 and y0 < y1:
+        cover[y0:y1, x0:x1] = src[y0 - y:y1 - y, x0 - x:x1 - x]
+    return cover
+
+def gradient_fill(cover, colors, ratio, alpha=255):
+    """Fill a coverage mask with a two-color gradient field, as straight-alpha RGBA"""
+    return shade(cover, (0, 0, 0, alpha), colors, ratio)
+
+def paste_over(under, over, cover):
+    """Paste an RGBA array over another through coverage, like ImageDraw's fills"""
+    weight = cover[..., None]
+    mixed = over.astype(np.float32) * weight + under.astype(np.float32) * (1 - weight)
+    return np.round(mixed).astype(np.uint8)
+
+def signed_distance(distance, inside):
+    """Sign an unsigned outline distance: negative inside the shape"""
+    return np.where(inside, -distance, distance)
+
+def shift_coverage(cover, dx, dy):
+    """Offset a coverage mask by whole pixels, filling the exposed edge with zero"""
+    shifted = np.zeros_like(cover)
+    height, width = cover.shape
+    shifted[max(dy, 0):height + min(dy, 0), max(dx, 0):width + min(dx, 0)] = \
+        cover[max(-dy, 0):height - max(dy, 0), max(-dx, 0):width - max(dx, 0)]
+    return shifted
+
+def stack_coverage(layers):
+    """Combine (coverage, opacity) pairs bottom to top the way successive fills paste"""
+    total = None
+    for cover, opacity in layers:
+        total = cover * opacity if total is None else cover * opacity + total * (1 - cover)
+    return total
@@ -0,0 +1,69 @@
+"""
+Seeded Star Field
+Generates scattered dots (stars/data points) reproducibly from an explicit seed
+and rasterizes all of them in a single array pass
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+
+from PIL import Image, ImageDraw
+import numpy as np
+
+DEFAULT_STAR_SEED = 2024
+
+# Blue data points and faint white stars
+STAR_COLORS = np.array([(100, 150, 255, 150), (255, 255, 255, 100)], dtype=np.uint8)
+
+StarField = namedtuple('StarField', 'x y radius color')
+
+def generate_star_field(size, count, seed=DEFAULT_STAR_SEED, max_radius=3):
+    """Compute every dot's position, radius and color index in one batch"""
+    # PCG64 streams are identical across runs, processes and machines for a given seed
+    rng = np.random.default_rng(seed)
+    return StarField(
+        x=rng.integers(0, size, count),
+        y=rng.integers(0, size, count),
+        radius=rng.integers(1, max_radius + 1, count),
+        color=rng.integers(0, len(STAR_COLORS), count),
+    )
+
+@lru_cache(maxsize=None)
+def disc_offsets(radius):
+    """Return the (dy, dx) pixel offsets Pillow fills for an ellipse of this radius"""
+    stencil = Image.new('L', (2 * radius + 1, 2 * radius + 1), 0)
+    ImageDraw.Draw(stencil).ellipse([0, 0, 2 * radius, 2 * radius], fill=255)
+    dy, dx = np.nonzero(np.asarray(stencil))
+    return dy - radius, dx - radius
+
+def rasterize_star_field(size, stars, box=None):
+    """Rasterize a star field onto a transparent RGBA layer in one scatter
+    
+    With a box, only the part of the size x size field inside it is rasterized.
+    """
+    left, top, right, bottom = box or (0, 0, size, size)
+    width, height = right - left, bottom - top
+    index_parts, pos_parts = [], []
+    for radius in np.unique(stars.radius):
+        members = np.flatnonzero(stars.radius == radius)
+        dy, dx = disc_offsets(int(radius))
+        ys = stars.y[members, None] + dy - top
+        xs = stars.x[members, None] + dx - left
+        inside = (ys >= 0) & (ys < height) & (xs >= 0) & (xs < width)
+        index_parts.append(np.broadcast_to(members[:, None], ys.shape)[inside])
+        pos_parts.append((ys * width + xs)[inside])
+    
+    layer = np.zeros((width * height, 4), dtype=np.uint8)
+    if index_parts:
+        index = np.concatenate(index_parts)
+        pos = np.concatenate(pos_parts)
+        # Later dots paint over earlier ones, as sequential drawing would
+        order = np.argsort(index, kind='stable')[::-1]
+        pos, first = np.unique(pos[order], return_index=True)
+        layer[pos] = STAR_COLORS[stars.color[index[order][first]]]
+    
+    return Image.fromarray(layer.reshape(height, width, 4), 'RGBA')
+
+def create_star_field(size, count, seed=DEFAULT_STAR_SEED, max_radius=3, box=None):
+    """Create a reproducible star field layer, or the part of one inside box"""
+    return rasterize_star_field(size, generate_star_field(size, count, seed, max_radius), box)
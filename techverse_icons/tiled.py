@@ -0,0 +1,231 @@
+"""
+Tiled Large-Format Rendering
+Renders print-scale icons (4096-8192 px and beyond) one tile at a time in
+worker processes and streams each finished band of rows straight into a PNG,
+so memory is bounded by the tile size and one layer budget shared by all the
+workers rather than the canvas
+"""
+
+from PIL import Image
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import json
+import math
+import os
+import struct
+import sys
+import time
+import zlib
+
+import numpy as np
+
+from techverse_icons.api import load_theme
+from techverse_icons.cache import atomic_output
+from techverse_icons.fonts import configure_font_search_path
+from techverse_icons.layers import clip_box, compose_region, paint_layer
+from techverse_icons.registry import GENERATORS, load_layers
+
+DEFAULT_SIZE = 4096
+DEFAULT_TILE = 1024
+DEFAULT_COMPRESS_LEVEL = 6
+# Megabytes all workers together may hold in layers painted whole rather than tile by tile
+DEFAULT_LAYER_BUDGET = 256
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# Layer stack a worker declared last, keyed on (generator, size, theme, budget)
+_worker_layers = {}
+
+def png_chunk(kind, data):
+    """Frame one PNG chunk: length, type, data and CRC"""
+    crc = zlib.crc32(data, zlib.crc32(kind))
+    return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', crc)
+
+def filter_rows(rows, previous=None):
+    """Apply PNG filtering to RGBA scanlines, returning the bytes to compress
+    
+    rows is a (count, width, 4) uint8 array and previous the scanline above
+    it, or None at the top of the image. Pillow's PNG encoder picks each
+    row's filter in C with libpng's minimum-sum heuristic, so the rows are
+    encoded uncompressed and inflated back; previous goes first so the top
+    row is filtered against it, then its own line is dropped.
+    """
+    if previous is not None:
+        rows = np.concatenate([previous[None], rows])
+    stream = Image.fromarray(np.ascontiguousarray(rows), 'RGBA').tobytes('zip', 'RGBA', False, 0)
+    filtered = zlib.decompress(stream)
+    if previous is None:
+        return filtered
+    return filtered[rows.shape[1] * 4 + 1:]
+
+class PngStreamWriter:
+    """Write an 8-bit RGBA PNG band by band, holding only the current band"""
+    
+    def __init__(self, f, width, height, compress_level=DEFAULT_COMPRESS_LEVEL):
+        self.f = f
+        self.width = width
+        self.height = height
+        self.rows = 0
+        self.previous = None
+        self.compressor = zlib.compressobj(compress_level)
+        header = struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)
+        f.write(PNG_SIGNATURE + png_chunk(b'IHDR', header))
+    
+    def write(self, band):
+        """Append a (rows, width, 4) uint8 band below the rows written so far"""
+        rows = np.asarray(band, dtype=np.uint8).reshape(len(band), self.width, 4)
+        self._idat(self.compressor.compress(filter_rows(rows, self.previous)))
+        self.previous = rows[-1].copy()
+        self.rows += len(rows)
+    
+    def close(self):
+        """Flush the compressed stream and end the file"""
+        if self.rows != self.height:
+            raise ValueError(f"PNG declares {self.height} rows but {self.rows} were written")
+        self._idat(self.compressor.flush())
+        self.f.write(png_chunk(b'IEND', b''))
+    
+    def _idat(self, data):
+        if data:
+            self.f.write(png_chunk(b'IDAT', data))
+
+def tile_rows(size, tile):
+    """Split a size x size canvas into rows of tile x tile boxes, top to bottom"""
+    return [[(left, top, min(left + tile, size), min(top + tile, size))
+             for left in range(0, size, tile)]
+            for top in range(0, size, tile)]
+
+def patch_bytes(item, size):
+    """Memory a layer's patch takes when painted over its whole box"""
+    box = clip_box(item.bbox, size)
+    return 0 if box is None else (box[2] - box[0]) * (box[3] - box[1]) * 4
+
+def painted_once(item, size):
+    """Wrap a layer so it is painted over its whole box once and cropped for each tile"""
+    bounds = clip_box(item.bbox, size)
+    painted = {}
+    
+    def paint(canvas):
+        if 'patch' not in painted:
+            painted['patch'] = paint_layer(item, bounds)
+        box = canvas.box
+        return painted['patch'].crop((box[0] - bounds[0], box[1] - bounds[1],
+                                      box[2] - bounds[0], box[3] - bounds[1]))
+    return item._replace(paint=paint, halo=0)
+
+def budget_layers(layers, size, budget):
+    """Paint as many layers whole as budget bytes allow, the rest tile by tile
+    
+    Tiles repaint a halo layer's overlap and retrace shapes Pillow draws in
+    full however little of them shows, so those cost more than one whole
+    patch. Halo layers come first, then the smallest patches.
+    """
+    whole = set()
+    for index in sorted(range(len(layers)),
+                        key=lambda i: (layers[i].halo == 0, patch_bytes(layers[i], size))):
+        cost = patch_bytes(layers[index], size)
+        if cost <= budget:
+            whole.add(index)
+            budget -= cost
+    return [painted_once(item, size) if index in whole else item for index, item in enumerate(layers)]
+
+def worker_budget(layer_budget, workers):
+    """Bytes of whole layers one worker may hold, so all of them stay within layer_budget MB"""
+    return (layer_budget << 20) // workers
+
+def render_tile(generator, size, region, theme=None, budget=0):
+    """Composite one tile of a generator's icon in a worker, as an RGBA array
+    
+    budget is the bytes this worker may hold in layers painted whole.
+    """
+    key = (generator, size, json.dumps(theme, sort_keys=True), budget)
+    if key not in _worker_layers:
+        _worker_layers.clear()
+        layers = load_layers(generator)(size, theme=theme)
+        _worker_layers[key] = budget_layers(layers, size, budget)
+    return np.asarray(compose_region(size, _worker_layers[key], region))
+
+def render_bands(generator, size, tile=DEFAULT_TILE, theme=None, workers=None,
+                 layer_budget=DEFAULT_LAYER_BUDGET):
+    """Render an icon in bands of tile rows, yielding (rows, size, 4) arrays top to bottom
+    
+    Tiles render in parallel, but only enough bands to keep every worker busy
+    are in flight, so memory stays flat however large the canvas is.
+    layer_budget is the megabytes the workers may spend between them on
+    layers painted whole once instead of once per tile.
+    """
+    rows = tile_rows(size, tile)
+    workers = workers or os.cpu_count()
+    budget = worker_budget(layer_budget, workers)
+    if workers == 1:
+        for row in rows:
+            yield np.concatenate([render_tile(generator, size, box, theme, budget) for box in row], axis=1)
+        return
+    
+    ahead = max(2, math.ceil(2 * workers / len(rows[0])))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for row in rows:
+            pending.append([pool.submit(render_tile, generator, size, box, theme, budget) for box in row])
+            if len(pending) >= ahead:
+                yield np.concatenate([future.result() for future in pending.popleft()], axis=1)
+        while pending:
+            yield np.concatenate([future.result() for future in pending.popleft()], axis=1)
+
+def render_tiled(generator, output, size=DEFAULT_SIZE, tile=DEFAULT_TILE, theme=None, workers=None,
+                 compress_level=DEFAULT_COMPRESS_LEVEL, layer_budget=DEFAULT_LAYER_BUDGET):
+    """Render an icon tile by tile straight into a PNG file; returns its size in bytes"""
+    with atomic_output(output) as f:
+        writer = PngStreamWriter(f, size, size, compress_level)
+        for band in render_bands(generator, size, tile, theme, workers, layer_budget):
+            writer.write(band)
+        writer.close()
+    return os.path.getsize(output)
+
+def main(argv=None):
+    """Render one large icon tile by tile into a PNG file"""
+    parser = argparse.ArgumentParser(description="Render a print-scale TechVerse icon in tiles, "
+                                                 "streaming it to PNG with bounded memory")
+    parser.add_argument('generator', choices=sorted(GENERATORS),
+                        help="generator to render")
+    parser.add_argument('--size', type=int, default=DEFAULT_SIZE,
+                        help=f"icon size in pixels (default: {DEFAULT_SIZE})")
+    parser.add_argument('--tile', type=int, default=DEFAULT_TILE,
+                        help=f"tile edge in pixels; memory grows with it (default: {DEFAULT_TILE})")
+    parser.add_argument('--theme', metavar='FILE',
+                        help="JSON object overriding any of the generator's DEFAULT_THEME keys")
+    parser.add_argument('--output', metavar='FILE',
+                        help="PNG file to write (default: GENERATOR-SIZE.png)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                        help="number of tile worker processes (default: CPU count)")
+    parser.add_argument('--compress-level', type=int, default=DEFAULT_COMPRESS_LEVEL, choices=range(10),
+                        metavar='0-9', help=f"zlib level (default: {DEFAULT_COMPRESS_LEVEL})")
+    parser.add_argument('--layer-budget', type=int, default=DEFAULT_LAYER_BUDGET, metavar='MB',
+                        help="memory shared by all workers for layers painted whole instead of "
+                             f"per tile; 0 tiles every layer (default: {DEFAULT_LAYER_BUDGET})")
+    parser.add_argument('--font-dir', action='append', default=[], metavar='DIR',
+                        help="search this directory for fonts first (repeatable)")
+    args = parser.parse_args(argv)
+    if args.size < 1 or args.tile < 1:
+        parser.error("--size and --tile must be positive")
+    if args.layer_budget < 0:
+        parser.error("--layer-budget must not be negative")
+    
+    configure_font_search_path(args.font_dir)
+    try:
+        theme = load_theme(args.generator, args.theme) if args.theme else None
+    except ValueError as exc:
+        parser.error(str(exc))
+    output = args.output or f"{args.generator}-{args.size}.png"
+    
+    start = time.perf_counter()
+    written = render_tiled(args.generator, output, args.size, args.tile, theme, args.workers,
+                           args.compress_level, args.layer_budget)
+    tiles = len(tile_rows(args.size, args.tile)) ** 2
+    print(f"Rendered {GENERATORS[args.generator][2]} icon: {output} ({args.size}x{args.size} "
+          f"in {tiles} tiles, {written} bytes, {time.perf_counter() - start:.1f} s)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
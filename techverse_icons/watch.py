@@ -0,0 +1,278 @@
+"""
+Watch Mode
+Keeps one generator loaded with its fonts, geometry and painted layers warm,
+polls a theme file and the generator source, and re-renders only the layers
+and output files a change affects
+"""
+
+from PIL import Image
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import argparse
+import hashlib
+import importlib
+import os
+import sys
+import time
+import traceback
+
+from techverse_icons.adaptive import ADAPTIVE_ICON_XML, render_adaptive_masters
+from techverse_icons.api import load_theme
+from techverse_icons.cache import PACKAGE_DIR, write_if_changed
+from techverse_icons.encode import DEFAULT_TOLERANCE, encode_png, encode_smallest
+from techverse_icons.fonts import configure_font_search_path
+from techverse_icons.layers import cached_layers
+from techverse_icons.pipeline import downsample
+from techverse_icons.registry import (
+    ADAPTIVE_DIR, ADAPTIVE_RENDERERS, ADAPTIVE_XML_FILES, ANDROID_DENSITIES, GENERATORS, SUPERSAMPLE,
+    VARIANTS, adaptive_outputs, master_size_for
+)
+from techverse_icons.shapes import cached_geometry
+
+DEFAULT_INTERVAL = 0.1
+DEFAULT_OUTPUT = 'preview'
+# Previews resample as Image.thumbnail does, shrinking by whole factors before
+# the Lanczos pass; build resamples the final icons exactly
+PREVIEW_REDUCING_GAP = 2.0
+
+def image_digest(img):
+    """Fingerprint an image's pixels"""
+    # SHA-256 has hardware support on most CPUs, several times BLAKE2's speed here
+    return hashlib.sha256(img.tobytes()).digest()
+
+def snapshot(paths):
+    """Map each path to its (mtime, size), or None while it does not exist"""
+    stamps = {}
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            stamps[path] = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            stamps[path] = None
+    return stamps
+
+def package_sources():
+    """Every techverse_icons source file, whose edits need a fresh process"""
+    return sorted(os.path.join(PACKAGE_DIR, name) for name in os.listdir(PACKAGE_DIR)
+                  if name.endswith('.py'))
+
+class IconWatcher:
+    """One generator's icon set, re-rendered incrementally as its inputs change"""
+    
+    def __init__(self, generator, variant='adaptive', root=DEFAULT_OUTPUT, theme_path=None,
+                 densities=ANDROID_DENSITIES, master_size=None, optimize=False,
+                 tolerance=DEFAULT_TOLERANCE, workers=None):
+        self.generator = generator
+        self.variant = variant
+        self.root = root
+        self.theme_path = theme_path
+        self.densities = densities
+        self.master_size = master_size_for(densities.values(), master_size)
+        self.optimize = optimize
+        self.tolerance = tolerance
+        self.workers = workers or os.cpu_count()
+    
+        self.module = importlib.import_module(GENERATORS[generator][0])
+        self.theme = None
+        self.layers = {}
+        self.geometry = {}
+        # (image digest, size) -> downsampled image, so unchanged layer sets are not resampled
+        self.resampled = {}
+        # Relative output path -> (source master digest, encoded bytes)
+        self.outputs = {}
+    
+    def reload_generator(self):
+        """Re-import the generator module; only layers whose code changed re-paint"""
+        self.module = importlib.reload(self.module)
+        # Edited geometry leaves its old entries unreachable, so start the store afresh
+        self.geometry = {}
+    
+    def reload_theme(self):
+        """Re-read the theme file; an invalid one raises and leaves the current theme in place"""
+        if self.theme_path is None or not os.path.exists(self.theme_path):
+            self.theme = None
+            return
+        self.theme = load_theme(self.generator, self.theme_path)
+    
+    def renderer(self, name):
+        """A render(size) function from the current module, with the theme applied"""
+        return partial(getattr(self.module, name), theme=self.theme)
+    
+    def render_masters(self):
+        """Render the master images and map each output path to (master name, size)"""
+        if self.variant == 'adaptive':
+            background, foreground = (self.renderer(name) for name in ADAPTIVE_RENDERERS[self.generator])
+            resampled = {}
+    
+            def resample(img, size):
+                key = (image_digest(img), size)
+                if key not in resampled:
+                    previous = self.resampled.get(key)
+                    resampled[key] = downsample(img, size) if previous is None else previous
+                return resampled[key].copy()
+    
+            masters = render_adaptive_masters(background, foreground, self.master_size, resample)
+            self.resampled = resampled
+            sources = {path: (os.path.basename(path), size)
+                       for path, size in adaptive_outputs(self.densities).items()}
+        else:
+            filename = VARIANTS[self.variant]
+            masters = {filename: self.renderer(GENERATORS[self.generator][1])(self.master_size)}
+            sources = {os.path.join(density, filename): (filename, size)
+                       for density, size in self.densities.items()}
+        return masters, sources
+    
+    def encode(self, premultiplied, size):
+        """Resample a premultiplied ('RGBa') master to one output size and encode it"""
+        img = premultiplied.resize((size, size), Image.LANCZOS, reducing_gap=PREVIEW_REDUCING_GAP)
+        img = img.convert('RGBA')
+        if self.optimize:
+            return encode_smallest(img, self.tolerance).data
+        return encode_png(img)
+    
+    def render(self):
+        """Render the set and write the files that changed; returns their paths"""
+        layers = {}
+        with cached_layers(layers, self.layers), cached_geometry(self.geometry):
+            masters, sources = self.render_masters()
+        # Patches no render asked for this round belong to superseded code or themes
+        self.layers = layers
+    
+        # Pillow resamples, zlib and hashlib release the GIL, so threads share the work
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            digests = dict(zip(masters, pool.map(image_digest, masters.values())))
+            stale = {path: source for path, source in sources.items()
+                     if self.outputs.get(path, (None,))[0] != digests[source[0]]}
+            # Image.resize premultiplies alpha on every call; do it once for all of a master's sizes
+            names = sorted({name for name, _ in stale.values()})
+            premultiplied = dict(zip(names, pool.map(lambda name: masters[name].convert('RGBa'), names)))
+            pending = {path: pool.submit(self.encode, premultiplied[name], size)
+                       for path, (name, size) in stale.items()}
+            for path, future in pending.items():
+                self.outputs[path] = (digests[sources[path][0]], future.result())
+        encoded = {path: self.outputs[path][1] for path in sources}
+    
+        if self.variant == 'adaptive':
+            for name in ADAPTIVE_XML_FILES:
+                encoded[os.path.join(ADAPTIVE_DIR, name)] = ADAPTIVE_ICON_XML.encode()
+    
+        written = []
+        for relative, data in encoded.items():
+            path = os.path.join(self.root, relative)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            if write_if_changed(path, data):
+                written.append(path)
+        return written
+    
+    def watched(self):
+        """Every file whose change triggers work, grouped by what it invalidates"""
+        return {
+            'theme': [self.theme_path] if self.theme_path else [],
+            'generator': [self.module.__file__],
+            'package': package_sources(),
+        }
+
+def restart():
+    """Replace the process with a fresh watcher so package edits take full effect"""
+    print("techverse_icons changed; restarting", flush=True)
+    os.execv(sys.executable, sys.orig_argv)
+
+def run_round(watcher, label):
+    """Render once, report what changed, and keep watching on errors"""
+    start = time.perf_counter()
+    try:
+        written = watcher.render()
+    except Exception:
+        traceback.print_exc()
+        return
+    
+    elapsed = (time.perf_counter() - start) * 1000
+    for path in written:
+        print(f"Updated {label} icon: {path}")
+    print(f"{len(written)} file(s) updated in {elapsed:.0f} ms", flush=True)
+
+def watch(watcher, interval=DEFAULT_INTERVAL, once=False):
+    """Render, then poll the watched files and re-render after each change"""
+    label = GENERATORS[watcher.generator][2]
+    try:
+        watcher.reload_theme()
+    except (OSError, ValueError) as exc:
+        print(f"Ignoring theme {watcher.theme_path}: {exc}", file=sys.stderr)
+    run_round(watcher, label)
+    if once:
+        return
+    
+    groups = watcher.watched()
+    stamps = {group: snapshot(paths) for group, paths in groups.items()}
+    print(f"Watching {sum(len(paths) for paths in groups.values())} file(s); Ctrl+C to stop", flush=True)
+    while True:
+        time.sleep(interval)
+        current = {group: snapshot(paths) for group, paths in groups.items()}
+        changed = {group for group in groups if current[group] != stamps[group]}
+        if not changed:
+            continue
+    
+        # Editors often save in several writes; wait for the files to settle
+        while True:
+            time.sleep(interval)
+            settled = {group: snapshot(paths) for group, paths in groups.items()}
+            if settled == current:
+                break
+            current = settled
+        stamps = current
+    
+        if 'package' in changed:
+            restart()
+        try:
+            if 'generator' in changed:
+                watcher.reload_generator()
+            if 'theme' in changed:
+                watcher.reload_theme()
+        except (OSError, ValueError, SyntaxError) as exc:
+            print(f"Keeping the last good version: {exc}", file=sys.stderr, flush=True)
+            continue
+        except Exception:
+            traceback.print_exc()
+            continue
+        run_round(watcher, label)
+
+def main(argv=None):
+    """Watch a theme file and the generator source, rebuilding icons on change"""
+    parser = argparse.ArgumentParser(description="Re-render TechVerse icons whenever their inputs change")
+    parser.add_argument('--generator', choices=sorted(GENERATORS), default='exact',
+                        help="generator to watch (default: exact)")
+    parser.add_argument('--variant', choices=sorted(VARIANTS), default='adaptive',
+                        help="variant to write (default: adaptive)")
+    parser.add_argument('--theme', metavar='FILE',
+                        help="JSON object of theme overrides to watch; it may be created later")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT,
+                        help=f"directory to write previews into (default: {DEFAULT_OUTPUT}); "
+                             "build writes the app's icons")
+    parser.add_argument('--master-size', type=int, default=None,
+                        help=f"master render size (default: {SUPERSAMPLE}x the largest density)")
+    parser.add_argument('--interval', type=float, default=DEFAULT_INTERVAL,
+                        help=f"seconds between polls (default: {DEFAULT_INTERVAL})")
+    parser.add_argument('--once', action='store_true',
+                        help="render once and exit instead of watching")
+    parser.add_argument('--font-dir', action='append', default=[], metavar='DIR',
+                        help="search this directory for fonts first (repeatable)")
+    parser.add_argument('--optimize', action='store_true',
+                        help="write the build's smallest PNG encoding (slower per change)")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed RMS error for lossy palette quantization with --optimize")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                        help="number of resample/encode threads (default: CPU count)")
+    args = parser.parse_args(argv)
+    
+    configure_font_search_path(args.font_dir)
+    watcher = IconWatcher(args.generator, args.variant, args.output, args.theme,
+                          master_size=args.master_size, optimize=args.optimize,
+                          tolerance=args.tolerance, workers=args.workers)
+    try:
+        watch(watcher, args.interval, args.once)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
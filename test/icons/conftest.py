@@ -0,0 +1,11 @@
+"""
+Pytest setup for the icon generator tests
+Puts the repository root on sys.path so the generator scripts import as modules
+"""
+
+import os
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
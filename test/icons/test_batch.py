@@ -0,0 +1,96 @@
+"""
+Batch Variant Tests
+Themes and grids are validated and named before rendering, archives hold one
+PNG per variant plus the manifest, and contact sheets page their thumbnails.
+"""
+
+import io
+import json
+import tarfile
+import zipfile
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from techverse_icons import batch
+from techverse_icons.pipeline import downsample
+from techverse_icons.registry import load_renderer
+
+DEFAULTS = batch.default_theme('named')
+SIZE = 48
+
+def test_coerce_theme_normalizes_text_and_json():
+    theme = batch.coerce_theme({'glow_color': '#ff8c0096', 'text_color': [1, 2, 3],
+                                'primary_gradient': '#000000:255,255,255'}, DEFAULTS)
+    assert theme == {'glow_color': (255, 140, 0, 150), 'text_color': (1, 2, 3),
+                     'primary_gradient': [(0, 0, 0), (255, 255, 255)]}
+
+@pytest.mark.parametrize('theme', [{'no_such_key': '#000000'}, {'glow_color': '#abc'},
+                                   {'primary_gradient': '#000000'}])
+def test_coerce_theme_rejects_bad_themes(theme):
+    with pytest.raises(ValueError):
+        batch.coerce_theme(theme, DEFAULTS)
+
+def test_iter_variants_crosses_themes_with_grid():
+    themes = [('dark', {'text_color': '#000000'}), ('light', {'text_color': '#ffffff'})]
+    grid = {'glow_color': ['#ff0000', '#00ff00'], 'trim_color': ['#0000ff', '#ffff00', '#00ffff']}
+    variants = list(batch.iter_variants(DEFAULTS, themes, grid))
+    assert len(variants) == 12
+    assert len({name for name, _ in variants}) == 12
+    assert variants[0] == ('dark-0001', {'text_color': (0, 0, 0), 'glow_color': (255, 0, 0),
+                                         'trim_color': (0, 0, 255)})
+    assert variants[-1][0] == 'light-0012'
+
+def test_iter_variants_keeps_theme_names_without_grid():
+    themes = [('dark', {'text_color': '#000000'}), (None, {})]
+    assert [name for name, _ in batch.iter_variants(DEFAULTS, themes)] == ['dark', 'variant-0002']
+
+def test_iter_variants_rejects_duplicate_names():
+    themes = [('dark', {'text_color': '#000000'}), ('dark', {'text_color': '#111111'})]
+    with pytest.raises(ValueError, match='dark'):
+        batch.iter_variants(DEFAULTS, themes)
+
+def test_load_themes_reads_csv(tmp_path):
+    path = tmp_path / 'themes.csv'
+    path.write_text("name,text_color,glow_color\nplain,#000000,\n")
+    assert batch.load_themes(str(path)) == [('plain', {'text_color': '#000000'})]
+
+def expected_icon(theme):
+    return np.asarray(downsample(load_renderer('named')(4 * SIZE, theme=theme), SIZE))
+
+@pytest.mark.parametrize('suffix', ['.zip', '.tar', '.tar.gz'])
+def test_archive_holds_every_variant(tmp_path, suffix):
+    output = str(tmp_path / f'variants{suffix}')
+    grid = {'glow_color': ['#ff0000', '#00ff00']}
+    count = batch.run_batch('named', output, grid=grid, size=SIZE, workers=1)
+    assert count == 2
+    
+    if suffix == '.zip':
+        with zipfile.ZipFile(output) as archive:
+            members = {name: archive.read(name) for name in archive.namelist()}
+    else:
+        with tarfile.open(output) as archive:
+            members = {info.name: archive.extractfile(info).read() for info in archive.getmembers()}
+    assert sorted(members) == ['themes.json', 'variant-0001.png', 'variant-0002.png']
+    manifest = json.loads(members['themes.json'])
+    assert manifest['variant-0002'] == {'glow_color': [0, 255, 0]}
+    
+    theme = batch.coerce_theme(manifest['variant-0002'], DEFAULTS)
+    image = Image.open(io.BytesIO(members['variant-0002.png']))
+    assert np.array_equal(np.asarray(image), expected_icon(theme))
+
+def test_archive_rejects_duplicate_members(tmp_path):
+    results = [('same', {}, b'a'), ('same', {}, b'b')]
+    with pytest.raises(ValueError, match='same'):
+        batch.write_archive(str(tmp_path / 'variants.zip'), results)
+
+def test_contact_sheets_page_thumbnails(tmp_path):
+    output = str(tmp_path / 'sheet.png')
+    grid = {'glow_color': ['#ff0000', '#00ff00', '#0000ff']}
+    count = batch.run_batch('named', output, grid=grid, size=SIZE, workers=1, thumb=32, per_page=2)
+    assert count == 3
+    first, second = (Image.open(tmp_path / name) for name in ('sheet-001.png', 'sheet-002.png'))
+    # Two columns of 40 x 52 cells (thumb, label and margins), one row per page
+    assert first.size == second.size == (80, 52)
+    assert not (tmp_path / 'sheet.png').exists()
@@ -0,0 +1,34 @@
+"""
+Parallel Build Tests
+Spreading jobs across a process pool must write exactly the bytes a serial
+build writes.
+"""
+
+import os
+
+from techverse_icons.build import run_build
+from techverse_icons.registry import plan_jobs
+
+DENSITIES = {'mipmap-mdpi': 48, 'mipmap-hdpi': 72}
+
+def read_tree(root):
+    files = {}
+    for directory, _, names in os.walk(root):
+        for name in names:
+            path = os.path.join(directory, name)
+            with open(path, 'rb') as f:
+                files[os.path.relpath(path, root)] = f.read()
+    return files
+
+def test_pooled_build_matches_serial_build(tmp_path):
+    # Adaptive and launcher sets both write ic_launcher.png, so each generator builds one
+    jobs = (plan_jobs(['exact'], ['launcher'], DENSITIES, per_density=True)
+            + plan_jobs(['named'], ['adaptive'], DENSITIES))
+    serial = run_build(jobs, str(tmp_path / 'serial'), workers=1, densities=DENSITIES)
+    pooled = run_build(jobs, str(tmp_path / 'pooled'), workers=2, densities=DENSITIES)
+    
+    assert [result.job for result in pooled] == jobs
+    assert [len(result.outputs) for result in pooled] == [len(result.outputs) for result in serial]
+    expected = read_tree(tmp_path / 'serial')
+    assert len(expected) == sum(len(result.outputs) for result in serial)
+    assert read_tree(tmp_path / 'pooled') == expected
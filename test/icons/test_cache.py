@@ -0,0 +1,87 @@
+"""
+Render Cache Tests
+Cache keys must change with everything that changes the pixels, eviction must
+drop the least recently used entries, and outputs must keep sensible
+permissions without rewriting unchanged files.
+"""
+
+import importlib.util
+import os
+import stat
+import time
+
+from techverse_icons import cache
+
+def mode_of(path):
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+def test_new_files_follow_the_umask(tmp_path):
+    umask = os.umask(0o022)
+    try:
+        path = tmp_path / 'icon.png'
+        cache.atomic_write(str(path), b'png')
+        assert mode_of(path) == 0o644
+    finally:
+        os.umask(umask)
+
+def test_replaced_files_keep_their_mode(tmp_path):
+    path = tmp_path / 'Contents.json'
+    path.write_bytes(b'{}')
+    path.chmod(0o664)
+    assert cache.write_if_changed(str(path), b'{"images": []}')
+    assert mode_of(path) == 0o664
+
+def load_module(path, source):
+    path.write_text(source)
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def test_key_follows_render_parameters():
+    render = cache.render_key
+    base = cache.render_key(render, size=48, theme={'ramp': [[0, 0, 0], [255, 255, 255]]})
+    assert base == cache.render_key(render, size=48, theme={'ramp': [[0, 0, 0], [255, 255, 255]]})
+    assert base != cache.render_key(render, size=48, theme={'ramp': [[0, 0, 0], [255, 0, 0]]})
+    assert base != cache.render_key(render, size=72, theme={'ramp': [[0, 0, 0], [255, 255, 255]]})
+
+def test_key_follows_font(monkeypatch):
+    before = cache.render_key(cache.render_key, size=48)
+    monkeypatch.setattr(cache, 'font_fingerprint', lambda: 'OtherSans.ttf:1234')
+    assert cache.render_key(cache.render_key, size=48) != before
+
+def test_key_follows_generator_code(tmp_path):
+    path = tmp_path / 'generator.py'
+    module = load_module(path, "def render(size):\n    return size\n")
+    before = cache.render_key(module.render, size=48)
+    load_module(path, "def render(size):\n    return size * 2\n")
+    assert cache.render_key(module.render, size=48) != before
+
+def test_key_follows_library_versions(monkeypatch):
+    before = cache.code_version(cache.render_key)
+    monkeypatch.setattr(cache.PIL, '__version__', '0.0.0')
+    assert cache.code_version(cache.render_key) != before
+
+def test_identical_bytes_leave_file_and_mtime_alone(tmp_path):
+    path = tmp_path / 'icon.png'
+    cache.atomic_write(str(path), b'same bytes')
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+    assert not cache.write_if_changed(str(path), b'same bytes')
+    assert os.stat(path).st_mtime_ns == 1_000_000_000
+    assert cache.write_if_changed(str(path), b'new bytes!')
+    assert path.read_bytes() == b'new bytes!'
+
+def test_eviction_drops_least_recently_used(tmp_path):
+    store = cache.RenderCache(str(tmp_path), max_bytes=250)
+    store.put('aa01', b'a' * 100)
+    store.put('bb02', b'b' * 100)
+    now = time.time_ns()
+    os.utime(store.path_for('aa01'), ns=(now - 2_000_000_000,) * 2)
+    os.utime(store.path_for('bb02'), ns=(now - 1_000_000_000,) * 2)
+    
+    # Reading aa01 makes bb02 the oldest entry
+    assert store.get('aa01') == b'a' * 100
+    store.put('cc03', b'c' * 100)
+    assert store.get('bb02') is None
+    assert store.get('aa01') == b'a' * 100
+    assert store.get('cc03') == b'c' * 100
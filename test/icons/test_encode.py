@@ -0,0 +1,54 @@
+"""
+PNG Encoding Tests
+At the default tolerance the smallest encoding must decode to exactly the
+pixels it was given, whichever representation wins.
+"""
+
+import io
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from techverse_icons import encode
+from techverse_icons.api import render_icon
+
+def decoded(data):
+    return np.asarray(Image.open(io.BytesIO(data)).convert('RGBA'))
+
+def few_colors():
+    """Translucent RGBA with under 256 colors, including hidden color under zero alpha"""
+    pixels = np.zeros((40, 40, 4), dtype=np.uint8)
+    pixels[:20, :, :] = (0, 162, 255, 200)
+    pixels[20:, :20] = (138, 43, 226, 0)
+    pixels[20:, 20:] = (255, 255, 255, 255)
+    return Image.fromarray(pixels, 'RGBA')
+
+def many_colors():
+    """Translucent RGBA with far more than 256 colors"""
+    pixels = np.random.default_rng(0).integers(0, 256, (40, 40, 4), dtype=np.uint8)
+    return Image.fromarray(pixels, 'RGBA')
+
+def opaque():
+    """Fully opaque RGBA, whose alpha channel can be dropped"""
+    pixels = np.random.default_rng(1).integers(0, 256, (40, 40, 4), dtype=np.uint8)
+    pixels[..., 3] = 255
+    return Image.fromarray(pixels, 'RGBA')
+
+@pytest.mark.parametrize('make, representation', [
+    (few_colors, 'P'),
+    (many_colors, 'RGBA'),
+    (opaque, 'RGB'),
+])
+def test_lossless_round_trip(make, representation):
+    img = make()
+    result = encode.encode_smallest(img)
+    assert result.representation == representation
+    assert np.array_equal(decoded(result.data), np.asarray(img))
+    assert len(result.data) <= result.baseline_bytes
+
+@pytest.mark.parametrize('generator', ['exact', 'named'])
+def test_rendered_icons_round_trip(generator):
+    img = render_icon(generator, 48)
+    result = encode.encode_smallest(img)
+    assert np.array_equal(decoded(result.data), np.asarray(img.convert('RGBA')))
@@ -0,0 +1,74 @@
+"""
+Multi-Platform Export Tests
+An export must lay out the same files as the checked-in Flutter project, with
+Contents.json identical to the asset catalogs Xcode reads and every image at
+the size its catalog entry promises.
+"""
+
+import json
+import os
+
+import pytest
+from PIL import Image
+
+from techverse_icons import export
+from techverse_icons.cache import PACKAGE_DIR
+from techverse_icons.registry import load_renderer
+
+REPO_ROOT = os.path.dirname(PACKAGE_DIR)
+PLATFORMS = ('ios', 'macos', 'web', 'windows')
+
+# Directories the export owns, with the files the checked-in project has there
+EXPORTED_DIRS = [export.IOS_APPICONSET, export.MACOS_APPICONSET, 'web/icons', 'windows/runner/resources']
+
+@pytest.fixture(scope='module')
+def exported(tmp_path_factory):
+    root = tmp_path_factory.mktemp('flutter')
+    # A small master keeps the test quick; sizes above it are simply upsampled
+    outputs = export.export_icons(load_renderer('exact'), PLATFORMS, str(root), master_size=192,
+                                  optimize=False, workers=1)
+    return root, outputs
+
+def listing(root, directory):
+    return sorted(os.listdir(os.path.join(root, directory)))
+
+@pytest.mark.parametrize('directory', EXPORTED_DIRS)
+def test_file_set_matches_checked_in_project(exported, directory):
+    root, _ = exported
+    assert listing(root, directory) == listing(REPO_ROOT, directory)
+
+def test_outputs_cover_every_written_file(exported):
+    root, outputs = exported
+    written = sorted(os.path.relpath(os.path.join(directory, name), root)
+                     for directory, _, names in os.walk(root) for name in names)
+    assert sorted(path for path, *_ in outputs) == written
+    assert 'web/favicon.png' in written
+
+@pytest.mark.parametrize('appiconset', [export.IOS_APPICONSET, export.MACOS_APPICONSET])
+def test_contents_json_matches_asset_catalog(exported, appiconset):
+    root, _ = exported
+    relative = os.path.join(appiconset, 'Contents.json')
+    with open(os.path.join(root, relative), 'rb') as f:
+        data = f.read()
+    with open(os.path.join(REPO_ROOT, relative), 'rb') as f:
+        assert data == f.read()
+    
+    for entry in json.loads(data)['images']:
+        points = float(entry['size'].split('x')[0])
+        scale = int(entry['scale'].rstrip('x'))
+        with Image.open(os.path.join(root, appiconset, entry['filename'])) as img:
+            assert img.size == (round(points * scale),) * 2
+            if entry['idiom'] != 'mac':
+                # The App Store rejects iOS icons with an alpha channel
+                assert img.mode == 'RGB'
+
+def test_windows_ico_holds_every_size(exported):
+    root, _ = exported
+    with Image.open(os.path.join(root, 'windows/runner/resources/app_icon.ico')) as ico:
+        assert sorted(ico.info['sizes']) == [(size, size) for size in export.WINDOWS_ICO_SIZES]
+
+def test_second_export_writes_nothing(exported):
+    root, _ = exported
+    outputs = export.export_icons(load_renderer('exact'), PLATFORMS, str(root), master_size=192,
+                                  optimize=False, workers=1)
+    assert not any(written for _, written, _, _ in outputs)
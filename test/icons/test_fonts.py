@@ -0,0 +1,71 @@
+"""
+Font Subsystem Tests
+Missing faces fall back along the preferred names to DejaVu and then to
+Pillow's bundled font, and repeated lookups come from the process caches.
+"""
+
+import os
+import shutil
+
+import pytest
+from PIL import ImageFont
+
+from techverse_icons import fonts
+
+@pytest.fixture
+def search_path(tmp_path, monkeypatch):
+    """Search only a temporary font directory, with the caches cleared around the test"""
+    monkeypatch.setattr(fonts, 'system_font_dirs', lambda: [])
+    monkeypatch.setenv(fonts.FONT_PATH_ENV, str(tmp_path))
+    fonts.clear_font_caches()
+    yield tmp_path
+    fonts.clear_font_caches()
+
+@pytest.fixture(scope='session')
+def dejavu():
+    """The system's DejaVu Sans, found on the real search path"""
+    path = fonts.find_font(('DejaVuSans.ttf',))
+    fonts.clear_font_caches()
+    if path is None:
+        pytest.skip("DejaVuSans.ttf is not installed")
+    return path
+
+def test_missing_name_falls_back_to_dejavu(dejavu, search_path):
+    shutil.copy(dejavu, search_path / 'DejaVuSans.ttf')
+    font = fonts.load_font(24, ('NoSuchFont.ttf',) + fonts.DEFAULT_FONT_NAMES)
+    assert font.path == str(search_path / 'DejaVuSans.ttf')
+    assert font.getname()[0] == 'DejaVu Sans'
+    assert font.size == 24
+
+def test_no_font_found_uses_pillow_default(search_path):
+    assert fonts.find_font(('NoSuchFont.ttf',)) is None
+    font = fonts.load_font(24, ('NoSuchFont.ttf',))
+    assert isinstance(font, ImageFont.FreeTypeFont)
+    assert font.size == 24
+    assert fonts.font_fingerprint(('NoSuchFont.ttf',)) == 'pillow-default'
+
+def test_repeated_lookups_hit_the_cache(search_path, monkeypatch):
+    walks = []
+    real_walk = os.walk
+    
+    def walk(directory):
+        walks.append(directory)
+        return real_walk(directory)
+    
+    monkeypatch.setattr(os, 'walk', walk)
+    first = fonts.load_font(18)
+    assert fonts.load_font(18) is first
+    assert fonts.load_font(19) is not first
+    assert walks == [str(search_path)]
+    assert fonts._load_face.cache_info().hits == 1
+    
+    offsets = fonts.glyph_offsets(first, 'TechVerse')
+    assert fonts.glyph_offsets(first, 'TechVerse') is offsets
+    assert fonts.glyph_offsets.cache_info().hits == 1
+
+def test_configured_directories_come_first(dejavu, search_path, tmp_path_factory):
+    extra = tmp_path_factory.mktemp('extra')
+    shutil.copy(dejavu, extra / 'arial.ttf')
+    fonts.configure_font_search_path([str(extra)])
+    assert fonts.font_search_path()[:2] == [str(extra), str(search_path)]
+    assert fonts.find_font() == str(extra / 'arial.ttf')
@@ -0,0 +1,77 @@
+"""
+Golden-Image Regression Tests
+Every generator/variant/density is rendered once, in parallel, and compared
+with its reference in test/icons/golden; failing images leave a heatmap in
+test/icons/failures. Refresh the references with
+`python -m techverse_icons golden --update` after an intended change.
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from techverse_icons import golden
+
+CASES = golden.golden_cases()
+IMAGES = [(case, name) for case in CASES for name in golden.case_outputs(case)]
+
+@pytest.fixture(scope='session')
+def results():
+    expected_font = golden.read_manifest().get('font')
+    if expected_font and expected_font != golden.reference_font():
+        pytest.skip(f"references use {expected_font}, this machine renders with "
+                    f"{golden.reference_font()}; set TECHVERSE_FONT_PATH to match")
+    return golden.check_references(CASES, workers=os.cpu_count())
+
+@pytest.mark.parametrize('case, name', IMAGES,
+                         ids=[golden.reference_name(case, name) for case, name in IMAGES])
+def test_matches_reference(results, case, name):
+    problems = results[case][name]
+    assert not problems, "; ".join(problems)
+
+def test_every_rendered_image_is_listed(results):
+    for case in CASES:
+        assert sorted(results[case]) == sorted(golden.case_outputs(case))
+
+def test_identical_images_diff_to_zero():
+    pixels = np.random.default_rng(0).integers(0, 256, (32, 32, 4), dtype=np.uint8)
+    diff = golden.compare(pixels, pixels.copy())
+    assert (diff.max_delta, diff.mean_delta, diff.ssim) == (0.0, 0.0, 1.0)
+    assert not golden.failures(diff)
+
+def test_resampling_noise_is_tolerated():
+    ramp = np.linspace(0, 255, 64)
+    pixels = np.zeros((64, 64, 4), dtype=np.uint8)
+    pixels[..., :3] = ramp[None, :, None]
+    pixels[..., 3] = 255
+    noisy = pixels.copy()
+    noisy[::7, ::5, 0] += 1
+    assert not golden.failures(golden.compare(noisy, pixels))
+
+def test_hidden_color_under_zero_alpha_is_ignored():
+    pixels = np.zeros((16, 16, 4), dtype=np.uint8)
+    recolored = pixels.copy()
+    recolored[..., :3] = 200
+    assert golden.compare(recolored, pixels).max_delta == 0.0
+
+def test_structural_change_fails_and_writes_heatmap(tmp_path):
+    case = golden.GoldenCase('exact', 'themed')
+    name = golden.case_outputs(case)[0]
+    reference = np.zeros((48, 48, 4), dtype=np.uint8)
+    reference[..., 3] = 255
+    path = tmp_path / 'golden' / golden.reference_name(case, name)
+    path.parent.mkdir(parents=True)
+    golden.Image.fromarray(reference, 'RGBA').save(path)
+    
+    moved = reference.copy()
+    moved[10:30, 10:30, :3] = 255
+    problems = golden.check_image(case, name, moved, tmp_path / 'golden', tmp_path / 'diffs')
+    assert any('SSIM' in problem for problem in problems)
+    assert (tmp_path / 'diffs' / golden.reference_name(case, name)).exists()
+
+def test_missing_reference_is_reported(tmp_path):
+    case = golden.GoldenCase('named', 'themed')
+    pixels = np.zeros((8, 8, 4), dtype=np.uint8)
+    problems = golden.check_image(case, 'missing.png', pixels, tmp_path, tmp_path)
+    assert problems and 'no reference' in problems[0]
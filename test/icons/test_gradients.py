@@ -0,0 +1,41 @@
+"""
+Gradient Engine Tests
+The vectorized diagonal gradient must match the original per-pixel loop byte
+for byte.
+"""
+
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+
+from techverse_icons import gradients
+
+PALETTES = [
+    [(139, 69, 19), (255, 140, 0)],
+    [(75, 0, 130), (138, 43, 226)],
+    [(255, 255, 255), (0, 0, 0)],
+]
+
+def per_pixel_gradient(size, colors):
+    """The original generator's loop, kept as the reference"""
+    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    for i in range(size):
+        for j in range(size):
+            ratio = (i + j) / (size * 2)
+            r = int(colors[0][0] * (1 - ratio) + colors[1][0] * ratio)
+            g = int(colors[0][1] * (1 - ratio) + colors[1][1] * ratio)
+            b = int(colors[0][2] * (1 - ratio) + colors[1][2] * ratio)
+            draw.point((i, j), fill=(r, g, b, 255))
+    return img
+
+@pytest.mark.parametrize('size', [1, 48, 97])
+@pytest.mark.parametrize('colors', PALETTES)
+def test_diagonal_matches_per_pixel_loop(size, colors):
+    expected = per_pixel_gradient(size, colors).tobytes()
+    assert gradients.create_gradient_image(size, colors, 'diagonal').tobytes() == expected
+
+def test_diagonal_fast_path_matches_general_ratio():
+    colors = PALETTES[0]
+    general = gradients.blend_colors(gradients.gradient_ratio(64, 'diagonal'), colors)
+    assert np.array_equal(gradients.gradient_array(64, colors, 'diagonal'), general)
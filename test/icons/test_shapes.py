@@ -0,0 +1,36 @@
+"""
+Coverage Shape Tests
+Gradient positions along a polyline must follow the chosen mode: the path's
+total length, each edge on its own, or evenly spaced vertices.
+"""
+
+import numpy as np
+import pytest
+
+from techverse_icons import shapes
+
+# Edges of length 1, 3 and 4
+POINTS = [(0, 0), (1, 0), (1, 3), (5, 3)]
+
+def ratios_at(xs, ys, mode):
+    xs, ys = np.asarray(xs, dtype=np.float32), np.asarray(ys, dtype=np.float32)
+    _, segment, t = shapes.polyline_distance(xs, ys, POINTS)
+    return shapes.path_ratio(segment, t, POINTS, mode)
+
+def test_length_mode_follows_total_length():
+    # The start, the first vertex, halfway up the second edge and the end
+    ratios = ratios_at([0, 1, 1, 5], [0, 0, 1.5, 3], 'length')
+    assert np.allclose(ratios, [0, 1 / 8, 2.5 / 8, 1])
+
+def test_edge_mode_restarts_on_every_edge():
+    ratios = ratios_at([0.5, 1, 3], [0, 1.5, 3], 'edge')
+    assert np.allclose(ratios, [0.5, 0.5, 0.5])
+
+def test_vertex_mode_spaces_vertices_evenly():
+    # Each edge takes a third of the ramp however long it is
+    ratios = ratios_at([0, 0.5, 1, 1, 3, 5], [0, 0, 1.5, 3, 3, 3], 'vertex')
+    assert np.allclose(ratios, [0, 1 / 6, 1 / 2, 2 / 3, 5 / 6, 1])
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError):
+        shapes.path_ratio(np.zeros(1, dtype=np.int32), np.zeros(1), POINTS, 'per-vertex')
@@ -0,0 +1,85 @@
+"""
+Tiled Rendering Tests
+A tiled render must reproduce the whole-canvas render pixel for pixel, halos
+and uneven edge tiles included, and the streamed PNG must decode to it.
+"""
+
+import io
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from techverse_icons import layers as layer_graph, tiled
+from techverse_icons.layers import compose, paint_layer
+from techverse_icons.registry import GENERATORS, load_layers
+
+# A zero budget paints every layer tile by tile, halos included
+BUDGETS = [0, tiled.DEFAULT_LAYER_BUDGET]
+
+@pytest.mark.parametrize('generator', sorted(GENERATORS))
+@pytest.mark.parametrize('layer_budget', BUDGETS)
+def test_tiles_match_whole_render(tmp_path, generator, layer_budget):
+    size = 600
+    expected = np.asarray(compose(size, load_layers(generator)(size)))
+    output = tmp_path / 'tiled.png'
+    tiled.render_tiled(generator, str(output), size, tile=112, workers=1, layer_budget=layer_budget)
+    assert np.array_equal(np.asarray(Image.open(output)), expected)
+
+@pytest.mark.parametrize('layer_budget', BUDGETS)
+def test_tile_edges_cut_through_glow(tmp_path, layer_budget):
+    # Tile edges here run through the letter glow's falloff and the V strokes
+    size = 2048
+    expected = np.asarray(compose(size, load_layers('named')(size)))
+    output = tmp_path / 'tiled.png'
+    tiled.render_tiled('named', str(output), size, tile=256, workers=1, layer_budget=layer_budget)
+    assert np.array_equal(np.asarray(Image.open(output)), expected)
+
+def test_stream_writer_round_trips_bands():
+    pixels = np.random.default_rng(0).integers(0, 256, (150, 37, 4), dtype=np.uint8)
+    buffer = io.BytesIO()
+    writer = tiled.PngStreamWriter(buffer, 37, 150)
+    for top in range(0, 150, 70):
+        writer.write(pixels[top:top + 70])
+    writer.close()
+    assert np.array_equal(np.asarray(Image.open(io.BytesIO(buffer.getvalue()))), pixels)
+
+def test_budget_paints_halo_layers_whole_first():
+    size = 2048
+    layers = load_layers('named')(size)
+    halos = [item for item in layers if item.halo]
+    budget = sum(tiled.patch_bytes(item, size) for item in halos)
+    budgeted = tiled.budget_layers(layers, size, budget)
+    assert [item for item, kept in zip(layers, budgeted) if item is not kept] == halos
+    assert all(item.halo == 0 for item in budgeted)
+    assert tiled.budget_layers(layers, size, 0) == layers
+
+@pytest.mark.parametrize('layer_budget', [0, 1])
+def test_patches_stay_within_tile_and_budget(tmp_path, monkeypatch, layer_budget):
+    size, tile = 1024, 128
+    painted = {'tile': [], 'whole': []}
+    
+    def recorder(kind):
+        def record(item, box):
+            painted[kind].append((box[2] - box[0]) * (box[3] - box[1]) * 4)
+            return paint_layer(item, box)
+        return record
+    
+    monkeypatch.setattr(layer_graph, 'paint_layer', recorder('tile'))
+    monkeypatch.setattr(tiled, 'paint_layer', recorder('whole'))
+    halo = max(item.halo for item in load_layers('named')(size))
+    tiled.render_tiled('named', str(tmp_path / 'tiled.png'), size, tile=tile, workers=1,
+                       layer_budget=layer_budget)
+    assert max(painted['tile']) <= (tile + 2 * halo) ** 2 * 4
+    assert sum(painted['whole']) <= layer_budget << 20
+
+def test_budget_is_shared_by_workers():
+    assert tiled.worker_budget(256, 1) == 256 << 20
+    assert tiled.worker_budget(256, 8) * 8 == 256 << 20
+    assert tiled.worker_budget(0, 4) == 0
+
+def test_stream_writer_rejects_missing_rows():
+    writer = tiled.PngStreamWriter(io.BytesIO(), 4, 4)
+    writer.write(np.zeros((3, 4, 4), dtype=np.uint8))
+    with pytest.raises(ValueError):
+        writer.close()
@@ -0,0 +1,70 @@
+"""
+Watch Mode Tests
+A theme edit goes through the same reload path the watcher polls, rewrites
+only the outputs whose masters changed, and keeps the previews close to the
+exactly resampled build icons.
+"""
+
+import io
+import json
+import os
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from techverse_icons.adaptive import render_adaptive_encoded
+from techverse_icons.registry import load_adaptive_renderers
+from techverse_icons.watch import IconWatcher
+
+DENSITIES = {'mipmap-mdpi': 48, 'mipmap-xxxhdpi': 192}
+
+def watcher_for(tmp_path):
+    theme = tmp_path / 'theme.json'
+    watcher = IconWatcher('exact', root=str(tmp_path / 'res'), theme_path=str(theme),
+                          densities=DENSITIES, workers=1)
+    return watcher, theme
+
+def relative(paths, root):
+    return sorted(os.path.relpath(path, root) for path in paths)
+
+def premultiplied(img):
+    # Fully transparent pixels may keep any color, so compare what shows
+    return np.asarray(img.convert('RGBa'), dtype=int)
+
+def test_theme_edit_rewrites_only_changed_outputs(tmp_path):
+    watcher, theme = watcher_for(tmp_path)
+    watcher.reload_theme()
+    assert len(watcher.render()) == 12
+    assert watcher.render() == []
+    
+    theme.write_text(json.dumps({'background_color': [40, 0, 0]}))
+    watcher.reload_theme()
+    written = relative(watcher.render(), watcher.root)
+    # The foreground and its monochrome silhouette do not involve the background
+    assert written == sorted(f"{density}/ic_launcher{suffix}.png" for density in DENSITIES
+                             for suffix in ('', '_round', '_background'))
+    background = Image.open(os.path.join(watcher.root, 'mipmap-mdpi/ic_launcher_background.png'))
+    assert background.getpixel((0, 0))[:3] == (40, 0, 0)
+
+def test_invalid_theme_keeps_the_last_good_one(tmp_path):
+    watcher, theme = watcher_for(tmp_path)
+    theme.write_text(json.dumps({'background_color': [40, 0, 0]}))
+    watcher.reload_theme()
+    theme.write_text(json.dumps({'no_such_key': [0, 0, 0]}))
+    with pytest.raises(ValueError):
+        watcher.reload_theme()
+    assert watcher.theme == {'background_color': (40, 0, 0)}
+
+def test_previews_stay_close_to_build_output(tmp_path):
+    watcher, _ = watcher_for(tmp_path)
+    watcher.reload_theme()
+    watcher.render()
+    background, foreground = load_adaptive_renderers('exact')
+    built = render_adaptive_encoded(background, foreground, DENSITIES, optimize=False)
+    for path, data in built.items():
+        if not path.endswith('.png'):
+            continue
+        expected = premultiplied(Image.open(io.BytesIO(data)))
+        preview = premultiplied(Image.open(os.path.join(watcher.root, path)))
+        assert np.abs(preview - expected).max() <= 16, path